@@ -0,0 +1,59 @@
+"""Compare peak memory and wall time of gather-everything against async_map.
+
+Usage:
+    uv run python scripts/benchmarks/bench_async_map.py --items=200000 --concurrency=64
+"""
+
+import asyncio
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any
+
+import fire
+
+from project.common.utils.async_utils import async_map, run_async_function_with_semaphore
+
+logger = logging.getLogger(__name__)
+
+
+async def _work(value: int) -> int:
+    await asyncio.sleep(0)
+    return value
+
+
+async def _gather_all(items: int, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(*(run_async_function_with_semaphore(_work, semaphore, i) for i in range(items)))
+    return sum(results)
+
+
+async def _stream(items: int, concurrency: int, *, ordered: bool) -> int:
+    total = 0
+    async for result in async_map(_work, range(items), concurrency=concurrency, ordered=ordered):
+        total += result
+    return total
+
+
+def _measure(label: str, run: Callable[[], Coroutine[Any, Any, int]]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info('%-22s %8.3fs  peak %9.1f MiB', label, elapsed, peak / 1024 / 1024)
+
+
+def main(items: int = 200_000, concurrency: int = 64) -> None:
+    """Report wall time and peak traced memory for each strategy."""
+    logging.basicConfig(level=logging.INFO)
+    _measure('gather + semaphore', partial(_gather_all, items, concurrency))
+    _measure('async_map ordered', partial(_stream, items, concurrency, ordered=True))
+    _measure('async_map unordered', partial(_stream, items, concurrency, ordered=False))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
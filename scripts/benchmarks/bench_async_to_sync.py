@@ -0,0 +1,39 @@
+"""Measure the per-call overhead of async_to_sync_func with and without a persistent loop.
+
+The wrapped coroutine does almost nothing, so the timings are dominated by
+creating and tearing down an event loop (``asyncio.run``) versus handing the
+coroutine to the long-lived background loop.
+
+Usage:
+    uv run python scripts/benchmarks/bench_async_to_sync.py --number=20000
+"""
+
+import asyncio
+import logging
+import timeit
+from functools import partial
+
+import fire
+
+from project.common.utils.async_utils import async_to_sync_func
+
+logger = logging.getLogger(__name__)
+
+
+async def _noop(value: int) -> int:
+    await asyncio.sleep(0)
+    return value
+
+
+def main(number: int = 20_000) -> None:
+    """Report microseconds per call for each mode."""
+    logging.basicConfig(level=logging.INFO)
+    for label, persistent_loop in (('asyncio.run per call', False), ('persistent loop', True)):
+        wrapped = async_to_sync_func(_noop, persistent_loop=persistent_loop)
+        wrapped(0)  # warm up: starts the background loop once
+        seconds = timeit.timeit(partial(wrapped, 1), number=number)
+        logger.info('%-22s %8.1f us per call', label, seconds / number * 1e6)
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
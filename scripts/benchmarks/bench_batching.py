@@ -0,0 +1,89 @@
+"""Compare throughput and tail latency of batched and unbatched AsyncResource calls.
+
+The backend is simulated: every request costs a fixed ``overhead_ms`` (round
+trip, request parsing) plus ``per_item_ms`` for each item it carries, and at
+most ``concurrency`` requests are in flight. Batching amortizes the fixed
+cost over up to ``max_batch_size`` items.
+
+Usage:
+    uv run python scripts/benchmarks/bench_batching.py --items=5000 --concurrency=8
+    uv run python scripts/benchmarks/bench_batching.py --max_batch_size=16 --max_wait_ms=1
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Sequence
+
+import fire
+
+from project.common.utils.async_utils import AsyncResource, BatchingAsyncResource
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchedBackend(BatchingAsyncResource[int, int]):
+    def __init__(
+        self, overhead: float, per_item: float, concurrency: int, max_batch_size: int, max_wait: float
+    ) -> None:
+        super().__init__(max_batch_size=max_batch_size, max_wait=max_wait, concurrency=concurrency)
+        self.overhead = overhead
+        self.per_item = per_item
+
+    async def call_batch(self, items: list[int]) -> Sequence[int]:
+        await asyncio.sleep(self.overhead + self.per_item * len(items))
+        return items
+
+
+class _UnbatchedBackend(AsyncResource[int]):
+    def __init__(self, overhead: float, per_item: float, concurrency: int) -> None:
+        super().__init__(concurrency=concurrency)
+        self.overhead = overhead
+        self.per_item = per_item
+
+    async def call(self, item: int, *_args: object, **_kwargs: object) -> int:
+        await asyncio.sleep(self.overhead + self.per_item)
+        return item
+
+
+async def _run(resource: AsyncResource[int], items: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+
+    async def timed(item: int) -> None:
+        start = time.perf_counter()
+        await resource.task(item)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(item) for item in range(items)))
+    return time.perf_counter() - start, latencies
+
+
+def _report(label: str, items: int, elapsed: float, latencies: list[float]) -> None:
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    logger.info('%-12s %9.0f items/s  p50 %7.1f ms  p99 %7.1f ms', label, items / elapsed,
+                statistics.median(latencies) * 1e3, p99 * 1e3)  # fmt: skip
+
+
+def main(  # noqa: PLR0913
+    items: int = 5000,
+    concurrency: int = 8,
+    *,
+    overhead_ms: float = 2.0,
+    per_item_ms: float = 0.02,
+    max_batch_size: int = 64,
+    max_wait_ms: float = 2.0,
+) -> None:
+    """Report items per second and p50/p99 latency with and without batching."""
+    logging.basicConfig(level=logging.INFO)
+
+    overhead, per_item = overhead_ms / 1e3, per_item_ms / 1e3
+    unbatched = _UnbatchedBackend(overhead, per_item, concurrency)
+    batched = _BatchedBackend(overhead, per_item, concurrency, max_batch_size, max_wait_ms / 1e3)
+    _report('unbatched', items, *asyncio.run(_run(unbatched, items)))
+    _report('batched', items, *asyncio.run(_run(batched, items)))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,74 @@
+"""Compare repeated queries over JSON Lines against its Parquet and Arrow IPC copies.
+
+Usage:
+    uv run python scripts/benchmarks/bench_columnar.py --records=1000000 --repeat=5
+"""
+
+import logging
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import fire
+import polars as pl
+
+from project.common.utils.file.columnar import convert_jsonlines, load_columnar
+from project.common.utils.file.jsonlines import iter_jsonlines, save_as_jsonlines
+
+logger = logging.getLogger(__name__)
+
+
+def _records(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            'id': i,
+            'url': f'https://example.com/articles/{i}',
+            'status': 500 if i % 50 == 0 else 200,
+            'body': 'lorem ipsum dolor sit amet ' * (5 + i % 20),
+            'elapsed_ms': i % 997 * 0.5,
+        }
+        for i in range(count)
+    ]
+
+
+def _query_rows(path: Path) -> pl.DataFrame:
+    """Filter records one by one in Python, then build a DataFrame (the pre-columnar approach)."""
+    rows = [{'url': record['url']} for record in iter_jsonlines(path) if record['status'] == 500]  # noqa: PLR2004
+    return pl.DataFrame(rows)
+
+
+def _time(label: str, repeat: int, query: Callable[[], pl.DataFrame]) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        height = query().height
+    logger.info('%-22s %8.3fs per query  (%d rows)', label, (time.perf_counter() - start) / repeat, height)
+
+
+def main(records: int = 1_000_000, repeat: int = 5) -> None:
+    """Time a filtered projection over each representation of the same data."""
+    logging.basicConfig(level=logging.INFO)
+    predicate = pl.col('status') == 500  # noqa: PLR2004
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = Path(tmp_dir) / 'data.jsonl'
+        save_as_jsonlines(_records(records), source)
+
+        for name in ('data.parquet', 'data.arrow'):
+            start = time.perf_counter()
+            target = convert_jsonlines(source, Path(tmp_dir) / name)
+            logger.info(
+                'convert -> %-12s %8.3fs  (%d -> %d bytes)',
+                name, time.perf_counter() - start, source.stat().st_size, target.stat().st_size,
+            )  # fmt: skip
+
+        _time('jsonl row by row', repeat, lambda: _query_rows(source))
+        _time('jsonl scan_ndjson', repeat, lambda: pl.scan_ndjson(source).filter(predicate).select('url').collect())
+        for name in ('data.parquet', 'data.arrow'):
+            target = Path(tmp_dir) / name
+            _time(name, repeat, partial(load_columnar, target, columns=['url'], predicate=predicate))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,72 @@
+"""Compare compression codecs and levels on speed against size for JSON Lines.
+
+Usage:
+    uv run python scripts/benchmarks/bench_compression.py --records=100000
+"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import fire
+
+from project.common.utils.file.jsonlines import load_jsonlines, save_as_jsonlines
+from project.common.utils.file.stream import WriteOptions
+
+logger = logging.getLogger(__name__)
+
+LEVELS: dict[str, list[int | None]] = {
+    'gz': [1, 6, 9],
+    'xz': [0, 3, 6],
+    'zst': [1, 3, 9, 19],
+}
+
+
+def _records(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            'id': i,
+            'url': f'https://example.com/articles/{i}',
+            'title': f'記事のタイトル {i % 97}',
+            'body': 'lorem ipsum dolor sit amet ' * (5 + i % 20),
+            'score': i * 0.25,
+        }
+        for i in range(count)
+    ]
+
+
+def _measure(records: list[dict[str, object]], path: Path, level: int | None) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    save_as_jsonlines(records, path, write_options=WriteOptions(compression_level=level))
+    write_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_jsonlines(path)
+    read_seconds = time.perf_counter() - start
+    return write_seconds, read_seconds, path.stat().st_size
+
+
+def main(records: int = 100_000) -> None:
+    """Report write time, read time, size and ratio for every codec and level."""
+    logging.basicConfig(level=logging.INFO)
+    data = _records(records)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plain_write, plain_read, plain_size = _measure(data, Path(tmp_dir) / 'data.jsonl', None)
+        logger.info(
+            '%-5s %-5s write %7.3fs  read %7.3fs  %11d bytes  ratio %5.2f',
+            'none', '-', plain_write, plain_read, plain_size, 1.0,
+        )  # fmt: skip
+        for suffix, levels in LEVELS.items():
+            for level in levels:
+                path = Path(tmp_dir) / f'data.jsonl.{suffix}'
+                write_seconds, read_seconds, size = _measure(data, path, level)
+                logger.info(
+                    '%-5s %-5s write %7.3fs  read %7.3fs  %11d bytes  ratio %5.2f',
+                    suffix, level, write_seconds, read_seconds, size, plain_size / size,
+                )  # fmt: skip
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,70 @@
+"""Measure the dispatch overhead of ``load_file`` on tiny files.
+
+Compares the registry (shared handler instances, prebuilt extension table)
+with the previous dispatch, which parsed the suffix with ``pathlib``, rebuilt
+the extension map and instantiated a new handler on every call.
+
+Usage:
+    uv run python scripts/benchmarks/bench_handler_dispatch.py --number=100000
+"""
+
+import logging
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any
+
+import fire
+
+from project.common.utils.file.base import FileHandler
+from project.common.utils.file.compression import strip_compression_suffix
+from project.common.utils.file.factory import FileHandlerFactory, _import_handler_class, get_file_handler
+from project.common.utils.file.io import load_file
+
+logger = logging.getLogger(__name__)
+
+
+def _legacy_get_file_handler(path: str | Path) -> FileHandler:
+    """Resolve a handler the way the factory did before the registry."""
+    suffix = strip_compression_suffix(path).suffix.lstrip('.')
+    extension_map = {
+        'json': 'json',
+        'yaml': 'yaml',
+        'yml': 'yaml',
+        'toml': 'toml',
+        'xml': 'xml',
+        'msgpack': 'msgpack',
+        'mpk': 'msgpack',
+    }
+    format_type = extension_map[suffix.lower()]
+    handler_path = FileHandlerFactory._handlers[format_type]  # noqa: SLF001
+    assert isinstance(handler_path, str)  # noqa: S101
+    return _import_handler_class(handler_path)()
+
+
+def _legacy_load_file(path: str | Path) -> Any:  # noqa: ANN401
+    return _legacy_get_file_handler(path).load(path)
+
+
+def main(number: int = 100_000) -> None:
+    """Report microseconds per call for handler lookup and for a full tiny-file load."""
+    logging.basicConfig(level=logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / 'tiny.json'
+        path.write_text('{"a": 1}', encoding='utf-8')
+        str_path = str(path)
+
+        cases = {
+            'lookup (legacy)': lambda: _legacy_get_file_handler(str_path),
+            'lookup (registry)': lambda: get_file_handler(str_path),
+            'load_file (legacy)': lambda: _legacy_load_file(str_path),
+            'load_file (registry)': lambda: load_file(str_path),
+        }
+        for label, func in cases.items():
+            seconds = timeit.timeit(func, number=number)
+            logger.info('%-22s %8.3f us per call', label, seconds / number * 1e6)
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
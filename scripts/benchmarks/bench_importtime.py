@@ -0,0 +1,71 @@
+"""Measure the import cost of a module with ``python -X importtime`` and guard it against regressions.
+
+The module is imported in a fresh interpreter ``repeat`` times and the best
+cumulative time is reported together with the slowest transitive imports.
+The script exits with status 1 if the time exceeds ``max_ms`` or if any module
+in ``forbid`` was imported.
+
+Usage:
+    uv run python scripts/benchmarks/bench_importtime.py
+    uv run python scripts/benchmarks/bench_importtime.py --module=project.common.utils.file.io --max_ms=80
+"""
+
+import logging
+import re
+import subprocess
+import sys
+
+import fire
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODULE = 'project.common.utils.file.io'
+DEFAULT_FORBIDDEN = ('yaml', 'toml', 'xml.etree.ElementTree', 'msgpack', 'jsonlines', 'multiprocessing')
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every module loaded by ``import module``."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            timings[match.group(4)] = int(match.group(2))
+    return timings
+
+
+def main(
+    module: str = DEFAULT_MODULE,
+    repeat: int = 5,
+    top: int = 10,
+    max_ms: float | None = None,
+    forbid: tuple[str, ...] = DEFAULT_FORBIDDEN,
+) -> None:
+    """Report the best-of-``repeat`` import time of ``module`` and fail on regressions."""
+    logging.basicConfig(level=logging.INFO)
+    runs = [_importtime(module) for _ in range(repeat)]
+    best = min(runs, key=lambda timings: timings[module])
+    total_ms = best[module] / 1000
+
+    logger.info('import %s: %.1f ms (best of %d)', module, total_ms, repeat)
+    for name, micros in sorted(best.items(), key=lambda item: item[1], reverse=True)[1 : top + 1]:
+        logger.info('  %8.1f ms  %s', micros / 1000, name)
+
+    failures = [f'{name} was imported' for name in forbid if name in best]
+    if max_ms is not None and total_ms > max_ms:
+        failures.append(f'{total_ms:.1f} ms exceeds the {max_ms:.1f} ms budget')
+    for failure in failures:
+        logger.error('Regression: %s', failure)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
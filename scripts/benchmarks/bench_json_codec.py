@@ -0,0 +1,69 @@
+"""Compare encode/decode speed of the installed JSON codec backends.
+
+Usage:
+    uv run python scripts/benchmarks/bench_json_codec.py --number=200
+"""
+
+import logging
+import timeit
+from functools import partial
+from typing import Any
+
+import fire
+
+from project.common.utils.file.json_codec import available_json_backends, get_json_codec
+
+logger = logging.getLogger(__name__)
+
+
+def _payloads() -> dict[str, Any]:
+    return {
+        'config': {
+            'service': {'host': 'localhost', 'port': 8080, 'debug': False},
+            'features': ['a', 'b', 'c'],
+            'limits': {'rps': 100, 'burst': 20},
+        },
+        'crawl_record': {
+            'url': 'https://example.com/articles/12345',
+            'title': '記事のタイトル',
+            'body': 'lorem ipsum dolor sit amet ' * 40,
+            'links': [f'https://example.com/{i}' for i in range(50)],
+            'fetched_at': '2024-01-01T00:00:00Z',
+        },
+        'numeric_rows': [{'id': i, 'x': i * 0.5, 'y': i * 1.25, 'ok': i % 2 == 0} for i in range(1000)],
+        'deep_nesting': _nested(depth=50),
+    }
+
+
+def _nested(depth: int) -> dict[str, Any]:
+    node: dict[str, Any] = {'leaf': True}
+    for level in range(depth):
+        node = {'level': level, 'child': node}
+    return node
+
+
+def main(number: int = 200) -> None:
+    """Report microseconds per dumps/loads call for each backend and payload shape."""
+    logging.basicConfig(level=logging.INFO)
+    payloads = _payloads()
+    backends = available_json_backends()
+    logger.info('Available backends: %s', ', '.join(backends))
+
+    for shape, payload in payloads.items():
+        for backend in backends:
+            codec = get_json_codec(backend)
+            encoded = codec.dumps(payload)
+            dumps_us = timeit.timeit(partial(codec.dumps, payload), number=number)
+            loads_us = timeit.timeit(partial(codec.loads, encoded), number=number)
+            logger.info(
+                '%-13s %-8s dumps %9.2f us  loads %9.2f us  (%d bytes)',
+                shape,
+                backend,
+                dumps_us / number * 1e6,
+                loads_us / number * 1e6,
+                len(encoded.encode('utf-8')),
+            )
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
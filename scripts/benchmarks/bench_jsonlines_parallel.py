@@ -0,0 +1,66 @@
+"""Benchmark JSON Lines decoding throughput against the number of worker processes.
+
+Usage:
+    uv run python scripts/benchmarks/bench_jsonlines_parallel.py --num_records=500000 --workers='[1,2,4,8]'
+"""
+
+import logging
+import tempfile
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import fire
+
+from project.common.utils.file.jsonlines import load_jsonlines, load_jsonlines_parallel, save_as_jsonlines
+
+logger = logging.getLogger(__name__)
+
+
+def _records(num_records: int) -> Iterator[dict[str, object]]:
+    for i in range(num_records):
+        yield {
+            'id': i,
+            'url': f'https://example.com/pages/{i}',
+            'title': f'Page {i}',
+            'body': 'lorem ipsum dolor sit amet ' * 8,
+            'tags': ['crawl', 'sample', str(i % 17)],
+            'score': i / 7,
+        }
+
+
+def main(
+    num_records: int = 200_000,
+    workers: Sequence[int] = (1, 2, 4, 8),
+    shard_size: int = 8 * 1024 * 1024,
+) -> None:
+    """Report records/s and MB/s for the serial loader and each worker count."""
+    logging.basicConfig(level=logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / 'bench.jsonl'
+        save_as_jsonlines(_records(num_records), path)
+        size_mb = path.stat().st_size / 1024 / 1024
+        logger.info('Generated %d records (%.1f MB)', num_records, size_mb)
+
+        start = time.perf_counter()
+        load_jsonlines(path)
+        elapsed = time.perf_counter() - start
+        logger.info('serial    : %8.2fs %10.0f rec/s %8.1f MB/s', elapsed, num_records / elapsed, size_mb / elapsed)
+
+        for max_workers in workers:
+            for ordered in (True, False):
+                start = time.perf_counter()
+                load_jsonlines_parallel(path, max_workers=max_workers, ordered=ordered, shard_size=shard_size)
+                elapsed = time.perf_counter() - start
+                logger.info(
+                    'workers=%-2d %-9s: %8.2fs %10.0f rec/s %8.1f MB/s',
+                    max_workers,
+                    'ordered' if ordered else 'unordered',
+                    elapsed,
+                    num_records / elapsed,
+                    size_mb / elapsed,
+                )
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,69 @@
+"""Compare MessagePack and JSON handlers on round-trip speed and on-disk size.
+
+Usage:
+    uv run python scripts/benchmarks/bench_msgpack.py --records=100000 --number=5
+"""
+
+import logging
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import fire
+
+from project.common.utils.file.factory import FileHandlerFactory
+from project.common.utils.file.jsonlines import load_jsonlines, save_as_jsonlines
+from project.common.utils.file.msgpack import iter_msgpack_records, save_as_msgpack_records
+
+logger = logging.getLogger(__name__)
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            'id': i,
+            'url': f'https://example.com/articles/{i}',
+            'title': f'記事のタイトル {i % 97}',
+            'score': i * 0.25,
+            'tags': ['news', 'tech', 'ja'][: 1 + i % 3],
+            'visited': i % 2 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def _report(label: str, number: int, save_seconds: float, load_seconds: float, path: Path) -> None:
+    logger.info(
+        '%-22s save %8.3fs  load %8.3fs  %11d bytes',
+        label, save_seconds / number, load_seconds / number, path.stat().st_size,
+    )  # fmt: skip
+
+
+def main(records: int = 100_000, number: int = 5) -> None:
+    """Time whole-document and record-stream round trips for both formats."""
+    logging.basicConfig(level=logging.INFO)
+    data = _records(records)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for ext in ('json', 'msgpack'):
+            handler = FileHandlerFactory.create(ext)  # type: ignore[arg-type]
+            path = Path(tmp_dir) / f'cache.{ext}'
+            save_seconds = timeit.timeit(partial(handler.save, data, path), number=number)
+            load_seconds = timeit.timeit(partial(handler.load, path), number=number)
+            _report(f'{ext} document', number, save_seconds, load_seconds, path)
+
+        jsonl_path = Path(tmp_dir) / 'records.jsonl'
+        save_seconds = timeit.timeit(lambda: save_as_jsonlines(data, jsonl_path), number=number)
+        load_seconds = timeit.timeit(lambda: load_jsonlines(jsonl_path), number=number)
+        _report('jsonl records', number, save_seconds, load_seconds, jsonl_path)
+
+        msgpack_path = Path(tmp_dir) / 'records.msgpack'
+        save_seconds = timeit.timeit(lambda: save_as_msgpack_records(data, msgpack_path), number=number)
+        load_seconds = timeit.timeit(lambda: list(iter_msgpack_records(msgpack_path)), number=number)
+        _report('msgpack records', number, save_seconds, load_seconds, msgpack_path)
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
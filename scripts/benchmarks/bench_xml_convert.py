@@ -0,0 +1,130 @@
+"""Benchmark the explicit-stack XML converters against the previous recursive ones.
+
+Usage:
+    uv run python scripts/benchmarks/bench_xml_convert.py --number=20
+"""
+
+import logging
+import timeit
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import fire
+
+from project.common.utils.file.xml import _dict_to_xml, _xml_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+def _legacy_dict_to_xml(tag: str, data: dict[str, Any]) -> ET.Element:
+    """Recursive two-level converter used before the explicit-stack rewrite."""
+    element = ET.Element(tag)
+
+    for key, value in data.items():
+        child = ET.SubElement(element, str(key))
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                sub_child = ET.SubElement(child, str(sub_key))
+                sub_child.text = str(sub_value)
+        elif isinstance(value, list):
+            for item in value:
+                item_element = ET.SubElement(child, 'item')
+                if isinstance(item, dict):
+                    for sub_key, sub_value in item.items():
+                        sub_child = ET.SubElement(item_element, str(sub_key))
+                        sub_child.text = str(sub_value)
+                else:
+                    item_element.text = str(item)
+        else:
+            child.text = str(value)
+
+    return element
+
+
+def _legacy_xml_to_dict(element: ET.Element) -> dict[str, Any] | list[Any] | str:
+    """Recursive converter used before the explicit-stack rewrite."""
+    if len(element) == 0:
+        return element.text or ''
+
+    result: dict[str, Any] = {}
+    for child in element:
+        child_data = _legacy_xml_to_dict(child)
+
+        if child.tag == 'item':
+            if element.tag not in result:
+                result[element.tag] = []
+            if isinstance(result[element.tag], list):
+                result[element.tag].append(child_data)
+        elif child.tag in result:
+            if not isinstance(result[child.tag], list):
+                result[child.tag] = [result[child.tag]]
+            result[child.tag].append(child_data)
+        else:
+            result[child.tag] = child_data
+
+    return result
+
+
+def _wide_dict(width: int) -> dict[str, Any]:
+    return {
+        f'record{i}': {'id': str(i), 'name': f'name-{i}', 'score': str(i / 3)}
+        if i % 2
+        else [f'value-{i}', {'nested': str(i)}]
+        for i in range(width)
+    }
+
+
+def _wide_element(width: int) -> ET.Element:
+    root = ET.Element('export')
+    for i in range(width):
+        record = ET.SubElement(root, 'record')
+        for field in ('id', 'name', 'score'):
+            ET.SubElement(record, field).text = f'{field}-{i}'
+        tags = ET.SubElement(record, 'tags')
+        for tag in range(3):
+            ET.SubElement(tags, 'item').text = f'tag-{tag}'
+    return root
+
+
+def _deep_element(depth: int) -> ET.Element:
+    root = ET.Element('level')
+    node = root
+    for i in range(depth):
+        ET.SubElement(node, 'meta').text = str(i)
+        node = ET.SubElement(node, 'level')
+    node.text = 'leaf'
+    return root
+
+
+def _time(func: Callable[[], object], number: int) -> str:
+    try:
+        return f'{timeit.timeit(func, number=number) / number * 1e3:9.3f} ms'
+    except RecursionError:
+        return '  RecursionError'
+
+
+def main(number: int = 20, width: int = 20_000, depth: int = 900) -> None:
+    """Report milliseconds per conversion for wide and deep documents."""
+    logging.basicConfig(level=logging.INFO)
+
+    wide_dict = _wide_dict(width)
+    logger.info('dict_to_xml wide (%d keys)', width)
+    logger.info('  recursive      : %s', _time(partial(_legacy_dict_to_xml, 'root', wide_dict), number))
+    logger.info('  explicit stack : %s', _time(partial(_dict_to_xml, 'root', wide_dict), number))
+
+    wide_element = _wide_element(width)
+    logger.info('xml_to_dict wide (%d records)', width)
+    logger.info('  recursive      : %s', _time(partial(_legacy_xml_to_dict, wide_element), number))
+    logger.info('  explicit stack : %s', _time(partial(_xml_to_dict, wide_element), number))
+
+    for levels in (depth, depth * 10):
+        deep_element = _deep_element(levels)
+        logger.info('xml_to_dict deep (%d levels)', levels)
+        logger.info('  recursive      : %s', _time(partial(_legacy_xml_to_dict, deep_element), number))
+        logger.info('  explicit stack : %s', _time(partial(_xml_to_dict, deep_element), number))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -1,25 +1,135 @@
 import asyncio
+import atexit
+import contextvars
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Coroutine
-from typing import Any
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Sequence,
+)
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, cast
 
+from cachetools import TTLCache
 
-def sync_to_async_func[R](sync_func: Callable[..., R]) -> Callable[..., Awaitable[R]]:
-    """Convert a synchronous callable into an asynchronous callable."""
+from project.common.utils.concurrency_utils import AdaptiveLimiter
+from project.common.utils.executor_utils import NamedExecutor
+from project.common.utils.metrics_utils import MetricsSink
+from project.common.utils.rate_limit_utils import RateLimiter
+from project.common.utils.retry_utils import CircuitBreaker, RetryPolicy
 
-    async def wrapper(*args: object, **kwargs: object) -> R:
-        return await asyncio.to_thread(sync_func, *args, **kwargs)
+DEFAULT_RESULT_CACHE_SIZE = 1024
+
+
+def sync_to_async_func[R](
+    sync_func: Callable[..., R], *, executor: NamedExecutor | None = None
+) -> Callable[..., Awaitable[R]]:
+    """Convert a synchronous callable into an asynchronous callable.
+
+    Calls run in the event loop's default executor unless ``executor`` is
+    given, which lets each group of functions use its own sized thread pool,
+    or a process pool for CPU-bound work. A function sent to a process pool
+    must stay importable under its own name, so bind the wrapper to a
+    different name instead of using this as a decorator.
+    """
+    if executor is None:
+
+        async def wrapper(*args: object, **kwargs: object) -> R:
+            return await asyncio.to_thread(sync_func, *args, **kwargs)
+
+    elif executor.kind == 'thread':
+
+        async def wrapper(*args: object, **kwargs: object) -> R:
+            # Context variables are propagated as asyncio.to_thread does.
+            context = contextvars.copy_context()
+            return await asyncio.wrap_future(executor.submit(context.run, sync_func, *args, **kwargs))
+
+    else:
+
+        async def wrapper(*args: object, **kwargs: object) -> R:
+            return await asyncio.wrap_future(executor.submit(sync_func, *args, **kwargs))
 
     wrapper.__name__ = sync_func.__name__
     wrapper.__doc__ = sync_func.__doc__
     return wrapper
 
 
-def async_to_sync_func[R](async_func: Callable[..., Coroutine[Any, Any, R]]) -> Callable[..., R]:
-    """Convert an asynchronous callable into a synchronous callable."""
+class _BackgroundLoop:
+    """Event loop running forever in a daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _get(self) -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+        with self._lock:
+            # The thread is gone in a forked child, so a new loop is started there.
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='async-to-sync-loop', daemon=True)
+                self._thread.start()
+            return self._loop, self._thread
+
+    def run[R](self, coro: Coroutine[Any, Any, R]) -> R:
+        loop, thread = self._get()
+        if threading.current_thread() is thread:
+            coro.close()
+            raise RuntimeError('cannot wait synchronously on the background loop from inside it; await the coroutine')
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. KeyboardInterrupt while waiting: do not leave the coroutine running.
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_background_loop = _BackgroundLoop()
+atexit.register(_background_loop.stop)
+
+
+def async_to_sync_func[R](
+    async_func: Callable[..., Coroutine[Any, Any, R]], *, persistent_loop: bool = False
+) -> Callable[..., R]:
+    """Convert an asynchronous callable into a synchronous callable.
 
-    def wrapper(*args: object, **kwargs: object) -> R:
-        return asyncio.run(async_func(*args, **kwargs))
+    By default every call runs in a fresh event loop via ``asyncio.run``. With
+    ``persistent_loop=True`` calls are submitted to one long-lived event loop
+    in a background thread instead, which avoids creating a loop per call and
+    keeps loop-bound resources such as aiohttp connection pools alive between
+    calls. That mode also works when the caller is itself running inside an
+    event loop, at the cost of blocking that loop until the call returns.
+    """
+    if persistent_loop:
+
+        def wrapper(*args: object, **kwargs: object) -> R:
+            return _background_loop.run(async_func(*args, **kwargs))
+
+    else:
+
+        def wrapper(*args: object, **kwargs: object) -> R:
+            return asyncio.run(async_func(*args, **kwargs))
 
     wrapper.__name__ = async_func.__name__
     wrapper.__doc__ = async_func.__doc__
@@ -39,17 +149,337 @@ async def run_async_function_with_semaphore[R](
     return await async_func(*args, **kwargs)
 
 
+async def _aiter_items[T](iterable: Iterable[T] | AsyncIterable[T]) -> AsyncGenerator[T]:
+    """Iterate a sync or async iterable asynchronously."""
+    if isinstance(iterable, AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def async_map[T, R](
+    func: Callable[[T], Awaitable[R]],
+    iterable: Iterable[T] | AsyncIterable[T],
+    concurrency: int,
+    *,
+    ordered: bool = True,
+) -> AsyncIterator[R]:
+    """Apply an async function to every item with at most ``concurrency`` calls in flight.
+
+    Items are pulled from ``iterable`` only when a slot frees up, so an
+    unbounded or very large input never materializes more than
+    ``concurrency`` pending tasks and memory stays flat. If a call raises,
+    or the consumer stops iterating early, the remaining in-flight calls are
+    cancelled.
+
+    Args:
+        func: Async function applied to each item
+        iterable: Sync or async iterable of items, consumed lazily
+        concurrency: Maximum number of calls running at once
+        ordered: If True, yield results in input order (a slow call holds
+            back later results); otherwise yield each result as soon as it
+            is ready
+
+    Yields:
+        Result of ``func`` for each item
+
+    Raises:
+        ValueError: If concurrency is not positive
+
+    Example:
+        >>> async for page in async_map(fetch, urls, concurrency=32):
+        ...     process(page)
+
+    """
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be positive, got {concurrency}')
+
+    items = _aiter_items(iterable)
+    in_flight: set[asyncio.Future[R]] = set()
+    submitted: deque[asyncio.Future[R]] = deque()
+    completed: asyncio.Queue[asyncio.Future[R]] = asyncio.Queue()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                future: asyncio.Future[R] = asyncio.ensure_future(func(item))
+                in_flight.add(future)
+                if ordered:
+                    submitted.append(future)
+                else:
+                    future.add_done_callback(completed.put_nowait)
+            if not in_flight:
+                return
+
+            done = submitted.popleft() if ordered else await completed.get()
+            result = await done
+            in_flight.discard(done)
+            yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        await items.aclose()
+
+
 class AsyncResource[R](ABC):
-    """Base class for async resources protected by a semaphore."""
+    """Base class for async resources protected by a semaphore.
+
+    ``concurrency`` is either a fixed number of concurrent calls or an
+    :class:`AdaptiveLimiter`, which tunes that number from call latency and errors.
 
-    def __init__(self, concurrency: int = 1) -> None:
-        self.semaphore = asyncio.Semaphore(concurrency)
+    Calls can additionally be rate limited, retried with backoff, guarded by a
+    circuit breaker and bounded by a timeout. Every retry attempt takes its
+    own rate-limit token and semaphore slot, and no slot is held while
+    backing off, so retries never raise concurrency above ``concurrency``.
+
+    With ``single_flight``, concurrent calls with the same ``coalesce_key``
+    share one execution and receive its result or exception. With
+    ``cache_ttl``, successful results are kept for that many seconds in a TTL
+    cache of at most ``cache_maxsize`` entries.
+
+    With ``metrics``, every call reports its semaphore wait and duration
+    (histograms ``async_resource_semaphore_wait_seconds`` and
+    ``async_resource_call_duration_seconds``), the number of running calls
+    (gauge ``async_resource_in_flight``) and its errors by exception type
+    (counter ``async_resource_errors_total``), labelled with
+    ``metrics_labels``. Without a sink the only cost is one attribute check.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        concurrency: int | AdaptiveLimiter = 1,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        call_timeout: float | None = None,
+        single_flight: bool = False,
+        cache_ttl: float | None = None,
+        cache_maxsize: int = DEFAULT_RESULT_CACHE_SIZE,
+        metrics: MetricsSink | None = None,
+    ) -> None:
+        self.semaphore: asyncio.Semaphore | AdaptiveLimiter = (
+            concurrency if isinstance(concurrency, AdaptiveLimiter) else asyncio.Semaphore(concurrency)
+        )
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.call_timeout = call_timeout
+        self.single_flight = single_flight
+        self.cache: TTLCache[Hashable, R] | None = (
+            None if cache_ttl is None else TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        )
+        self._in_flight: dict[Hashable, asyncio.Future[R]] = {}
+        self.metrics = metrics
+        self.metrics_labels: dict[str, str] = {'resource': type(self).__name__}
+        self._running_calls = 0
 
     async def task(self, *args: object, **kwargs: object) -> R:
+        if not self.single_flight and self.cache is None:
+            return await self._execute(*args, **kwargs)
+
+        key = self.coalesce_key(*args, **kwargs)
+        if self.cache is not None and key in self.cache:
+            return self.cache[key]
+        if not self.single_flight:
+            return await self._execute_and_cache(key, *args, **kwargs)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._execute_and_cache(key, *args, **kwargs))
+            self._in_flight[key] = future
+            future.add_done_callback(partial(self._forget_in_flight, key))
+        # Shielded so that one cancelled caller does not cancel the call the others share.
+        return await asyncio.shield(future)
+
+    def _forget_in_flight(self, key: Hashable, future: asyncio.Future[R]) -> None:
+        del self._in_flight[key]
+        # Mark the exception as retrieved in case every caller was cancelled meanwhile.
+        if not future.cancelled():
+            future.exception()
+
+    async def _execute_and_cache(self, key: Hashable, *args: object, **kwargs: object) -> R:
+        result = await self._execute(*args, **kwargs)
+        if self.cache is not None:
+            self.cache[key] = result
+        return result
+
+    async def _execute(self, *args: object, **kwargs: object) -> R:
+        return await self._protected(self.call, *args, **kwargs)
+
+    async def _protected[V](self, func: Callable[..., Awaitable[V]], *args: object, **kwargs: object) -> V:
+        """Run ``func`` with the resource's retry, breaker, rate-limit, semaphore and timeout settings."""
+        if self.retry is None:
+            return await self._attempt(func, *args, **kwargs)
+        async for attempt in self.retry.retrying():
+            with attempt:
+                return await self._attempt(func, *args, **kwargs)
+        raise AssertionError('unreachable: tenacity re-raises the last error')  # pragma: no cover
+
+    async def _attempt[V](self, func: Callable[..., Awaitable[V]], *args: object, **kwargs: object) -> V:
+        breaker = self.circuit_breaker
+        # Fail fast before queueing for a token or a slot while the circuit is open.
+        if breaker is not None:
+            breaker.check()
+        # The token is taken before the slot: a call throttled on one key must not
+        # hold a slot while it waits, or it would starve calls to other keys.
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.rate_limit_key(*args, **kwargs))
+        metrics = self.metrics
+        queued_at = time.perf_counter() if metrics is not None else 0.0
         async with self.semaphore:
-            return await self.call(*args, **kwargs)
+            # Checked again once admitted: the circuit may have opened while this call was queued.
+            with breaker.guard() if breaker is not None else nullcontext():
+                if metrics is not None:
+                    return await self._call_instrumented(metrics, queued_at, func, *args, **kwargs)
+                async with asyncio.timeout(self.call_timeout):
+                    return await func(*args, **kwargs)
+
+    async def _call_instrumented[V](
+        self,
+        metrics: MetricsSink,
+        queued_at: float,
+        func: Callable[..., Awaitable[V]],
+        *args: object,
+        **kwargs: object,
+    ) -> V:
+        labels = self.metrics_labels
+        started = time.perf_counter()
+        metrics.observe('async_resource_semaphore_wait_seconds', started - queued_at, labels)
+        self._running_calls += 1
+        metrics.set_gauge('async_resource_in_flight', self._running_calls, labels)
+        try:
+            async with asyncio.timeout(self.call_timeout):
+                return await func(*args, **kwargs)
+        except Exception as exc:
+            metrics.increment('async_resource_errors_total', {**labels, 'error': type(exc).__name__})
+            raise
+        finally:
+            metrics.observe('async_resource_call_duration_seconds', time.perf_counter() - started, labels)
+            self._running_calls -= 1
+            metrics.set_gauge('async_resource_in_flight', self._running_calls, labels)
+
+    def coalesce_key(self, *args: object, **kwargs: object) -> Hashable:
+        """Return the key identifying identical calls for single-flight and caching.
+
+        The default uses all arguments, which must then be hashable; override
+        to ignore arguments that do not affect the result.
+        """
+        return args, frozenset(kwargs.items())
+
+    def rate_limit_key(self, *_args: object, **_kwargs: object) -> Hashable:
+        """Return the rate-limit bucket for a call; override to limit per host, endpoint, etc."""
+        return None
 
     @abstractmethod
     async def call(self, *args: object, **kwargs: object) -> R:
         """Execute the concrete asynchronous operation."""
         raise NotImplementedError
+
+
+class BatchingAsyncResource[T, R](AsyncResource[R]):
+    """AsyncResource that groups individual ``task(item)`` calls into batches.
+
+    Items are collected until ``max_batch_size`` are pending or ``max_wait``
+    seconds have passed since the first one, then sent in a single
+    ``call_batch``. Rate limiting, retries, the circuit breaker, the timeout
+    and the semaphore apply per batch, so ``concurrency`` bounds the number
+    of batches in flight. Single-flight and caching still apply per item.
+
+    ``call_batch`` returns one result per item, in order. A result that is an
+    exception instance is raised to that item's caller only; an exception
+    raised by ``call_batch`` itself is raised to every caller in the batch.
+
+    Example:
+        >>> class Embedder(BatchingAsyncResource[str, list[float]]):
+        ...     async def call_batch(self, items):
+        ...         return await client.embed(items)
+        >>> embedder = Embedder(max_batch_size=64, max_wait=0.005, concurrency=4)
+        >>> vectors = await asyncio.gather(*(embedder.task(text) for text in texts))
+
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_wait: float = 0.005, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the resource.
+
+        Args:
+            max_batch_size: Largest number of items sent in one ``call_batch``
+            max_wait: Longest time in seconds an item waits for its batch to fill
+            **kwargs: Arguments of :class:`AsyncResource`
+
+        Raises:
+            ValueError: If max_batch_size is not positive or max_wait is negative
+
+        """
+        if max_batch_size < 1:
+            raise ValueError(f'max_batch_size must be positive, got {max_batch_size}')
+        if max_wait < 0:
+            raise ValueError(f'max_wait must not be negative, got {max_wait}')
+        super().__init__(**kwargs)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    async def _execute(self, *args: object, **kwargs: object) -> R:
+        if len(args) != 1 or kwargs:
+            raise TypeError(f'{type(self).__name__}.task takes exactly one positional item')
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((cast('T', args[0]), future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        # Callers cancelled while waiting have nobody to receive a result.
+        batch = [(item, future) for item, future in self._pending if not future.done()]
+        self._pending = []
+        if batch:
+            dispatch = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results = await self._protected(self.call_batch, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f'call_batch returned {len(results)} results for {len(batch)} items')  # noqa: TRY301
+        except Exception as exc:  # noqa: BLE001
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def call(self, *args: object, **_kwargs: object) -> R:
+        """Process a single item through ``call_batch``, without batching."""
+        result = (await self.call_batch([cast('T', args[0])]))[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    @abstractmethod
+    async def call_batch(self, items: list[T]) -> Sequence[R | BaseException]:
+        """Execute the concrete operation for a batch of items, returning one result per item."""
+        raise NotImplementedError
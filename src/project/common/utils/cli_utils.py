@@ -10,11 +10,16 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def load_cli_config(config_file_path: str | Path | None = None, **kwargs: object) -> dict[str, Any]:
+def load_cli_config(
+    config_file_path: str | Path | None = None,
+    *,
+    use_cache: bool = False,
+    **kwargs: object,
+) -> dict[str, Any]:
     """Load configuration from a file and merge it with runtime arguments."""
     if config_file_path:
         logger.info('Loading configuration from %s', config_file_path)
-        merged = load_config(config_file_path)
+        merged = load_config(config_file_path, use_cache=use_cache)
         merged.update(kwargs)
         logger.info('Merged config with overrides: %s', list(kwargs) if kwargs else [])
     else:
@@ -26,6 +31,8 @@ def load_cli_config(config_file_path: str | Path | None = None, **kwargs: object
 def load_and_parse_config[T: BaseModel](
     config_class: type[T],
     config_file_path: str | Path | None = None,
+    *,
+    use_cache: bool = False,
     **kwargs: object,
 ) -> T:
     """Load configuration from file, merge with kwargs, and parse into Pydantic model.
@@ -38,6 +45,7 @@ def load_and_parse_config[T: BaseModel](
     Args:
         config_class: Pydantic BaseModel subclass to parse into
         config_file_path: Path to config file (JSON/YAML/TOML)
+        use_cache: If True, reuse the parsed config file until its mtime or size changes
         **kwargs: CLI overrides to merge with file config
 
     Returns:
@@ -55,5 +63,5 @@ def load_and_parse_config[T: BaseModel](
         >>> assert isinstance(cfg, MyConfig)
 
     """
-    raw_config = load_cli_config(config_file_path, **kwargs)
+    raw_config = load_cli_config(config_file_path, use_cache=use_cache, **kwargs)
     return config_class(**raw_config)
@@ -0,0 +1,188 @@
+"""Adaptive concurrency limiting (AIMD) for asyncio code.
+
+A fixed semaphore size is either too small for a healthy backend or too large
+for a struggling one. ``AdaptiveLimiter`` adjusts its limit from the latency
+and outcome of every call, like TCP congestion control:
+
+- additive increase: while calls succeed within the latency target and the
+  limit is actually being used, the limit grows by about one per window of
+  ``limit`` calls
+- multiplicative decrease: a failed call or one slower than the target
+  multiplies the limit by ``backoff_ratio``, at most once per window (only
+  calls that started after the previous decrease can trigger the next one)
+
+The latency target is either given explicitly or derived from the backend's
+unloaded latency: ``tolerance`` times the lowest latency observed over the
+last one to two ``baseline_window`` periods. Because every decrease brings
+latency back down, the windowed minimum keeps tracking the unloaded latency
+while still absorbing a permanent shift within two windows.
+
+The limiter is an async context manager, so it can be used wherever an
+``asyncio.Semaphore`` is, including as ``AsyncResource(concurrency=...)``.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from types import TracebackType
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to latency and errors with AIMD.
+
+    Example:
+        >>> limiter = AdaptiveLimiter(initial_limit=8, max_limit=256, latency_target=0.2)
+        >>> async with limiter:
+        ...     await fetch()
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        initial_limit: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        latency_target: float | None = None,
+        tolerance: float = 2.0,
+        backoff_ratio: float = 0.7,
+        baseline_window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Limit before any feedback
+            min_limit: Lower bound of the limit
+            max_limit: Upper bound of the limit
+            latency_target: Latency in seconds above which a call counts as
+                overload; if None, ``tolerance`` times the baseline latency
+            tolerance: Multiple of the baseline latency tolerated when no
+                explicit target is given
+            backoff_ratio: Factor applied to the limit on overload
+            baseline_window: Seconds after which old latency samples stop
+                counting towards the baseline
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If the limits or ratios are inconsistent
+
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                f'limits must satisfy 1 <= min_limit <= initial_limit <= max_limit, '
+                f'got {min_limit}, {initial_limit}, {max_limit}'
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f'backoff_ratio must be between 0 and 1, got {backoff_ratio}')
+        if tolerance <= 1:
+            raise ValueError(f'tolerance must be greater than 1, got {tolerance}')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.tolerance = tolerance
+        self.backoff_ratio = backoff_ratio
+        self.baseline_window = baseline_window
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._window_min = math.inf
+        self._previous_window_min = math.inf
+        self._window_start = clock()
+        self._last_decrease = -math.inf
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._started: dict[asyncio.Task[object] | None, list[float]] = {}
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed to run at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    def locked(self) -> bool:
+        """Return True if a call would have to wait for a slot."""
+        return self._in_flight >= self.limit or bool(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a slot; waiters are served first come, first served."""
+        if not self.locked():
+            self._in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation; pass it on.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(future)
+            raise
+
+    def release(self, latency: float, *, failed: bool = False) -> None:
+        """Free a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Seconds the call held its slot
+            failed: Whether the call failed
+
+        """
+        using_limit = self._in_flight * 2 >= self._limit
+        self._in_flight -= 1
+        now = self._clock()
+        if now - self._window_start >= self.baseline_window:
+            self._previous_window_min, self._window_min = self._window_min, math.inf
+            self._window_start = now
+        if not failed:
+            self._window_min = min(self._window_min, latency)
+
+        if self.latency_target is not None:
+            target = self.latency_target
+        else:
+            target = min(self._window_min, self._previous_window_min) * self.tolerance
+        if failed or latency > target:
+            # Calls that started before the last decrease already saw the old
+            # limit; letting them cut again would collapse the limit.
+            if now - latency >= self._last_decrease:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._last_decrease = now
+        elif using_limit:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+        self._started.setdefault(asyncio.current_task(), []).append(self._clock())
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        task = asyncio.current_task()
+        starts = self._started[task]
+        started = starts.pop()
+        if not starts:
+            del self._started[task]
+        # Cancellation says nothing about the backend, so it neither grows nor shrinks the limit.
+        if exc is not None and not isinstance(exc, Exception):
+            self._in_flight -= 1
+            self._wake()
+            return
+        self.release(self._clock() - started, failed=exc is not None)
@@ -0,0 +1,195 @@
+"""Named, sized executors with queue-depth and utilization statistics.
+
+``asyncio.to_thread`` sends every offloaded call to the event loop's default
+executor, so one slow function can occupy all of its threads and delay every
+other offloaded call. A ``NamedExecutor`` gives a group of functions its own
+pool: a thread pool for blocking I/O, or a process pool for CPU-bound work
+that would otherwise contend for the GIL.
+
+Each executor counts submitted and finished calls, from which
+``stats()`` derives the number of calls running and waiting. Because pools
+start a queued call as soon as a worker is free, ``running`` is
+``min(pending, max_workers)`` and the rest are queued. ``executor_stats()``
+reports every live executor, which is what you need to size them.
+
+Pools are created on first use, so declaring an executor at import time
+costs nothing, and process pools default to the ``forkserver`` start method
+where available, which avoids forking a process that already runs threads.
+"""
+
+import concurrent.futures
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+type ExecutorKind = Literal['thread', 'process']
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time statistics of a NamedExecutor.
+
+    Attributes:
+        name: Executor name
+        kind: 'thread' or 'process'
+        max_workers: Pool size
+        submitted: Calls submitted since creation
+        completed: Calls finished since creation, successfully or not
+        running: Calls currently executing
+        queued: Calls waiting for a free worker
+
+    """
+
+    name: str
+    kind: ExecutorKind
+    max_workers: int
+    submitted: int
+    completed: int
+    running: int
+    queued: int
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of workers currently busy."""
+        return self.running / self.max_workers
+
+
+# The return type is quoted because evaluating it would import concurrent.futures.process and multiprocessing.
+def create_process_pool(
+    max_workers: int | None = None,
+    mp_context: 'BaseContext | None' = None,
+) -> 'concurrent.futures.ProcessPoolExecutor':
+    """Create a process pool that does not fork a process running threads.
+
+    The platform default start method is fork on Linux, and forking a process
+    that already runs threads (executor pools, background event loops) can
+    deadlock the child. Every process pool of the project is created here so
+    that it uses the forkserver start method where available.
+
+    Args:
+        max_workers: Pool size (default: ``os.cpu_count()``)
+        mp_context: Multiprocessing context (default: forkserver where
+            available, otherwise the platform default)
+
+    Returns:
+        New process pool
+
+    """
+    # Imported here so that thread-only users never load multiprocessing.
+    import multiprocessing  # noqa: PLC0415
+
+    if mp_context is None and 'forkserver' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('forkserver')
+    return concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=mp_context)
+
+
+class NamedExecutor:
+    """Lazily created thread or process pool that tracks its load.
+
+    Example:
+        >>> db_pool = NamedExecutor('db', max_workers=4)
+        >>> query_async = sync_to_async_func(query, executor=db_pool)
+        >>> db_pool.stats().queued
+        0
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int | None = None,
+        *,
+        kind: ExecutorKind = 'thread',
+        mp_context: 'BaseContext | None' = None,
+    ) -> None:
+        """Initialize the executor without starting any worker.
+
+        Args:
+            name: Name reported in statistics and used as the thread name prefix
+            max_workers: Pool size (default: ``os.cpu_count()`` for processes,
+                ``min(32, os.cpu_count() + 4)`` for threads, as in the stdlib)
+            kind: 'thread' for blocking I/O, 'process' for CPU-bound functions;
+                functions and arguments sent to a process pool must be picklable
+            mp_context: Multiprocessing context of a process pool (default:
+                forkserver where available, otherwise the platform default)
+
+        Raises:
+            ValueError: If max_workers is not positive or kind is unknown
+
+        """
+        if kind not in {'thread', 'process'}:
+            raise ValueError(f"kind must be 'thread' or 'process', got {kind!r}")
+        cpu_count = os.cpu_count() or 1
+        if max_workers is None:
+            max_workers = cpu_count if kind == 'process' else min(32, cpu_count + 4)
+        if max_workers < 1:
+            raise ValueError(f'max_workers must be positive, got {max_workers}')
+        self.name = name
+        self.kind: ExecutorKind = kind
+        self.max_workers = max_workers
+        self._mp_context = mp_context
+        self._executor: concurrent.futures.Executor | None = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        _executors.add(self)
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == 'thread':
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix=self.name
+                    )
+                else:
+                    self._executor = create_process_pool(self.max_workers, mp_context=self._mp_context)
+            return self._executor
+
+    def submit[R](self, func: Callable[..., R], /, *args: object, **kwargs: object) -> concurrent.futures.Future[R]:
+        """Schedule ``func(*args, **kwargs)`` on the pool, creating the pool on first use."""
+        future = self._get_executor().submit(func, *args, **kwargs)
+        with self._lock:
+            self._submitted += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, _future: object) -> None:
+        with self._lock:
+            self._completed += 1
+
+    def stats(self) -> ExecutorStats:
+        """Return the current load of the executor."""
+        with self._lock:
+            submitted, completed = self._submitted, self._completed
+        pending = submitted - completed
+        running = min(pending, self.max_workers)
+        return ExecutorStats(
+            name=self.name,
+            kind=self.kind,
+            max_workers=self.max_workers,
+            submitted=submitted,
+            completed=completed,
+            running=running,
+            queued=pending - running,
+        )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut the pool down; a later submit starts a new one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_executors: weakref.WeakSet[NamedExecutor] = weakref.WeakSet()
+
+
+def executor_stats() -> list[ExecutorStats]:
+    """Return the statistics of every live NamedExecutor, sorted by name."""
+    return sorted((executor.stats() for executor in list(_executors)), key=lambda stats: stats.name)
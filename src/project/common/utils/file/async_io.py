@@ -0,0 +1,227 @@
+"""Asynchronous counterparts of the generic file I/O operations.
+
+File reads and writes go through aiofiles, and parsing/serialization runs
+on a dedicated, bounded thread pool instead of the event loop's default
+executor. Hundreds of concurrent calls therefore queue on a fixed number of
+threads rather than spawning one thread per call.
+
+Paths ending in a compression suffix are compressed and decompressed on the
+same pool, so the event loop never runs a codec. Streams are also opened and
+closed on the pool, since closing a compressed writer flushes the codec and
+writes its trailer.
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, asynccontextmanager
+from functools import cache, partial
+from pathlib import Path
+from typing import IO, Any, Final
+
+import aiofiles
+from more_itertools import chunked
+
+from project.common.utils.file.base import FileHandler
+from project.common.utils.file.compression import Compression, compress_bytes, decompress_bytes, detect_compression
+from project.common.utils.file.factory import get_file_handler
+from project.common.utils.file.jsonlines import DEFAULT_CHUNK_SIZE, decode_jsonlines_chunk, encode_jsonlines_chunk
+from project.common.utils.file.stream import open_for_read, open_for_write
+
+FILE_IO_MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_READ_SIZE: Final[int] = 1024 * 1024
+
+
+@cache
+def get_file_io_executor() -> ThreadPoolExecutor:
+    """Return the shared, bounded thread pool used for async file I/O."""
+    return ThreadPoolExecutor(max_workers=FILE_IO_MAX_WORKERS, thread_name_prefix='file-io')
+
+
+def _decode_payload(handler: FileHandler, compression: Compression | None, raw: bytes) -> Any:  # noqa: ANN401
+    return handler.loads(raw if compression is None else decompress_bytes(raw, compression))
+
+
+def _encode_payload(handler: FileHandler, compression: Compression | None, data: Any) -> bytes:  # noqa: ANN401
+    payload = handler.dumps(data)
+    return payload if compression is None else compress_bytes(payload, compression)
+
+
+async def aload_file(path: str | Path, *, executor: Executor | None = None) -> Any:  # noqa: ANN401
+    """Asynchronously load data from a file, detecting format from extension.
+
+    Args:
+        path: Path to the file (extension determines format)
+        executor: Executor for file access and parsing (default: shared file I/O pool)
+
+    Returns:
+        Deserialized data from the file
+
+    Raises:
+        ValueError: If file format cannot be detected or is unsupported
+
+    """
+    handler = get_file_handler(path)
+    executor = executor or get_file_io_executor()
+    async with aiofiles.open(path, mode='rb', executor=executor) as fin:
+        raw = await fin.read()
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, _decode_payload, handler, detect_compression(path), raw
+    )
+
+
+async def asave_file(
+    data: Any,  # noqa: ANN401
+    path: str | Path,
+    *,
+    parents: bool = True,
+    exist_ok: bool = True,
+    executor: Executor | None = None,
+) -> None:
+    """Asynchronously save data to a file, detecting format from extension.
+
+    Args:
+        data: Data to save
+        path: Path where the file should be saved (extension determines format)
+        parents: If True, create parent directories as needed
+        exist_ok: If True, don't raise error if directory exists
+        executor: Executor for file access and serialization (default: shared file I/O pool)
+
+    Raises:
+        ValueError: If file format cannot be detected or is unsupported
+
+    """
+    handler = get_file_handler(path)
+    executor = executor or get_file_io_executor()
+    loop = asyncio.get_running_loop()
+    target = Path(path)
+    payload = await loop.run_in_executor(executor, _encode_payload, handler, detect_compression(target), data)
+    await loop.run_in_executor(executor, partial(target.parent.mkdir, parents=parents, exist_ok=exist_ok))
+    async with aiofiles.open(target, mode='wb', executor=executor) as fout:
+        await fout.write(payload)
+
+
+@asynccontextmanager
+async def _enter_on_executor(manager: AbstractContextManager[IO[Any]], executor: Executor) -> AsyncIterator[IO[Any]]:
+    """Enter and exit a blocking stream context manager on the executor instead of the event loop."""
+    loop = asyncio.get_running_loop()
+    stream = await loop.run_in_executor(executor, manager.__enter__)
+    try:
+        yield stream
+    except BaseException as exc:
+        if not await loop.run_in_executor(executor, manager.__exit__, type(exc), exc, exc.__traceback__):
+            raise
+    else:
+        await loop.run_in_executor(executor, manager.__exit__, None, None, None)
+
+
+async def _aiter_blocks(path: str | Path, read_size: int, executor: Executor) -> AsyncIterator[bytes]:
+    """Yield raw blocks of a file, decompressing on the executor when the suffix names a codec."""
+    if detect_compression(path) is None:
+        async with aiofiles.open(path, mode='rb', executor=executor) as fin:
+            while block := await fin.read(read_size):
+                yield block
+        return
+
+    loop = asyncio.get_running_loop()
+    async with _enter_on_executor(open_for_read(path, mode='rb'), executor) as stream:
+        while block := await loop.run_in_executor(executor, stream.read, read_size):
+            yield block
+
+
+async def aiter_jsonlines(
+    path: str | Path,
+    *,
+    read_size: int = DEFAULT_READ_SIZE,
+    executor: Executor | None = None,
+) -> AsyncIterator[dict[str, object]]:
+    """Asynchronously yield records from a JSON Lines file.
+
+    The file is read in blocks of ``read_size`` (decompressed) bytes and each
+    block of complete lines is decoded on the executor, so memory stays
+    bounded by the block size.
+
+    Args:
+        path: Path to the JSON Lines file
+        read_size: Number of bytes read per block
+        executor: Executor for file access and decoding (default: shared file I/O pool)
+
+    Yields:
+        Each record in file order
+
+    """
+    executor = executor or get_file_io_executor()
+    loop = asyncio.get_running_loop()
+    pending = b''
+    async for block in _aiter_blocks(path, read_size, executor):
+        complete, newline, pending = (pending + block).rpartition(b'\n')
+        if newline:
+            for record in await loop.run_in_executor(executor, decode_jsonlines_chunk, complete):
+                yield record
+    if pending.strip():
+        for record in await loop.run_in_executor(executor, decode_jsonlines_chunk, pending):
+            yield record
+
+
+async def _aiter_chunks(
+    data: Iterable[dict[str, object]] | AsyncIterable[dict[str, object]],
+    chunk_size: int,
+) -> AsyncIterator[list[dict[str, object]]]:
+    """Group records from a sync or async iterable into lists of ``chunk_size``."""
+    if not isinstance(data, AsyncIterable):
+        for records in chunked(data, chunk_size):
+            yield records
+        return
+
+    chunk: list[dict[str, object]] = []
+    async for record in data:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def asave_as_jsonlines(  # noqa: PLR0913
+    data: Iterable[dict[str, object]] | AsyncIterable[dict[str, object]],
+    path: str | Path,
+    *,
+    parents: bool = True,
+    exist_ok: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> None:
+    """Asynchronously stream records from a sync or async iterable into a JSON Lines file.
+
+    Args:
+        data: Records to write
+        path: Path where the file should be saved
+        parents: If True, create parent directories as needed
+        exist_ok: If True, don't raise error if directory exists
+        chunk_size: Number of records encoded and written per block
+        executor: Executor for file access and encoding (default: shared file I/O pool)
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+
+    executor = executor or get_file_io_executor()
+    loop = asyncio.get_running_loop()
+    target = Path(path)
+    await loop.run_in_executor(executor, partial(target.parent.mkdir, parents=parents, exist_ok=exist_ok))
+
+    if detect_compression(target) is None:
+        async with aiofiles.open(target, mode='wb', executor=executor) as fout:
+            async for chunk in _aiter_chunks(data, chunk_size):
+                await fout.write(await loop.run_in_executor(executor, encode_jsonlines_chunk, chunk))
+        return
+
+    async with _enter_on_executor(open_for_write(target, mode='wb'), executor) as stream:
+        async for chunk in _aiter_chunks(data, chunk_size):
+            await loop.run_in_executor(executor, _encode_and_write, stream, chunk)
+
+
+def _encode_and_write(stream: IO[bytes], records: list[dict[str, object]]) -> None:
+    stream.write(encode_jsonlines_chunk(records))
@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Any, Protocol, TypeVar
 
+from project.common.utils.file.stream import WriteOptions
+
 T = TypeVar('T')
 
 JsonLikeValue = dict[str, Any] | list[Any] | str | int | float | bool | None
@@ -38,6 +40,7 @@ class FileSaver(Protocol):
         *,
         parents: bool = True,
         exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
     ) -> None:
         """Save data to the specified file path.
 
@@ -46,6 +49,7 @@ class FileSaver(Protocol):
             path: Path where the file should be saved
             parents: If True, create parent directories as needed
             exist_ok: If True, don't raise error if directory exists
+            write_options: Atomicity and buffering options for the write
 
         """
         ...
@@ -61,6 +65,14 @@ class FileHandler(Protocol):
         """Load data from the specified file path."""
         ...
 
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Parse data from an in-memory document."""
+        ...
+
+    def dumps(self, data: Any) -> bytes:  # noqa: ANN401
+        """Serialize data to the bytes that save() would write."""
+        ...
+
     def save(
         self,
         data: Any,  # noqa: ANN401
@@ -68,6 +80,7 @@ class FileHandler(Protocol):
         *,
         parents: bool = True,
         exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
     ) -> None:
         """Save data to the specified file path."""
         ...
@@ -0,0 +1,97 @@
+"""Thread-safe cache of parsed files, invalidated by mtime and size.
+
+Entries are keyed by the resolved path and remember the ``(mtime_ns, size)``
+signature the file had when it was parsed. A lookup whose signature no longer
+matches re-parses the file, and the least recently used paths are evicted once
+``maxsize`` entries are cached. Callers always receive a deep copy, so mutating
+a returned value never corrupts the cache.
+"""
+
+import copy
+import threading
+from pathlib import Path
+from typing import Any
+
+from cachetools import LRUCache
+
+from project.common.utils.file.io import load_file
+
+DEFAULT_CACHE_SIZE = 128
+
+_Signature = tuple[int, int]
+
+
+class CachedFileLoader:
+    """LRU cache around :func:`load_file` that re-parses files when they change."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of parsed files kept in memory
+
+        """
+        self._cache: LRUCache[Path, tuple[_Signature, Any]] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def load(self, path: str | Path) -> Any:  # noqa: ANN401
+        """Return a copy of the parsed file, parsing it only if it changed.
+
+        Args:
+            path: Path to the file (extension determines format)
+
+        Returns:
+            Deep copy of the deserialized data
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If file format cannot be detected or is unsupported
+
+        """
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._cache.get(resolved)
+        if entry is not None and entry[0] == signature:
+            return copy.deepcopy(entry[1])
+
+        # Parse outside the lock so slow files do not block lookups of other paths.
+        data = load_file(resolved)
+        with self._lock:
+            self._cache[resolved] = (signature, data)
+        return copy.deepcopy(data)
+
+    def invalidate(self, path: str | Path) -> None:
+        """Drop the cached entry for a path, if any."""
+        with self._lock:
+            self._cache.pop(Path(path).resolve(), None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+_default_loader = CachedFileLoader()
+
+
+def load_file_cached(path: str | Path) -> Any:  # noqa: ANN401
+    """Load a file through the shared :class:`CachedFileLoader`.
+
+    Example:
+        >>> settings = load_file_cached('config.yaml')  # parsed
+        >>> settings = load_file_cached('config.yaml')  # served from cache
+
+    """
+    return _default_loader.load(path)
+
+
+def clear_file_cache() -> None:
+    """Drop every entry from the shared file cache."""
+    _default_loader.clear()
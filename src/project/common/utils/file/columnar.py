@@ -0,0 +1,212 @@
+"""Convert JSON Lines to columnar files (Parquet, Arrow IPC) and query them with polars.
+
+Conversion runs on polars' streaming engine: an uncompressed JSON Lines file
+is read in batches and written out batch by batch, so memory is bounded by the
+batch size rather than the file size. Compressed sources do not get that
+bound: polars decompresses gzip and zstd in memory, and reads ``.xz`` whole
+from the decompressing file object. The output is written to a temporary file
+and renamed over the target only once conversion succeeds, so a failed
+conversion never leaves a truncated file behind.
+
+Reading back goes through a lazy scan, so column projections and filter
+predicates are pushed down into the reader and only the needed columns and
+row groups are decoded.
+"""
+
+import os
+import secrets
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Final, Literal
+
+import polars as pl
+
+from project.common.utils.file.compression import detect_compression, strip_compression_suffix
+from project.common.utils.file.stream import open_for_read
+
+ColumnarFormat = Literal['parquet', 'ipc']
+ColumnarCompression = Literal['zstd', 'lz4', 'uncompressed']
+
+COLUMNAR_EXTENSIONS: Final[dict[str, ColumnarFormat]] = {
+    'parquet': 'parquet',
+    'arrow': 'ipc',
+    'ipc': 'ipc',
+    'feather': 'ipc',
+}
+DEFAULT_BATCH_SIZE: Final[int] = 1024
+DEFAULT_INFER_SCHEMA_LENGTH: Final[int] = 1000
+
+# Codecs polars decompresses by itself; anything else is decompressed by open_for_read.
+_POLARS_NATIVE_COMPRESSIONS: Final[frozenset[str]] = frozenset({'gzip', 'zstd'})
+
+
+def detect_columnar_format(path: str | Path) -> ColumnarFormat:
+    """Detect the columnar format from a file extension.
+
+    Args:
+        path: File path with a ``.parquet``, ``.arrow``, ``.ipc`` or ``.feather`` extension
+
+    Returns:
+        Columnar format for the extension
+
+    Raises:
+        ValueError: If the extension is not a columnar format
+
+    """
+    suffix = Path(path).suffix.lstrip('.')
+    format_type = COLUMNAR_EXTENSIONS.get(suffix.lower())
+    if format_type is None:
+        supported = ', '.join(COLUMNAR_EXTENSIONS.keys())
+        msg = f'Unsupported columnar extension: .{suffix}. Supported extensions: {supported}'
+        raise ValueError(msg)
+    return format_type
+
+
+@contextmanager
+def _open_ndjson_source(path: Path) -> Iterator[Path | IO[bytes]]:
+    """Yield something ``pl.scan_ndjson`` can read, decompressing codecs polars lacks."""
+    compression = detect_compression(path)
+    if compression is None or compression in _POLARS_NATIVE_COMPRESSIONS:
+        yield path
+        return
+    with open_for_read(path, mode='rb') as fin:
+        yield fin
+
+
+@contextmanager
+def _temporary_target(target: Path) -> Iterator[Path]:
+    """Yield a fresh path next to ``target`` and rename it over ``target`` if the block succeeds."""
+    tmp_path = target.with_name(f'.{target.name}.{secrets.token_hex(8)}.tmp')
+    # O_EXCL reserves the name, so concurrent conversions of the same target never share a temp file.
+    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        yield tmp_path
+        tmp_path.replace(target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def convert_jsonlines(  # noqa: PLR0913
+    source: str | Path,
+    target: str | Path,
+    *,
+    schema: pl.Schema | dict[str, pl.DataType] | None = None,
+    infer_schema_length: int | None = DEFAULT_INFER_SCHEMA_LENGTH,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: ColumnarCompression = 'zstd',
+    parents: bool = True,
+    exist_ok: bool = True,
+) -> Path:
+    """Stream a JSON Lines file into a Parquet or Arrow IPC file.
+
+    Args:
+        source: Path to the JSON Lines file (may be compressed)
+        target: Output path; the extension selects Parquet or Arrow IPC
+        schema: Column types to use instead of inferring them
+        infer_schema_length: Number of records used to infer the schema
+            (None scans the whole file)
+        batch_size: Number of records parsed per batch
+        compression: Codec applied to the columnar file
+        parents: If True, create parent directories as needed
+        exist_ok: If True, don't raise error if directory exists
+
+    Returns:
+        Path of the written file
+
+    Raises:
+        ValueError: If the target extension is not a columnar format
+
+    Example:
+        >>> convert_jsonlines('crawl.jsonl.gz', 'crawl.parquet')
+        PosixPath('crawl.parquet')
+
+    """
+    source_path = Path(source)
+    target_path = Path(target)
+    format_type = detect_columnar_format(target_path)
+    target_path.parent.mkdir(parents=parents, exist_ok=exist_ok)
+
+    with _open_ndjson_source(source_path) as ndjson, _temporary_target(target_path) as tmp_path:
+        frame = pl.scan_ndjson(ndjson, schema=schema, infer_schema_length=infer_schema_length, batch_size=batch_size)
+        if format_type == 'parquet':
+            frame.sink_parquet(tmp_path, compression=compression)
+        else:
+            frame.sink_ipc(tmp_path, compression=compression)
+    return target_path
+
+
+def default_columnar_path(source: str | Path, format_type: ColumnarFormat = 'parquet') -> Path:
+    """Return the columnar sibling of a JSON Lines file (``data.jsonl.gz`` -> ``data.parquet``)."""
+    extension = 'parquet' if format_type == 'parquet' else 'arrow'
+    return strip_compression_suffix(source).with_suffix(f'.{extension}')
+
+
+def ensure_columnar(
+    source: str | Path,
+    target: str | Path | None = None,
+    format_type: ColumnarFormat = 'parquet',
+) -> Path:
+    """Convert a JSON Lines file only if its columnar copy is missing or older.
+
+    Args:
+        source: Path to the JSON Lines file
+        target: Path of the columnar copy (default: :func:`default_columnar_path`)
+        format_type: Format used when ``target`` is not given
+
+    Returns:
+        Path of the up-to-date columnar copy
+
+    """
+    source_path = Path(source)
+    target_path = Path(target) if target is not None else default_columnar_path(source_path, format_type)
+    if not target_path.exists() or target_path.stat().st_mtime_ns < source_path.stat().st_mtime_ns:
+        convert_jsonlines(source_path, target_path)
+    return target_path
+
+
+def scan_columnar(path: str | Path) -> pl.LazyFrame:
+    """Lazily scan a Parquet or Arrow IPC file.
+
+    Args:
+        path: Path to the columnar file
+
+    Returns:
+        LazyFrame over the file; projections and filters applied to it are
+        pushed down into the reader
+
+    Raises:
+        ValueError: If the extension is not a columnar format
+
+    """
+    if detect_columnar_format(path) == 'parquet':
+        return pl.scan_parquet(path)
+    return pl.scan_ipc(path)
+
+
+def load_columnar(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    predicate: pl.Expr | None = None,
+) -> pl.DataFrame:
+    """Load a Parquet or Arrow IPC file, reading only the requested columns and rows.
+
+    Args:
+        path: Path to the columnar file
+        columns: Columns to return (default: all columns)
+        predicate: Filter expression pushed down into the reader
+
+    Returns:
+        DataFrame with the selected columns of the matching rows
+
+    Example:
+        >>> frame = load_columnar('crawl.parquet', columns=['url', 'status'], predicate=pl.col('status') >= 500)
+
+    """
+    frame = scan_columnar(path)
+    if predicate is not None:
+        frame = frame.filter(predicate)
+    if columns is not None:
+        frame = frame.select(columns)
+    return frame.collect()
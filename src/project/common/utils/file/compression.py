@@ -0,0 +1,120 @@
+"""Streaming compression codecs detected from compound file extensions.
+
+A trailing ``.gz``, ``.xz`` or ``.zst`` suffix marks a compressed file, and
+the suffix before it determines the file format (``data.jsonl.gz``,
+``config.yaml.zst``). gzip and xz use the standard library. zstd uses the
+standard library ``compression.zstd`` module when it exists (Python 3.14+)
+and the ``zstandard`` package otherwise.
+"""
+
+import gzip
+import importlib
+import importlib.util
+import io
+import lzma
+from pathlib import Path
+from typing import IO, Final, Literal, cast
+
+Compression = Literal['gzip', 'xz', 'zstd']
+
+COMPRESSION_EXTENSIONS: Final[dict[str, Compression]] = {
+    'gz': 'gzip',
+    'xz': 'xz',
+    'zst': 'zstd',
+}
+
+
+def detect_compression(path: str | Path) -> Compression | None:
+    """Return the compression codec implied by the last suffix of a path, if any."""
+    return COMPRESSION_EXTENSIONS.get(Path(path).suffix.lstrip('.').lower())
+
+
+def strip_compression_suffix(path: str | Path) -> Path:
+    """Return the path without its compression suffix (``data.jsonl.gz`` -> ``data.jsonl``)."""
+    target = Path(path)
+    return target.with_suffix('') if detect_compression(target) is not None else target
+
+
+def _zstd_stdlib() -> object | None:
+    """Return the standard library zstd module when running on Python 3.14+."""
+    if importlib.util.find_spec('compression') is None or importlib.util.find_spec('compression.zstd') is None:
+        return None
+    return importlib.import_module('compression.zstd')
+
+
+def _zstandard() -> object:
+    try:
+        return importlib.import_module('zstandard')
+    except ImportError as exc:
+        msg = 'zstd compression requires Python 3.14+ or the zstandard package (pip install zstandard)'
+        raise ImportError(msg) from exc
+
+
+def available_compressions() -> list[Compression]:
+    """Return the codecs usable in this environment (zstd needs Python 3.14+ or zstandard)."""
+    codecs: list[Compression] = ['gzip', 'xz']
+    if _zstd_stdlib() is not None or importlib.util.find_spec('zstandard') is not None:
+        codecs.append('zstd')
+    return codecs
+
+
+def wrap_reader(raw: IO[bytes], compression: Compression) -> IO[bytes]:
+    """Wrap a binary stream so that reads return decompressed bytes.
+
+    Concatenated members/frames are read through, as the command-line tools do.
+    Closing the wrapper does not close ``raw``.
+    """
+    if compression == 'gzip':
+        return cast('IO[bytes]', gzip.GzipFile(fileobj=raw, mode='rb'))
+    if compression == 'xz':
+        return lzma.LZMAFile(raw, mode='rb')
+
+    zstd = _zstd_stdlib()
+    if zstd is not None:
+        return zstd.ZstdFile(raw, mode='rb')  # type: ignore[attr-defined]
+    reader = _zstandard().ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=False)  # type: ignore[attr-defined]
+    return io.BufferedReader(reader)
+
+
+def wrap_writer(raw: IO[bytes], compression: Compression, level: int | None = None) -> IO[bytes]:
+    """Wrap a binary stream so that writes are compressed.
+
+    The compressed trailer is written when the wrapper is closed. Closing the
+    wrapper does not close ``raw``.
+
+    Args:
+        raw: Binary stream receiving compressed bytes
+        compression: Codec to use
+        level: Compression level (gzip 0-9, xz preset 0-9, zstd 1-22);
+            None uses the codec's default
+
+    """
+    if compression == 'gzip':
+        # An empty name and mtime=0 keep the header, and so the output, identical for identical input.
+        return cast(
+            'IO[bytes]',
+            gzip.GzipFile(filename='', fileobj=raw, mode='wb', compresslevel=9 if level is None else level, mtime=0),
+        )
+    if compression == 'xz':
+        return lzma.LZMAFile(raw, mode='wb', preset=level)
+
+    zstd = _zstd_stdlib()
+    if zstd is not None:
+        return zstd.ZstdFile(raw, mode='wb', level=level)  # type: ignore[attr-defined]
+    zstandard = _zstandard()
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)  # type: ignore[attr-defined]
+    return compressor.stream_writer(raw, closefd=False)
+
+
+def compress_bytes(data: bytes, compression: Compression, level: int | None = None) -> bytes:
+    """Compress an in-memory payload with the same framing as :func:`wrap_writer`."""
+    buffer = io.BytesIO()
+    with wrap_writer(buffer, compression, level=level) as fout:
+        fout.write(data)
+    return buffer.getvalue()
+
+
+def decompress_bytes(data: bytes, compression: Compression) -> bytes:
+    """Decompress an in-memory payload produced by any compliant encoder."""
+    with wrap_reader(io.BytesIO(data), compression) as fin:
+        return fin.read()
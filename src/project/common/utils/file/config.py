@@ -1,14 +1,17 @@
 from pathlib import Path
 from typing import Any
 
+from project.common.utils.file.cache import load_file_cached
 from project.common.utils.file.io import load_file
 
 
-def load_config(path: str | Path) -> dict[str, Any]:
+def load_config(path: str | Path, *, use_cache: bool = False) -> dict[str, Any]:
     """Load configuration from a file (JSON, YAML, TOML, XML).
 
     Args:
         path: Path to the configuration file. Format is detected from extension.
+        use_cache: If True, serve a copy of the parsed file from the shared
+            cache, re-parsing only when the file's mtime or size changes.
 
     Returns:
         Configuration data as a dictionary.
@@ -18,7 +21,7 @@ def load_config(path: str | Path) -> dict[str, Any]:
         TypeError: If the loaded data is not a dictionary.
 
     """
-    data = load_file(path)
+    data = load_file_cached(path) if use_cache else load_file(path)
 
     if not isinstance(data, dict):
         raise TypeError(f'Config file {path!r} did not return a dict, got {type(data).__name__}')
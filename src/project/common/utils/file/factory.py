@@ -1,31 +1,124 @@
+import importlib
+import os
+import threading
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
 from typing import ClassVar, Literal
 
 from project.common.utils.file.base import FileHandler
-from project.common.utils.file.json import JsonFileHandler
-from project.common.utils.file.toml import TomlFileHandler
-from project.common.utils.file.xml import XmlFileHandler
-from project.common.utils.file.yaml import YamlFileHandler
+from project.common.utils.file.compression import COMPRESSION_EXTENSIONS
 
-FileFormat = Literal['json', 'yaml', 'toml', 'xml']
+FileFormat = Literal['json', 'yaml', 'toml', 'xml', 'msgpack']
+
+
+@cache
+def _import_handler_class(dotted_path: str) -> type[FileHandler]:
+    """Import a handler class from a ``'package.module:ClassName'`` path."""
+    module_path, _, class_name = dotted_path.partition(':')
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _split_extension(name: str) -> tuple[str, str]:
+    """Split a path string into its stem and lower-cased extension without the dot."""
+    stem, extension = os.path.splitext(name)  # noqa: PTH122
+    return stem, extension[1:].lower()
 
 
 class FileHandlerFactory:
-    """Factory for creating file handlers based on file format."""
+    """Registry of file handlers keyed by format and file extension.
+
+    Handlers are registered by dotted path (or class) and imported on first
+    use, so importing the factory does not pull in yaml, toml, ElementTree or
+    msgpack until a file of that format is actually handled. Handlers hold no
+    mutable state (their settings, such as the XML root tag, are read-only),
+    so one instance per format is created and shared by every caller, and
+    extensions are resolved through a prebuilt lookup table.
+    """
 
-    _handlers: ClassVar[dict[FileFormat, type[FileHandler]]] = {
-        'json': JsonFileHandler,
-        'yaml': YamlFileHandler,
-        'toml': TomlFileHandler,
-        'xml': XmlFileHandler,
+    _handlers: ClassVar[dict[str, str | type[FileHandler]]] = {
+        'json': 'project.common.utils.file.json:JsonFileHandler',
+        'yaml': 'project.common.utils.file.yaml:YamlFileHandler',
+        'toml': 'project.common.utils.file.toml:TomlFileHandler',
+        'xml': 'project.common.utils.file.xml:XmlFileHandler',
+        'msgpack': 'project.common.utils.file.msgpack:MsgpackFileHandler',
     }
+    _extensions: ClassVar[dict[str, str]] = {
+        'json': 'json',
+        'yaml': 'yaml',
+        'yml': 'yaml',
+        'toml': 'toml',
+        'xml': 'xml',
+        'msgpack': 'msgpack',
+        'mpk': 'msgpack',
+    }
+    _instances: ClassVar[dict[str, FileHandler]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def register(
+        cls,
+        format_type: str,
+        handler: str | type[FileHandler],
+        extensions: Iterable[str] = (),
+        *,
+        override: bool = False,
+    ) -> None:
+        """Register a handler for a format and the extensions that map to it.
+
+        Args:
+            format_type: Name of the format (for example 'csv')
+            handler: Handler class, or its ``'package.module:ClassName'`` path
+                to import it on first use
+            extensions: File extensions, without the leading dot, detected as
+                this format
+            override: If True, replace an existing format or extension mapping
+
+        Raises:
+            ValueError: If the format or an extension is already registered
+                and ``override`` is False
+
+        Example:
+            >>> FileHandlerFactory.register('csv', 'myapp.files:CsvFileHandler', extensions=['csv', 'tsv'])
+
+        """
+        normalized = [extension.lstrip('.').lower() for extension in extensions]
+        with cls._lock:
+            if not override:
+                if format_type in cls._handlers:
+                    msg = f'File format already registered: {format_type}'
+                    raise ValueError(msg)
+                taken = [extension for extension in normalized if extension in cls._extensions]
+                if taken:
+                    msg = f'File extensions already registered: {", ".join(taken)}'
+                    raise ValueError(msg)
+            cls._handlers[format_type] = handler
+            cls._extensions.update(dict.fromkeys(normalized, format_type))
+            cls._instances.pop(format_type, None)
+
+    @classmethod
+    def unregister(cls, format_type: str) -> None:
+        """Remove a format, its extensions and its cached handler instance.
+
+        Raises:
+            ValueError: If format_type is not registered
+
+        """
+        with cls._lock:
+            if cls._handlers.pop(format_type, None) is None:
+                msg = f'Unsupported file format: {format_type}'
+                raise ValueError(msg)
+            for extension in [ext for ext, fmt in cls._extensions.items() if fmt == format_type]:
+                del cls._extensions[extension]
+            cls._instances.pop(format_type, None)
 
     @classmethod
-    def create(cls, format_type: FileFormat) -> FileHandler:
-        """Create a file handler for the specified format.
+    def create(cls, format_type: FileFormat | str) -> FileHandler:
+        """Return the shared file handler for the specified format.
 
         Args:
-            format_type: File format ('json', 'yaml', or 'toml')
+            format_type: File format ('json', 'yaml', 'toml', 'xml', 'msgpack'
+                or a registered custom format)
 
         Returns:
             File handler instance for the specified format
@@ -34,48 +127,65 @@ class FileHandlerFactory:
             ValueError: If format_type is not supported
 
         """
-        handler_class = cls._handlers.get(format_type)
-        if handler_class is None:
+        handler = cls._instances.get(format_type)
+        if handler is not None:
+            return handler
+
+        registered = cls._handlers.get(format_type)
+        if registered is None:
             supported = ', '.join(cls._handlers.keys())
             msg = f'Unsupported file format: {format_type}. Supported formats: {supported}'
             raise ValueError(msg)
-        return handler_class()
+        handler_class = _import_handler_class(registered) if isinstance(registered, str) else registered
+        # Two threads may race to build the first instance; setdefault keeps exactly one of them.
+        return cls._instances.setdefault(format_type, handler_class())
 
     @classmethod
-    def from_path(cls, path: str | Path) -> FileHandler:
-        """Create a file handler by detecting format from file extension.
+    def detect_format(cls, path: str | Path) -> FileFormat | str:
+        """Detect the file format from a file extension.
+
+        A trailing compression suffix is skipped, so ``config.yaml.gz`` is
+        detected as YAML.
 
         Args:
             path: File path with extension
 
         Returns:
-            File handler instance for the detected format
+            Format type for the extension
 
         Raises:
             ValueError: If file extension is not recognized or missing
 
         """
-        suffix = Path(path).suffix.lstrip('.')
-        if not suffix:
+        stem, extension = _split_extension(os.fspath(path))
+        if extension in COMPRESSION_EXTENSIONS:
+            _, extension = _split_extension(stem)
+        format_type = cls._extensions.get(extension)
+        if format_type is not None:
+            return format_type
+
+        if not extension:
             msg = f'Cannot detect file format: no extension in {path}'
             raise ValueError(msg)
+        supported = ', '.join(cls._extensions.keys())
+        msg = f'Unsupported file extension: .{extension}. Supported extensions: {supported}'
+        raise ValueError(msg)
 
-        # Map common extensions to format types
-        extension_map: dict[str, FileFormat] = {
-            'json': 'json',
-            'yaml': 'yaml',
-            'yml': 'yaml',
-            'toml': 'toml',
-            'xml': 'xml',
-        }
-
-        format_type = extension_map.get(suffix.lower())
-        if format_type is None:
-            supported = ', '.join(extension_map.keys())
-            msg = f'Unsupported file extension: .{suffix}. Supported extensions: {supported}'
-            raise ValueError(msg)
+    @classmethod
+    def from_path(cls, path: str | Path) -> FileHandler:
+        """Return the shared file handler for the format detected from a file extension.
 
-        return cls.create(format_type)
+        Args:
+            path: File path with extension
+
+        Returns:
+            File handler instance for the detected format
+
+        Raises:
+            ValueError: If file extension is not recognized or missing
+
+        """
+        return cls.create(cls.detect_format(path))
 
 
 def get_file_handler(path: str | Path) -> FileHandler:
@@ -1,13 +1,26 @@
 """Generic file I/O operations using FileHandler abstraction.
 
 This module provides format-agnostic file operations that automatically
-detect and handle different file formats (JSON, YAML, TOML).
+detect and handle different file formats (JSON, YAML, TOML, XML, MessagePack).
 """
 
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final
 
-from project.common.utils.file.factory import get_file_handler
+from project.common.utils.executor_utils import create_process_pool
+from project.common.utils.file.factory import FileFormat, FileHandlerFactory, get_file_handler
+from project.common.utils.file.stream import WriteOptions
+
+if TYPE_CHECKING:
+    from project.common.utils.file.base import FileHandler
+
+# Formats whose parsers are pure Python and hold the GIL for most of the parse.
+CPU_HEAVY_FORMATS: Final[frozenset[FileFormat]] = frozenset({'yaml', 'xml'})
+# Below this many bytes of CPU-heavy files, process start-up costs more than it saves.
+DEFAULT_PROCESS_THRESHOLD_BYTES: Final[int] = 4 * 1024 * 1024
 
 
 def load_file(path: str | Path) -> Any:  # noqa: ANN401
@@ -38,6 +51,7 @@ def save_file(
     *,
     parents: bool = True,
     exist_ok: bool = True,
+    write_options: WriteOptions | None = None,
 ) -> None:
     """Save data to a file, automatically detecting format from extension.
 
@@ -46,6 +60,7 @@ def save_file(
         path: Path where the file should be saved (extension determines format)
         parents: If True, create parent directories as needed
         exist_ok: If True, don't raise error if directory exists
+        write_options: Atomicity and buffering options for the write
 
     Raises:
         ValueError: If file format cannot be detected or is unsupported
@@ -54,7 +69,115 @@ def save_file(
         >>> save_file({'key': 'value'}, 'output.json')
         >>> save_file(['item1', 'item2'], 'output.yaml')
         >>> save_file({'tool': {'poetry': {}}}, 'pyproject.toml')
+        >>> save_file(state, 'state.json', write_options=WriteOptions(atomic=True))
 
     """
     handler = get_file_handler(path)
-    handler.save(data, path, parents=parents, exist_ok=exist_ok)
+    handler.save(data, path, parents=parents, exist_ok=exist_ok, write_options=write_options)
+
+
+@dataclass
+class BatchLoadResult:
+    """Outcome of :func:`load_files`, keyed by the paths that were requested."""
+
+    data: dict[Path, Any] = field(default_factory=dict)
+    errors: dict[Path, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every file loaded successfully."""
+        return not self.errors
+
+
+def _load_with_format(format_type: str, path: Path) -> Any:  # noqa: ANN401
+    """Load a file in a worker process, where handlers cannot be shared with the parent."""
+    return FileHandlerFactory.create(format_type).load(path)
+
+
+def load_files(
+    paths: Iterable[str | Path],
+    max_workers: int | None = None,
+    process_workers: int | None = None,
+    process_threshold_bytes: int = DEFAULT_PROCESS_THRESHOLD_BYTES,
+) -> BatchLoadResult:
+    """Load many files concurrently, detecting each format from its extension.
+
+    Files are read and parsed on a thread pool with the factory's shared
+    handlers. When the CPU-heavy formats (YAML, XML) in the batch add up to
+    at least ``process_threshold_bytes``, those files are parsed on a process
+    pool instead so they are not serialized on the GIL. A failure in one file
+    never aborts the batch; it is recorded in ``errors`` instead.
+
+    Args:
+        paths: Paths of the files to load
+        max_workers: Size of the thread pool (default: ThreadPoolExecutor default)
+        process_workers: Size of the process pool (default: available CPUs)
+        process_threshold_bytes: Minimum total size of CPU-heavy files for
+            which a process pool is used
+
+    Returns:
+        Loaded data and per-file errors, keyed by path
+
+    Example:
+        >>> result = load_files(Path('config').glob('*.yaml'), max_workers=16)
+        >>> settings = result.data[Path('config/app.yaml')]
+        >>> failed = list(result.errors)
+
+    """
+    result = BatchLoadResult()
+    light: list[tuple[Path, FileHandler]] = []
+    heavy: list[tuple[Path, str]] = []
+    for path in dict.fromkeys(Path(p) for p in paths):
+        try:
+            format_type = FileHandlerFactory.detect_format(path)
+        except ValueError as exc:
+            result.errors[path] = exc
+            continue
+        if format_type in CPU_HEAVY_FORMATS:
+            heavy.append((path, format_type))
+        else:
+            light.append((path, FileHandlerFactory.create(format_type)))
+
+    use_processes = len(heavy) > 1 and _total_size(path for path, _ in heavy) >= process_threshold_bytes
+    process_pool = create_process_pool(process_workers) if use_processes else None
+    futures: dict[Future[Any], Path] = {}
+    try:
+        # Heavy files are submitted before the thread pool starts, so that a
+        # pool using the fork start method forks while the process has no
+        # threads of ours; forking a process that runs threads can deadlock.
+        if process_pool is not None:
+            for path, format_type in heavy:
+                futures[process_pool.submit(_load_with_format, format_type, path)] = path
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+            for path, handler in light:
+                futures[thread_pool.submit(handler.load, path)] = path
+            if process_pool is None:
+                for path, format_type in heavy:
+                    futures[thread_pool.submit(FileHandlerFactory.create(format_type).load, path)] = path
+            _collect_results(futures, result)
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=True)
+
+    return result
+
+
+def _collect_results(futures: dict[Future[Any], Path], result: BatchLoadResult) -> None:
+    """Record each future's data or error under its path as it completes."""
+    for future in as_completed(futures):
+        path = futures[future]
+        try:
+            result.data[path] = future.result()
+        except Exception as exc:  # noqa: BLE001
+            result.errors[path] = exc
+
+
+def _total_size(paths: Iterable[Path]) -> int:
+    """Return the combined size of the existing files among paths."""
+    total = 0
+    for path in paths:
+        try:
+            total += path.stat().st_size
+        except OSError:
+            continue
+    return total
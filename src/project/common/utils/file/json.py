@@ -2,12 +2,23 @@ import json
 from pathlib import Path
 from typing import Any
 
+from project.common.utils.file.json_codec import get_json_codec
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+
 JsonValue = dict[Any, Any] | list[Any] | str | int | float | bool | None
 
 
+def loads_json(data: str | bytes) -> JsonValue:
+    return get_json_codec().loads(data)
+
+
+def dumps_as_indented_json(data: JsonValue) -> bytes:
+    return json.dumps(data, ensure_ascii=False, indent=4, separators=(',', ': ')).encode('utf-8')
+
+
 def load_json(path: str | Path) -> JsonValue:
-    with Path(path).open(mode='r', encoding='utf-8') as fin:
-        return json.load(fin)
+    with open_for_read(path, mode='rb') as fin:
+        return loads_json(fin.read())
 
 
 def save_as_indented_json(
@@ -15,10 +26,13 @@ def save_as_indented_json(
     path: str | Path,
     parents: bool = True,
     exist_ok: bool = True,
+    *,
+    write_options: WriteOptions | None = None,
 ) -> None:
     target = Path(path)
     target.parent.mkdir(parents=parents, exist_ok=exist_ok)
-    with target.open(mode='w', encoding='utf-8') as fout:
+    # Fast backends only support 2-space indentation, so indented output stays on stdlib json.
+    with open_for_write(target, options=write_options) as fout:
         json.dump(data, fout, ensure_ascii=False, indent=4, separators=(',', ': '))
 
 
@@ -29,6 +43,14 @@ class JsonFileHandler:
         """Load JSON data from file."""
         return load_json(path)
 
+    def loads(self, data: str | bytes) -> JsonValue:
+        """Parse JSON data from an in-memory document."""
+        return loads_json(data)
+
+    def dumps(self, data: JsonValue) -> bytes:
+        """Serialize data as indented JSON bytes."""
+        return dumps_as_indented_json(data)
+
     def save(
         self,
         data: JsonValue,
@@ -36,6 +58,7 @@ class JsonFileHandler:
         *,
         parents: bool = True,
         exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
     ) -> None:
         """Save data as indented JSON to file."""
-        save_as_indented_json(data, path, parents=parents, exist_ok=exist_ok)
+        save_as_indented_json(data, path, parents=parents, exist_ok=exist_ok, write_options=write_options)
@@ -0,0 +1,209 @@
+"""Pluggable JSON encode/decode backends.
+
+A faster backend (orjson, then msgspec) is used when it imports cleanly and
+the stdlib ``json`` module is used otherwise. Every backend produces compact,
+non-ASCII-escaped JSON. For JSON types (dicts, lists, strings, numbers,
+booleans and None) and dataclass instances, which are encoded as objects of
+their fields, the output is byte-for-byte identical across backends except
+for float exponent formatting (``1e16`` vs ``1e+16``). Other types are not
+portable: the stdlib codec raises ``TypeError`` for them, orjson also encodes
+``UUID`` and ``Enum`` values, and msgspec also encodes ``bytes`` (as base64),
+``date``/``datetime``/``time``, ``UUID`` and ``Enum`` values. Convert such
+values to JSON types before saving data that must load with any backend.
+
+Values a fast backend cannot handle fall back to the stdlib codec. orjson
+would decode integers outside the 64-bit range as floats, so documents with a
+run of 19 or more digits are decoded by the stdlib codec instead. The fast
+encoders would write non-finite floats as ``null``; whenever their output
+contains ``null`` the input is checked for such floats and re-encoded by the
+stdlib codec, which writes ``NaN``/``Infinity`` like ``json.dumps``. Decode
+errors always surface as ``json.JSONDecodeError``.
+"""
+
+import dataclasses
+import importlib
+import json
+import math
+from functools import cache
+from typing import Any, Final, Literal, Protocol, get_args
+
+JsonBackend = Literal['orjson', 'msgspec', 'stdlib']
+
+_BACKEND_PREFERENCE: Final[tuple[JsonBackend, ...]] = get_args(JsonBackend)
+
+# Integers that may not fit in 64 bits; orjson decodes them as floats instead of raising. Mapping
+# every digit to '0' and everything else to '.' turns the search into a substring test, which is
+# several times faster than a regular expression.
+_DIGIT_MASK: Final[bytes] = bytes(ord('0') if chr(byte) in '0123456789' else ord('.') for byte in range(256))
+_LONG_DIGIT_RUN: Final[bytes] = b'0' * 19
+
+
+class JsonCodec(Protocol):
+    """Protocol for a JSON backend that encodes to and decodes from a single line."""
+
+    name: JsonBackend
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        ...
+
+    def dumps(self, data: Any) -> str:  # noqa: ANN401
+        """Encode data as compact JSON without escaping non-ASCII characters."""
+        ...
+
+
+def _encode_dataclass(obj: object) -> dict[str, Any]:
+    """Encode dataclass instances for ``json.dumps`` the way orjson and msgspec do."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _has_non_finite_float(data: Any) -> bool:  # noqa: ANN401
+    """Return True if data contains a NaN or infinite float, at any depth."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            stack.extend(getattr(value, field.name) for field in dataclasses.fields(value))
+    return False
+
+
+def _has_long_digits(data: str | bytes) -> bool:
+    """Return True if data has a run of digits that may be an integer wider than 64 bits."""
+    raw = data.encode('utf-8') if isinstance(data, str) else data
+    return _LONG_DIGIT_RUN in raw.translate(_DIGIT_MASK)
+
+
+class StdlibJsonCodec:
+    """JSON codec backed by the standard library ``json`` module."""
+
+    name: JsonBackend = 'stdlib'
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, data: Any) -> str:  # noqa: ANN401
+        """Encode data as compact JSON without escaping non-ASCII characters."""
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_encode_dataclass)
+
+
+class OrjsonCodec:
+    """JSON codec backed by ``orjson``."""
+
+    name: JsonBackend = 'orjson'
+
+    def __init__(self) -> None:
+        self._orjson = importlib.import_module('orjson')
+        # Dates go to the default hook, which rejects them like json.dumps does.
+        self._options = (
+            self._orjson.OPT_NON_STR_KEYS
+            | self._orjson.OPT_PASSTHROUGH_DATETIME
+            | self._orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        self._fallback = StdlibJsonCodec()
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        if _has_long_digits(data):
+            return self._fallback.loads(data)
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+    def dumps(self, data: Any) -> str:  # noqa: ANN401
+        """Encode data as compact JSON without escaping non-ASCII characters."""
+        try:
+            encoded = self._orjson.dumps(data, default=_encode_dataclass, option=self._options)
+        except TypeError:
+            return self._fallback.dumps(data)
+        if b'null' in encoded and _has_non_finite_float(data):
+            return self._fallback.dumps(data)
+        return encoded.decode('utf-8')
+
+
+class MsgspecCodec:
+    """JSON codec backed by ``msgspec.json``."""
+
+    name: JsonBackend = 'msgspec'
+
+    def __init__(self) -> None:
+        msgspec = importlib.import_module('msgspec')
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._encode_errors: tuple[type[Exception], ...] = (TypeError, msgspec.EncodeError)
+        self._fallback = StdlibJsonCodec()
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+    def dumps(self, data: Any) -> str:  # noqa: ANN401
+        """Encode data as compact JSON without escaping non-ASCII characters."""
+        try:
+            encoded = self._encoder.encode(data)
+        except self._encode_errors:
+            return self._fallback.dumps(data)
+        if b'null' in encoded and _has_non_finite_float(data):
+            return self._fallback.dumps(data)
+        return encoded.decode('utf-8')
+
+
+_CODECS: Final[dict[JsonBackend, type[JsonCodec]]] = {
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+    'stdlib': StdlibJsonCodec,
+}
+
+
+def _importable(name: str) -> bool:
+    """Return True if the module imports, not merely if it can be found."""
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+def available_json_backends() -> list[JsonBackend]:
+    """Return the JSON backends that import cleanly, in order of preference."""
+    return [name for name in _BACKEND_PREFERENCE if name == 'stdlib' or _importable(name)]
+
+
+@cache
+def get_json_codec(backend: JsonBackend | None = None) -> JsonCodec:
+    """Return a JSON codec, picking the fastest installed backend by default.
+
+    Args:
+        backend: Backend to use. If None, the first available of orjson,
+            msgspec and stdlib is selected.
+
+    Returns:
+        Shared codec instance for the backend
+
+    Raises:
+        ValueError: If backend is not a known backend name
+        ImportError: If the requested backend is not installed
+
+    """
+    if backend is None:
+        backend = available_json_backends()[0]
+
+    codec_class = _CODECS.get(backend)
+    if codec_class is None:
+        supported = ', '.join(_CODECS.keys())
+        msg = f'Unsupported JSON backend: {backend}. Supported backends: {supported}'
+        raise ValueError(msg)
+    return codec_class()
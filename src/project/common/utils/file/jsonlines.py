@@ -1,21 +1,213 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from functools import partial
 from pathlib import Path
 
 import jsonlines
+from more_itertools import chunked
+
+from project.common.utils.executor_utils import create_process_pool
+from project.common.utils.file.compression import detect_compression
+from project.common.utils.file.json_codec import get_json_codec
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_SHARD_SIZE = 32 * 1024 * 1024
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def iter_jsonlines(path: str | Path) -> Iterator[dict[str, object]]:
+    """Lazily yield records from a JSON Lines file one line at a time.
+
+    Only the current line is held in memory, so peak memory stays flat
+    regardless of the file size.
+
+    Args:
+        path: Path to the JSON Lines file
+
+    Yields:
+        Each record in file order
+
+    """
+    with (
+        open_for_read(path, encoding='utf-8-sig') as fin,
+        jsonlines.Reader(fin, loads=get_json_codec().loads) as reader,
+    ):
+        for entry in reader:
+            yield dict(entry)
 
 
 def load_jsonlines(path: str | Path) -> list[dict[str, object]]:
-    with jsonlines.open(str(Path(path))) as reader:
-        return [dict(entry) for entry in reader]
+    return list(iter_jsonlines(path))
+
+
+def _iter_shard_ranges(path: Path, shard_size: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` byte ranges that each end just after a newline."""
+    size = path.stat().st_size
+    with path.open(mode='rb') as fin:
+        start = 0
+        while start < size:
+            fin.seek(min(start + shard_size, size))
+            fin.readline()
+            end = min(fin.tell(), size)
+            yield start, end
+            start = end
+
+
+def decode_jsonlines_chunk(chunk: bytes) -> list[dict[str, object]]:
+    """Decode every non-blank line of an in-memory block of complete JSON Lines."""
+    chunk = chunk.removeprefix(_UTF8_BOM)
+    loads = get_json_codec().loads
+    return [dict(loads(line)) for line in chunk.splitlines() if line.strip()]
+
+
+def encode_jsonlines_chunk(records: Iterable[dict[str, object]]) -> bytes:
+    """Encode records as a block of JSON Lines, each terminated by a newline."""
+    dumps = get_json_codec().dumps
+    return ''.join(f'{dumps(record)}\n' for record in records).encode('utf-8')
+
+
+def _decode_shard(path: str, start: int, end: int) -> list[dict[str, object]]:
+    """Decode every non-blank line inside a byte range of a JSON Lines file."""
+    with Path(path).open(mode='rb') as fin:
+        fin.seek(start)
+        return decode_jsonlines_chunk(fin.read(end - start))
+
+
+def _iter_decompressed_blocks(path: Path, block_size: int) -> Iterator[bytes]:
+    """Yield blocks of complete lines from a compressed file, decompressing as it streams."""
+    pending = b''
+    with open_for_read(path, mode='rb') as fin:
+        while block := fin.read(block_size):
+            complete, newline, pending = (pending + block).rpartition(b'\n')
+            if newline:
+                yield complete
+    if pending.strip():
+        yield pending
+
+
+def _iter_shard_tasks(path: Path, shard_size: int) -> Iterator[Callable[[], list[dict[str, object]]]]:
+    """Yield picklable decode tasks, one per shard of the file."""
+    if detect_compression(path) is None:
+        for start, end in _iter_shard_ranges(path, shard_size):
+            yield partial(_decode_shard, str(path), start, end)
+        return
+    # A compressed stream cannot be seeked into, so the parent decompresses and ships each block instead.
+    for block in _iter_decompressed_blocks(path, shard_size):
+        yield partial(decode_jsonlines_chunk, block)
 
 
-def save_as_jsonlines(
-    data: list[dict[str, object]],
+def iter_jsonlines_parallel(
+    path: str | Path,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Iterator[dict[str, object]]:
+    """Decode a JSON Lines file in newline-aligned shards on a process pool.
+
+    The file is split into byte ranges of roughly ``shard_size`` bytes, each
+    extended to the next newline, and every range is decoded in a worker
+    process. At most two shards per worker are in flight at a time, so memory
+    is bounded by the shard size rather than the file size.
+
+    Compressed files cannot be split by byte offset. They are decompressed as
+    a stream in this process and the decompressed shards are sent to the
+    workers, so only JSON decoding runs in parallel.
+
+    Args:
+        path: Path to the JSON Lines file
+        max_workers: Number of worker processes (default: available CPUs)
+        ordered: If True, yield records in file order; otherwise yield each
+            shard as soon as it is decoded
+        shard_size: Approximate number of bytes decoded per task
+
+    Yields:
+        Decoded records
+
+    """
+    if shard_size < 1:
+        raise ValueError(f'shard_size must be positive, got {shard_size}')
+
+    source = Path(path)
+    workers = max_workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    shard_tasks = _iter_shard_tasks(source, shard_size)
+
+    executor = create_process_pool(workers)
+    try:
+        pending: deque[Future[list[dict[str, object]]]] = deque()
+        for task in shard_tasks:
+            pending.append(executor.submit(task))
+            if len(pending) >= max_pending:
+                yield from _drain_shards(pending, ordered=ordered)
+        while pending:
+            yield from _drain_shards(pending, ordered=ordered)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _drain_shards(pending: deque[Future[list[dict[str, object]]]], ordered: bool) -> Iterator[dict[str, object]]:
+    """Yield records from the oldest pending shard, or from every finished shard when unordered."""
+    if ordered:
+        yield from pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
+
+
+def load_jsonlines_parallel(
+    path: str | Path,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> list[dict[str, object]]:
+    """Load a JSON Lines file by decoding its shards on a process pool.
+
+    See :func:`iter_jsonlines_parallel` for the meaning of the arguments.
+    """
+    return list(iter_jsonlines_parallel(path, max_workers=max_workers, ordered=ordered, shard_size=shard_size))
+
+
+def save_as_jsonlines(  # noqa: PLR0913
+    data: Iterable[dict[str, object]],
     path: str | Path,
     parents: bool = True,
     exist_ok: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    write_options: WriteOptions | None = None,
 ) -> None:
+    """Stream records from any iterable into a JSON Lines file.
+
+    Records are consumed lazily and the file is flushed every ``chunk_size``
+    records, so generators of arbitrary length can be written without
+    materializing them. Each record is written as compact JSON by the
+    active JSON codec backend.
+
+    Args:
+        data: Iterable of records to write
+        path: Path where the file should be saved
+        parents: If True, create parent directories as needed
+        exist_ok: If True, don't raise error if directory exists
+        chunk_size: Number of records written between flushes
+        write_options: Atomicity and buffering options for the write
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+
     target = Path(path)
     target.parent.mkdir(parents=parents, exist_ok=exist_ok)
-    with jsonlines.open(str(target), mode='w') as writer:
-        for datum in data:
-            writer.write(datum)
+    with (
+        open_for_write(target, options=write_options) as fout,
+        jsonlines.Writer(fout, dumps=get_json_codec().dumps) as writer,
+    ):
+        for chunk in chunked(data, chunk_size):
+            writer.write_all(chunk)
+            fout.flush()
@@ -0,0 +1,190 @@
+"""Random access to JSON Lines records through a byte-offset sidecar index.
+
+The index is stored next to the data file as ``<name>.idx``: a fixed header
+recording the data file's size and mtime, followed by one little-endian
+``uint64`` byte offset per record. Both files are memory-mapped, so looking up
+record N costs a single seek regardless of the file size.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Final, Self
+
+from project.common.utils.file.compression import detect_compression
+from project.common.utils.file.json_codec import get_json_codec
+from project.common.utils.file.stream import WriteOptions, open_for_write
+
+INDEX_SUFFIX: Final[str] = '.idx'
+
+_MAGIC: Final[bytes] = b'JSONLIX1'
+_HEADER: Final[struct.Struct] = struct.Struct('<8sQqQ')
+_OFFSET: Final[struct.Struct] = struct.Struct('<Q')
+_UTF8_BOM: Final[bytes] = b'\xef\xbb\xbf'
+_FLUSH_EVERY: Final[int] = 1 << 16
+# The index can always be rebuilt from the data file, so it is not worth an fsync.
+_INDEX_WRITE_OPTIONS: Final[WriteOptions] = WriteOptions(atomic=True, fsync=False)
+
+
+def default_index_path(path: str | Path) -> Path:
+    """Return the sidecar index path for a JSON Lines file."""
+    source = Path(path)
+    return source.with_name(source.name + INDEX_SUFFIX)
+
+
+def _write_offsets(fout: IO[bytes], offsets: array) -> None:
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+    offsets.tofile(fout)
+
+
+def build_jsonlines_index(path: str | Path, index_path: str | Path | None = None) -> Path:
+    """Scan a JSON Lines file and write the byte offset of every record.
+
+    Blank lines are skipped, so index ``i`` always refers to the ``i``-th
+    record in the file.
+
+    Args:
+        path: Path to the JSON Lines file
+        index_path: Where to write the index (default: ``<path>.idx``)
+
+    Returns:
+        Path of the written index file
+
+    Raises:
+        ValueError: If the file is compressed, since offsets into a compressed stream cannot be seeked
+
+    """
+    source = Path(path)
+    if detect_compression(source) is not None:
+        msg = f'Cannot index a compressed JSON Lines file: {source}'
+        raise ValueError(msg)
+    target = Path(index_path) if index_path is not None else default_index_path(source)
+    stat = source.stat()
+
+    # Built into a uniquely named temporary file and swapped in, so readers that have the
+    # old index mapped are unaffected and concurrent rebuilds never write to the same file.
+    count = 0
+    with source.open(mode='rb') as fin, open_for_write(target, mode='wb', options=_INDEX_WRITE_OPTIONS) as fout:
+        fout.write(_HEADER.pack(_MAGIC, 0, 0, 0))
+        offsets = array('Q')
+        position = 0
+        for line in fin:
+            start = position
+            if start == 0 and line.startswith(_UTF8_BOM):
+                start = len(_UTF8_BOM)
+            position += len(line)
+            if not line.strip():
+                continue
+            offsets.append(start)
+            if len(offsets) >= _FLUSH_EVERY:
+                count += len(offsets)
+                _write_offsets(fout, offsets)
+                offsets = array('Q')
+        count += len(offsets)
+        _write_offsets(fout, offsets)
+        fout.seek(0)
+        fout.write(_HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns, count))
+    return target
+
+
+def _is_index_fresh(source: Path, index_path: Path) -> bool:
+    """Return True if the index header matches the data file's size and mtime."""
+    try:
+        with index_path.open(mode='rb') as fin:
+            header = fin.read(_HEADER.size)
+        index_size = index_path.stat().st_size
+    except FileNotFoundError:
+        return False
+    if len(header) < _HEADER.size:
+        return False
+
+    magic, size, mtime_ns, count = _HEADER.unpack(header)
+    stat = source.stat()
+    return (
+        magic == _MAGIC
+        and size == stat.st_size
+        and mtime_ns == stat.st_mtime_ns
+        and index_size == _HEADER.size + count * _OFFSET.size
+    )
+
+
+class IndexedJsonlinesReader:
+    """Memory-mapped reader that decodes only the requested JSON Lines records.
+
+    The sidecar index is rebuilt automatically when it is missing or when the
+    data file's size or mtime no longer match the values recorded in it.
+
+    Example:
+        >>> with IndexedJsonlinesReader('crawl.jsonl') as reader:
+        ...     record = reader[1_000_000]
+        ...     batch = reader.get_many([5, 42, 7])
+
+    """
+
+    def __init__(self, path: str | Path, index_path: str | Path | None = None) -> None:
+        """Open the data file and its index, rebuilding the index if it is stale.
+
+        Args:
+            path: Path to the JSON Lines file
+            index_path: Path of the sidecar index (default: ``<path>.idx``)
+
+        """
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path is not None else default_index_path(self.path)
+        if not _is_index_fresh(self.path, self.index_path):
+            build_jsonlines_index(self.path, self.index_path)
+
+        self._loads = get_json_codec().loads
+        self._data_mm: mmap.mmap | None = None
+        self._index_mm: mmap.mmap | None = None
+        with self.index_path.open(mode='rb') as fin:
+            *_, self._count = _HEADER.unpack(fin.read(_HEADER.size))
+            if self._count:
+                self._index_mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._count:
+            with self.path.open(mode='rb') as fin:
+                self._data_mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> dict[str, object]:
+        """Decode the record at ``position`` (negative positions count from the end)."""
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count or self._data_mm is None or self._index_mm is None:
+            raise IndexError(f'record index out of range: {position}')
+
+        (start,) = _OFFSET.unpack_from(self._index_mm, _HEADER.size + position * _OFFSET.size)
+        end = self._data_mm.find(b'\n', start)
+        if end == -1:
+            end = len(self._data_mm)
+        return dict(self._loads(self._data_mm[start:end]))
+
+    def get_many(self, positions: Iterable[int]) -> list[dict[str, object]]:
+        """Decode the records at the given positions, preserving their order."""
+        return [self[position] for position in positions]
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        for mapped in (self._data_mm, self._index_mm):
+            if mapped is not None:
+                mapped.close()
+        self._data_mm = None
+        self._index_mm = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
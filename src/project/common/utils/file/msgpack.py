@@ -0,0 +1,135 @@
+"""MessagePack file handler backed by the optional ``msgpack`` package.
+
+MessagePack is a compact binary encoding of the JSON data model that also
+round-trips ``bytes``. Besides whole-document load/save, records can be
+streamed: a record file is simply a concatenation of MessagePack objects, read
+back one object at a time without loading the whole file.
+"""
+
+import importlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from more_itertools import chunked
+
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_READ_SIZE = 1024 * 1024
+
+
+def _msgpack() -> ModuleType:
+    try:
+        return importlib.import_module('msgpack')
+    except ImportError as exc:
+        msg = 'MessagePack support requires the msgpack package (pip install msgpack)'
+        raise ImportError(msg) from exc
+
+
+def loads_msgpack(data: str | bytes) -> Any:  # noqa: ANN401
+    if isinstance(data, str):
+        msg = 'MessagePack is a binary format; pass bytes, not str'
+        raise TypeError(msg)
+    return _msgpack().unpackb(data, raw=False, strict_map_key=False)
+
+
+def dumps_as_msgpack(data: Any) -> bytes:  # noqa: ANN401
+    return _msgpack().packb(data, use_bin_type=True)
+
+
+def load_msgpack(path: str | Path) -> Any:  # noqa: ANN401
+    with open_for_read(path, mode='rb') as fin:
+        return loads_msgpack(fin.read())
+
+
+def save_as_msgpack(
+    data: Any,  # noqa: ANN401
+    path: str | Path,
+    parents: bool = True,
+    exist_ok: bool = True,
+    *,
+    write_options: WriteOptions | None = None,
+) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=parents, exist_ok=exist_ok)
+    with open_for_write(target, mode='wb', options=write_options) as fout:
+        fout.write(dumps_as_msgpack(data))
+
+
+def iter_msgpack_records(path: str | Path) -> Iterator[Any]:
+    """Lazily yield the objects of a MessagePack record file one at a time.
+
+    The file is read in fixed-size blocks, so memory stays bounded by the block
+    size plus the largest single record.
+
+    Args:
+        path: Path to the record file
+
+    Yields:
+        Each record in file order
+
+    """
+    with open_for_read(path, mode='rb') as fin:
+        yield from _msgpack().Unpacker(fin, raw=False, strict_map_key=False, read_size=_READ_SIZE)
+
+
+def save_as_msgpack_records(  # noqa: PLR0913
+    data: Iterable[Any],
+    path: str | Path,
+    parents: bool = True,
+    exist_ok: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    write_options: WriteOptions | None = None,
+) -> None:
+    """Stream records into a MessagePack record file, one packed object per record.
+
+    Args:
+        data: Records to write (any iterable, consumed lazily)
+        path: Path where the file should be saved
+        parents: If True, create parent directories as needed
+        exist_ok: If True, don't raise error if directory exists
+        chunk_size: Number of records packed and written per block
+        write_options: Atomicity, buffering and compression options for the write
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+
+    target = Path(path)
+    target.parent.mkdir(parents=parents, exist_ok=exist_ok)
+    packer = _msgpack().Packer(use_bin_type=True)
+    with open_for_write(target, mode='wb', options=write_options) as fout:
+        for chunk in chunked(data, chunk_size):
+            fout.write(b''.join(packer.pack(record) for record in chunk))
+
+
+class MsgpackFileHandler:
+    """MessagePack file handler implementing FileHandler protocol."""
+
+    def load(self, path: str | Path) -> Any:  # noqa: ANN401
+        """Load MessagePack data from file."""
+        return load_msgpack(path)
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Parse MessagePack data from an in-memory document."""
+        return loads_msgpack(data)
+
+    def dumps(self, data: Any) -> bytes:  # noqa: ANN401
+        """Serialize data as MessagePack bytes."""
+        return dumps_as_msgpack(data)
+
+    def save(
+        self,
+        data: Any,  # noqa: ANN401
+        path: str | Path,
+        *,
+        parents: bool = True,
+        exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
+    ) -> None:
+        """Save data as MessagePack to file."""
+        save_as_msgpack(data, path, parents=parents, exist_ok=exist_ok, write_options=write_options)
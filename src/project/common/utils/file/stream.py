@@ -0,0 +1,160 @@
+"""Shared helpers for opening files that the format handlers read and write.
+
+Writes are either direct (the default) or atomic. In atomic mode the data goes
+to a temporary file in the target directory, which is flushed, optionally
+fsynced and then renamed over the target. A concurrent reader therefore sees
+either the old or the new file, never a partial one, and a crash leaves the
+previous contents intact.
+
+Both directions compress transparently when the path ends in a compression
+suffix (``.gz``, ``.xz``, ``.zst``), streaming through the codec so the
+uncompressed payload is never held in memory as a whole.
+"""
+
+import io
+import os
+import secrets
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from project.common.utils.file.compression import Compression, detect_compression, wrap_reader, wrap_writer
+
+ReadMode = Literal['r', 'rb']
+WriteMode = Literal['w', 'wb']
+
+
+@dataclass(frozen=True)
+class WriteOptions:
+    """Options controlling how a save function writes its target file.
+
+    Attributes:
+        atomic: Write to a temporary file and rename it over the target
+        buffer_size: Buffer size passed to ``open`` (-1 uses the default)
+        fsync: In atomic mode, fsync the file and its directory so the new
+            contents survive a crash; disable for throughput over durability
+        compression_level: Level for compressed targets (None uses the codec's default)
+
+    """
+
+    atomic: bool = False
+    buffer_size: int = -1
+    fsync: bool = True
+    compression_level: int | None = None
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by fsyncing the directory that contains it."""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def open_for_read(path: str | Path, mode: ReadMode = 'r', encoding: str = 'utf-8') -> Iterator[IO[Any]]:
+    """Open a file for reading, decompressing it if its suffix names a codec.
+
+    Args:
+        path: Path of the file to read
+        mode: 'r' for text or 'rb' for binary
+        encoding: Text encoding used in 'r' mode
+
+    Yields:
+        Readable file object over the decompressed contents
+
+    """
+    target = Path(path)
+    compression = detect_compression(target)
+    if compression is None:
+        with target.open(mode=mode, encoding=None if 'b' in mode else encoding) as fin:
+            yield fin
+        return
+
+    with target.open(mode='rb') as raw, wrap_reader(raw, compression) as stream:
+        if 'b' in mode:
+            yield stream
+            return
+        with io.TextIOWrapper(stream, encoding=encoding) as fin:
+            yield fin
+
+
+@contextmanager
+def _compressed_layer(
+    raw: IO[bytes],
+    mode: WriteMode,
+    compression: Compression | None,
+    level: int | None,
+) -> Iterator[IO[Any]]:
+    """Stack the compressor and, in text mode, a UTF-8 encoder on a raw binary stream.
+
+    The layers are closed on exit, which writes the compressed trailer but leaves ``raw`` open.
+    """
+    if compression is None:
+        yield raw
+        return
+    stream: IO[Any] = wrap_writer(raw, compression, level=level)
+    if 'b' not in mode:
+        stream = io.TextIOWrapper(stream, encoding='utf-8')
+    with stream:
+        yield stream
+
+
+@contextmanager
+def open_for_write(
+    path: str | Path,
+    mode: WriteMode = 'w',
+    options: WriteOptions | None = None,
+) -> Iterator[IO[Any]]:
+    """Open a file for writing, honoring atomicity and buffering options.
+
+    Text mode always uses UTF-8. Parent directories must already exist. A
+    compression suffix on ``path`` compresses the output with that codec.
+
+    Args:
+        path: Path of the file to write
+        mode: 'w' for text or 'wb' for binary
+        options: Write options (default: direct, default-buffered write)
+
+    Yields:
+        Writable file object
+
+    """
+    options = options or WriteOptions()
+    target = Path(path)
+    compression = detect_compression(target)
+    raw_mode = mode if compression is None else 'wb'
+    encoding = None if 'b' in raw_mode else 'utf-8'
+    if not options.atomic:
+        with (
+            target.open(mode=raw_mode, buffering=options.buffer_size, encoding=encoding) as raw,
+            _compressed_layer(raw, mode, compression, options.compression_level) as fout,
+        ):
+            yield fout
+        return
+
+    tmp_path = target.with_name(f'.{target.name}.{secrets.token_hex(8)}.tmp')
+    # O_EXCL guarantees the temp file is ours, and mode 0o666 lets the umask apply as for a normal open().
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with open(fd, mode=raw_mode, buffering=options.buffer_size, encoding=encoding) as raw:  # noqa: PTH123
+            with _compressed_layer(raw, mode, compression, options.compression_level) as fout:
+                yield fout
+            raw.flush()
+            if options.fsync:
+                os.fsync(raw.fileno())
+        with suppress(FileNotFoundError):
+            shutil.copymode(target, tmp_path)
+        tmp_path.replace(target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if options.fsync:
+        _fsync_directory(target.parent)
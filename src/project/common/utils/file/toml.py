@@ -3,9 +3,21 @@ from typing import Any
 
 import toml
 
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+
+
+def loads_toml(data: str | bytes) -> dict[str, Any]:
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return toml.loads(data)
+
+
+def dumps_as_toml(data: dict[str, Any]) -> bytes:
+    return toml.dumps(data).encode('utf-8')
+
 
 def load_toml(path: str | Path) -> dict[str, Any]:
-    with Path(path).open(mode='r', encoding='utf-8') as fin:
+    with open_for_read(path) as fin:
         return toml.load(fin)
 
 
@@ -14,10 +26,12 @@ def save_as_toml(
     path: str | Path,
     parents: bool = True,
     exist_ok: bool = True,
+    *,
+    write_options: WriteOptions | None = None,
 ) -> None:
     target = Path(path)
     target.parent.mkdir(parents=parents, exist_ok=exist_ok)
-    with target.open(mode='w', encoding='utf-8') as fout:
+    with open_for_write(target, options=write_options) as fout:
         toml.dump(data, fout)
 
 
@@ -28,6 +42,14 @@ class TomlFileHandler:
         """Load TOML data from file."""
         return load_toml(path)
 
+    def loads(self, data: str | bytes) -> dict[str, Any]:
+        """Parse TOML data from an in-memory document."""
+        return loads_toml(data)
+
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        """Serialize data as TOML bytes."""
+        return dumps_as_toml(data)
+
     def save(
         self,
         data: dict[str, Any],
@@ -35,6 +57,7 @@ class TomlFileHandler:
         *,
         parents: bool = True,
         exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
     ) -> None:
         """Save data as TOML to file."""
-        save_as_toml(data, path, parents=parents, exist_ok=exist_ok)
+        save_as_toml(data, path, parents=parents, exist_ok=exist_ok, write_options=write_options)
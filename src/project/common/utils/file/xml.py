@@ -1,61 +1,131 @@
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from itertools import batched
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+from xml.sax.saxutils import escape
+
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+
+_ROOT_CHILD_DEPTH = 2
+_INDENT = '  '
+_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+_WRITE_BATCH_SIZE = 4096
 
 
 def _dict_to_xml(tag: str, data: dict[str, Any]) -> ET.Element:
-    """Convert a dictionary to an XML Element recursively."""
+    """Convert a dictionary to an XML Element using an explicit stack.
+
+    Nested dictionaries become nested elements and list entries become
+    ``<item>`` elements, to any depth and without recursion.
+    """
     element = ET.Element(tag)
+    subelement = ET.SubElement
 
-    for key, value in data.items():
-        child = ET.SubElement(element, str(key))
+    # Only containers are pushed; scalars are written as soon as their element
+    # is created. Children are always created in document order when their
+    # parent is expanded, so the LIFO order of the stack does not affect output.
+    # Exact type checks let the common case of string keys and values skip
+    # the isinstance and str() calls, which dominate on wide, flat data.
+    stack: list[tuple[ET.Element, dict[str, Any] | list[Any]]] = [(element, data)]
+    push = stack.append
+    while stack:
+        node, value = stack.pop()
         if isinstance(value, dict):
-            for sub_key, sub_value in value.items():
-                sub_child = ET.SubElement(child, str(sub_key))
-                sub_child.text = str(sub_value)
-        elif isinstance(value, list):
-            for item in value:
-                item_element = ET.SubElement(child, 'item')
-                if isinstance(item, dict):
-                    for sub_key, sub_value in item.items():
-                        sub_child = ET.SubElement(item_element, str(sub_key))
-                        sub_child.text = str(sub_value)
+            for key, child_value in value.items():
+                child_tag = key if type(key) is str else str(key)
+                if type(child_value) is str:
+                    subelement(node, child_tag).text = child_value
+                elif isinstance(child_value, (dict, list)):
+                    push((subelement(node, child_tag), child_value))
                 else:
-                    item_element.text = str(item)
-        else:
-            child.text = str(value)
+                    subelement(node, child_tag).text = str(child_value)
+            continue
+        for child_value in value:
+            if type(child_value) is str:
+                subelement(node, 'item').text = child_value
+            elif isinstance(child_value, (dict, list)):
+                push((subelement(node, 'item'), child_value))
+            else:
+                subelement(node, 'item').text = str(child_value)
 
     return element
 
 
+def _merge_child(result: dict[str, Any], parent_tag: str, child_tag: str, child_data: object) -> None:
+    """Insert a converted child into its parent's dictionary."""
+    # Handle list items
+    if child_tag == 'item':
+        items = result.setdefault(parent_tag, [])
+        if isinstance(items, list):
+            items.append(child_data)
+    # Handle regular elements
+    elif child_tag in result:
+        # Convert to list if duplicate tags
+        existing = result[child_tag]
+        if not isinstance(existing, list):
+            result[child_tag] = existing = [existing]
+        existing.append(child_data)
+    else:
+        result[child_tag] = child_data
+
+
 def _xml_to_dict(element: ET.Element) -> dict[str, Any] | list[Any] | str:
-    """Convert an XML Element to a dictionary recursively."""
+    """Convert an XML Element to a dictionary using an explicit stack.
+
+    Leaf elements become their text, and elements with children become
+    dictionaries keyed by child tag. Repeated tags are collected into lists and
+    ``<item>`` children into a list under the parent's tag.
+    """
     # If element has no children, return its text
     if len(element) == 0:
         return element.text or ''
 
     result: dict[str, Any] = {}
-    for child in element:
-        child_data = _xml_to_dict(child)
-
-        # Handle list items
-        if child.tag == 'item':
-            if element.tag not in result:
-                result[element.tag] = []
-            if isinstance(result[element.tag], list):
-                result[element.tag].append(child_data)
-        # Handle regular elements
-        elif child.tag in result:
-            # Convert to list if duplicate tags
-            if not isinstance(result[child.tag], list):
-                result[child.tag] = [result[child.tag]]
-            result[child.tag].append(child_data)
+    # Each frame holds an element, the dictionary being filled for it and an
+    # iterator over its remaining children. A child dictionary is inserted into
+    # its parent before being filled, which keeps key order identical to a
+    # depth-first recursive walk.
+    stack: list[tuple[str, dict[str, Any], Iterator[ET.Element]]] = [(element.tag, result, iter(element))]
+    while stack:
+        parent_tag, parent_result, children = stack[-1]
+        for child in children:
+            if len(child) == 0:
+                _merge_child(parent_result, parent_tag, child.tag, child.text or '')
+                continue
+            child_result: dict[str, Any] = {}
+            _merge_child(parent_result, parent_tag, child.tag, child_result)
+            stack.append((child.tag, child_result, iter(child)))
+            break
         else:
-            result[child.tag] = child_data
+            stack.pop()
 
     return result
 
 
+def _root_to_dict(root: ET.Element) -> dict[str, Any]:
+    """Convert a parsed root element, wrapping the result in the root tag name."""
+    result = _xml_to_dict(root)
+
+    # Wrap in root tag name if result is not already wrapped
+    if isinstance(result, dict) and root.tag not in result:
+        return {root.tag: result}
+    return result if isinstance(result, dict) else {root.tag: result}
+
+
+def loads_xml(data: str | bytes) -> dict[str, Any]:
+    """Parse an in-memory XML document and convert it to a dictionary.
+
+    Args:
+        data: XML document as text or UTF-8 encoded bytes
+
+    Returns:
+        Dictionary representation of the XML data
+
+    """
+    return _root_to_dict(ET.fromstring(data))  # noqa: S314
+
+
 def load_xml(path: str | Path) -> dict[str, Any]:
     """Load XML data from file and convert to dictionary.
 
@@ -70,22 +140,129 @@ def load_xml(path: str | Path) -> dict[str, Any]:
         constructed data. For untrusted data, consider using defusedxml.
 
     """
-    tree = ET.parse(str(path))  # noqa: S314
-    root = tree.getroot()
-    result = _xml_to_dict(root)
+    with open_for_read(path, mode='rb') as fin:
+        tree = ET.parse(fin)  # noqa: S314
+    return _root_to_dict(tree.getroot())
 
-    # Wrap in root tag name if result is not already wrapped
-    if isinstance(result, dict) and root.tag not in result:
-        return {root.tag: result}
-    return result if isinstance(result, dict) else {root.tag: result}
 
+def iter_xml(path: str | Path, tag: str | None = None) -> Iterator[dict[str, Any] | list[Any] | str]:
+    """Stream an XML file, yielding the converted form of each matching element.
+
+    The file is parsed incrementally with ``iterparse``. Each matching element
+    is converted with the same rules as :func:`load_xml` once its end tag is
+    seen, then cleared and detached from its parent. Elements outside any
+    match are dropped the same way once they end, so memory stays bounded by
+    the size of a single element rather than the whole document.
+
+    Args:
+        path: Path to the XML file
+        tag: Tag of the repeated element to yield (for example ``'item'``).
+            Elements nested inside an already matching element are yielded as
+            part of it. If None, every direct child of the root is yielded.
+
+    Yields:
+        Converted subtree for each matching element, in document order
 
-def save_as_xml(
+    Note:
+        This uses xml.etree.ElementTree which is not secure against maliciously
+        constructed data. For untrusted data, consider using defusedxml.
+
+    """
+    # Open elements from the root down; the root's direct children sit at depth 2.
+    stack: list[ET.Element] = []
+    current: ET.Element | None = None
+    with open_for_read(path, mode='rb') as fin:
+        events = cast('Iterator[tuple[str, ET.Element]]', ET.iterparse(fin, events=('start', 'end')))  # noqa: S314
+        for event, element in events:
+            if event == 'start':
+                stack.append(element)
+                is_match = element.tag == tag if tag is not None else len(stack) == _ROOT_CHILD_DEPTH
+                if current is None and is_match:
+                    current = element
+                continue
+
+            stack.pop()
+            if element is current:
+                yield _xml_to_dict(element)
+                current = None
+            elif current is not None:
+                # Part of the match being built; converted with it.
+                continue
+            # Finished elements outside any match, such as siblings of the
+            # matching tag, are dropped as well so they do not pile up.
+            element.clear()
+            if stack:
+                stack[-1].remove(element)
+
+
+def _build_root(data: dict[str, Any], root_tag: str) -> ET.Element:
+    """Build the root element from dictionary data."""
+    # If data has single key, use it as root tag
+    if len(data) == 1:
+        root_tag = next(iter(data.keys()))
+        root_data = data[root_tag]
+        if isinstance(root_data, dict):
+            return _dict_to_xml(root_tag, root_data)
+        root = ET.Element(root_tag)
+        root.text = str(root_data)
+        return root
+    return _dict_to_xml(root_tag, data)
+
+
+def _iter_indented_xml(root: ET.Element) -> Iterator[str]:
+    """Serialize an element tree as an indented XML document using an explicit stack.
+
+    The output is identical to ``ET.indent(root, space='  ')`` followed by
+    ``ET.tostring(root, encoding='utf-8', xml_declaration=True)``, but both of
+    those recurse once per level and fail on documents nested deeper than the
+    recursion limit. Only tags and text are written, which is all
+    :func:`_dict_to_xml` produces.
+    """
+    yield _XML_DECLARATION
+    # A frame is either an element to open at a depth or a closing fragment.
+    stack: list[tuple[ET.Element, int] | str] = [(root, 0)]
+    while stack:
+        frame = stack.pop()
+        if isinstance(frame, str):
+            yield frame
+            continue
+        element, depth = frame
+        tag = element.tag
+        if len(element):
+            yield f'<{tag}>'
+            stack.append(f'\n{_INDENT * depth}</{tag}>')
+            child_indent = '\n' + _INDENT * (depth + 1)
+            for child in reversed(element):
+                stack.append((child, depth + 1))
+                stack.append(child_indent)
+        elif not element.text:
+            yield f'<{tag} />'
+        else:
+            yield f'<{tag}>{escape(element.text)}</{tag}>'
+
+
+def dumps_as_xml(data: dict[str, Any], root_tag: str = 'root') -> bytes:
+    """Serialize dictionary data as an XML document.
+
+    Args:
+        data: Dictionary data to serialize
+        root_tag: Tag name for the root element (default: 'root')
+
+    Returns:
+        UTF-8 encoded XML document including the XML declaration
+
+    """
+    return ''.join(_iter_indented_xml(_build_root(data, root_tag))).encode()
+
+
+def save_as_xml(  # noqa: PLR0913
     data: dict[str, Any],
     path: str | Path,
     root_tag: str = 'root',
     parents: bool = True,
     exist_ok: bool = True,
+    *,
+    write_options: WriteOptions | None = None,
 ) -> None:
     """Save dictionary data as XML to file.
 
@@ -95,30 +272,24 @@ def save_as_xml(
         root_tag: Tag name for the root element (default: 'root')
         parents: If True, create parent directories as needed
         exist_ok: If True, don't raise error if directory exists
+        write_options: Atomicity and buffering options for the write
 
     """
     target = Path(path)
     target.parent.mkdir(parents=parents, exist_ok=exist_ok)
 
-    # If data has single key, use it as root tag
-    if len(data) == 1:
-        root_tag = next(iter(data.keys()))
-        root_data = data[root_tag]
-        if isinstance(root_data, dict):
-            root = _dict_to_xml(root_tag, root_data)
-        else:
-            root = ET.Element(root_tag)
-            root.text = str(root_data)
-    else:
-        root = _dict_to_xml(root_tag, data)
-
-    tree = ET.ElementTree(root)
-    ET.indent(tree, space='  ')
-    tree.write(str(target), encoding='utf-8', xml_declaration=True)
+    root = _build_root(data, root_tag)
+    with open_for_write(target, mode='wb', options=write_options) as fout:
+        for fragments in batched(_iter_indented_xml(root), _WRITE_BATCH_SIZE, strict=False):
+            fout.write(''.join(fragments).encode())
 
 
 class XmlFileHandler:
-    """XML file handler implementing FileHandler protocol."""
+    """XML file handler implementing FileHandler protocol.
+
+    The root tag is fixed at construction, because the factory shares one
+    instance between all callers; create a new handler for another root tag.
+    """
 
     def __init__(self, root_tag: str = 'root') -> None:
         """Initialize XML handler.
@@ -127,12 +298,25 @@ class XmlFileHandler:
             root_tag: Default root tag name for saving (default: 'root')
 
         """
-        self.root_tag = root_tag
+        self._root_tag = root_tag
+
+    @property
+    def root_tag(self) -> str:
+        """Root tag name used when saving."""
+        return self._root_tag
 
     def load(self, path: str | Path) -> dict[str, Any]:
         """Load XML data from file."""
         return load_xml(path)
 
+    def loads(self, data: str | bytes) -> dict[str, Any]:
+        """Parse XML data from an in-memory document."""
+        return loads_xml(data)
+
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        """Serialize data as XML bytes."""
+        return dumps_as_xml(data, root_tag=self.root_tag)
+
     def save(
         self,
         data: dict[str, Any],
@@ -140,6 +324,14 @@ class XmlFileHandler:
         *,
         parents: bool = True,
         exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
     ) -> None:
         """Save data as XML to file."""
-        save_as_xml(data, path, root_tag=self.root_tag, parents=parents, exist_ok=exist_ok)
+        save_as_xml(
+            data,
+            path,
+            root_tag=self.root_tag,
+            parents=parents,
+            exist_ok=exist_ok,
+            write_options=write_options,
+        )
@@ -3,11 +3,21 @@ from typing import Any
 
 import yaml
 
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+
 YamlValue = dict[str, Any] | list[Any] | str | int | float | bool | None
 
 
+def loads_yaml(data: str | bytes) -> YamlValue:
+    return yaml.safe_load(data)
+
+
+def dumps_as_indented_yaml(data: YamlValue) -> bytes:
+    return yaml.dump(data, allow_unicode=True, indent=4, default_flow_style=False).encode('utf-8')
+
+
 def load_yaml(path: str | Path) -> YamlValue:
-    with Path(path).open(mode='r', encoding='utf-8') as fin:
+    with open_for_read(path) as fin:
         return yaml.safe_load(fin)
 
 
@@ -16,10 +26,12 @@ def save_as_indented_yaml(
     path: str | Path,
     parents: bool = True,
     exist_ok: bool = True,
+    *,
+    write_options: WriteOptions | None = None,
 ) -> None:
     target = Path(path)
     target.parent.mkdir(parents=parents, exist_ok=exist_ok)
-    with target.open(mode='w', encoding='utf-8') as fout:
+    with open_for_write(target, options=write_options) as fout:
         yaml.dump(data, fout, allow_unicode=True, indent=4, default_flow_style=False)
 
 
@@ -30,6 +42,14 @@ class YamlFileHandler:
         """Load YAML data from file."""
         return load_yaml(path)
 
+    def loads(self, data: str | bytes) -> YamlValue:
+        """Parse YAML data from an in-memory document."""
+        return loads_yaml(data)
+
+    def dumps(self, data: YamlValue) -> bytes:
+        """Serialize data as indented YAML bytes."""
+        return dumps_as_indented_yaml(data)
+
     def save(
         self,
         data: YamlValue,
@@ -37,6 +57,7 @@ class YamlFileHandler:
         *,
         parents: bool = True,
         exist_ok: bool = True,
+        write_options: WriteOptions | None = None,
     ) -> None:
         """Save data as indented YAML to file."""
-        save_as_indented_yaml(data, path, parents=parents, exist_ok=exist_ok)
+        save_as_indented_yaml(data, path, parents=parents, exist_ok=exist_ok, write_options=write_options)
@@ -0,0 +1,215 @@
+"""Shared, pooled HTTP client built on AsyncResource.
+
+Opening a ``ClientSession`` per request pays for DNS resolution, the TCP
+handshake and the TLS handshake every time. ``HttpClientResource`` owns one
+session whose connector keeps connections alive between requests, caps the
+number of connections in total and per host, and caches DNS lookups, so a
+service can share a single instance for all of its outgoing requests.
+
+``request`` goes through everything ``AsyncResource`` provides (rate
+limiting per host, retries, circuit breaker, timeout, single-flight, caching
+and metrics) and reads the whole body, so its result stays valid after the
+connection is returned to the pool. ``stream`` yields the live response
+instead, holding a connection and a concurrency slot until the body has been
+consumed; it is rate limited and checks the circuit breaker but is not
+retried or cached, because a body that has been partly read cannot be replayed.
+
+The session is created on first use and is bound to the event loop it was
+created in. Close the resource with ``await resource.close()`` or
+``async with``; to share one instance between synchronous callers, run them
+on a persistent loop (``async_to_sync_func(..., persistent_loop=True)``).
+"""
+
+from collections.abc import AsyncIterator, Hashable, Mapping
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self, cast
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp.typedefs import StrOrURL
+
+from project.common.utils.async_utils import AsyncResource
+from project.common.utils.file.json_codec import get_json_codec
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=30)
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """Fully read HTTP response.
+
+    Attributes:
+        status: HTTP status code
+        url: Final URL, after redirects
+        headers: Response headers (case-insensitive)
+        body: Raw response body
+
+    """
+
+    status: int
+    url: str
+    headers: Mapping[str, str]
+    body: bytes
+
+    def text(self, encoding: str = 'utf-8') -> str:
+        return self.body.decode(encoding)
+
+    def json(self) -> Any:  # noqa: ANN401
+        return get_json_codec().loads(self.body)
+
+
+class HttpClientResource(AsyncResource[HttpResponse]):
+    """AsyncResource that sends HTTP requests through one pooled aiohttp session.
+
+    Example:
+        >>> async with HttpClientResource('https://api.example.com', limit_per_host=8) as client:
+        ...     response = await client.request('GET', '/items', params={'page': 1})
+        ...     items = response.json()
+        ...     async with client.stream('GET', '/export') as export:
+        ...         async for chunk in export.content.iter_chunked(65536):
+        ...             sink.write(chunk)
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: StrOrURL | None = None,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int | None = 300,
+        timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT,
+        headers: Mapping[str, str] | None = None,
+        raise_for_status: bool = True,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the resource without opening any connection.
+
+        Args:
+            base_url: Prefix of relative request URLs
+            limit: Maximum number of open connections
+            limit_per_host: Maximum number of open connections to one host
+            keepalive_timeout: Seconds an idle connection is kept for reuse
+            ttl_dns_cache: Seconds a DNS lookup is cached; None caches forever
+            timeout: Timeouts of each request
+            headers: Headers sent with every request
+            raise_for_status: Raise ``aiohttp.ClientResponseError`` for 4xx and
+                5xx responses, which makes them count as failures for retries
+                and the circuit breaker
+            **kwargs: Arguments of :class:`AsyncResource`; ``concurrency``
+                defaults to ``limit``
+
+        Raises:
+            ValueError: If a connection limit is not positive
+
+        """
+        if limit < 1 or limit_per_host < 1:
+            raise ValueError(f'connection limits must be positive, got {limit} and {limit_per_host}')
+        kwargs.setdefault('concurrency', limit)
+        super().__init__(**kwargs)
+        self.base_url = base_url
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = timeout
+        self.headers = headers
+        self.raise_for_status = raise_for_status
+        self._base_host = None if base_url is None else urlsplit(str(base_url)).hostname
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Pooled session, created on first use in the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.ttl_dns_cache,
+            )
+            self._session = aiohttp.ClientSession(
+                self.base_url,
+                connector=connector,
+                timeout=self.timeout,
+                headers=self.headers,
+                raise_for_status=self.raise_for_status,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and its connections; a later request opens a new one."""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def request(self, method: str, url: StrOrURL, **kwargs: Any) -> HttpResponse:  # noqa: ANN401
+        """Send a request and read its whole body.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL, or URL relative to ``base_url``
+            **kwargs: Arguments of ``aiohttp.ClientSession.request`` (params,
+                json, data, headers, ...); with single-flight or caching they
+                must be hashable
+
+        Returns:
+            The response with its body
+
+        """
+        return await self.task(method, url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: StrOrURL, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:  # noqa: ANN401
+        """Send a request and yield the response before its body is read.
+
+        The connection and the concurrency slot are held until the block
+        exits, so read the body (e.g. ``response.content.iter_chunked``)
+        inside it. Only sending the request and receiving the status count
+        towards the circuit breaker.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL, or URL relative to ``base_url``
+            **kwargs: Arguments of ``aiohttp.ClientSession.request``
+
+        Yields:
+            The live response
+
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.check()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.rate_limit_key(method, url))
+        async with self.semaphore:
+            with breaker.guard() if breaker is not None else nullcontext():
+                response = await self.session.request(method, url, **kwargs)
+            async with response:
+                yield response
+
+    def rate_limit_key(self, *args: object, **_kwargs: object) -> Hashable:
+        """Rate limit per host."""
+        return urlsplit(str(args[1])).hostname or self._base_host
+
+    async def call(self, *args: object, **kwargs: Any) -> HttpResponse:  # noqa: ANN401
+        """Send ``request(method, url, **kwargs)`` and read the whole body."""
+        method, url = cast('tuple[str, StrOrURL]', args)
+        async with self.session.request(method, url, **kwargs) as response:
+            body = await response.read()
+            return HttpResponse(status=response.status, url=str(response.url), headers=response.headers, body=body)
@@ -0,0 +1,214 @@
+"""Minimal metrics sinks: counters, gauges and fixed-bucket histograms.
+
+Instrumented code reports to a ``MetricsSink`` and never depends on a
+particular backend. Three sinks are provided:
+
+- ``InMemorySink`` aggregates everything in process, for tests and ad-hoc
+  inspection
+- ``PrometheusSink`` is an ``InMemorySink`` that renders its contents in the
+  Prometheus text exposition format, e.g. for a ``/metrics`` endpoint
+- ``LoggingSink`` logs every event, for debugging
+
+Labels are plain string mappings; every distinct label set is a separate series.
+"""
+
+import bisect
+import logging
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+type Labels = Mapping[str, str]
+type _SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram, as in Prometheus.
+
+    Attributes:
+        buckets: Sorted upper bounds; values above the last bound are only
+            counted in ``count`` (the implicit ``+Inf`` bucket)
+        counts: Number of observations per bucket (not cumulative)
+        count: Total number of observations
+        sum: Sum of all observed values
+
+    """
+
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[int]:
+        """Return the number of observations less than or equal to each bucket bound."""
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class MetricsSink(ABC):
+    """Destination of metric events."""
+
+    @abstractmethod
+    def increment(self, name: str, labels: Labels, amount: float = 1.0) -> None:
+        """Add ``amount`` to a counter."""
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, labels: Labels) -> None:
+        """Set a gauge to ``value``."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        """Record ``value`` in a histogram."""
+
+
+def _series_key(name: str, labels: Labels) -> _SeriesKey:
+    return name, tuple(sorted(labels.items()))
+
+
+class InMemorySink(MetricsSink):
+    """Thread-safe sink that aggregates metrics in process."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty sink.
+
+        Args:
+            buckets: Bucket bounds used for every histogram
+
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counters: dict[_SeriesKey, float] = {}
+        self.gauges: dict[_SeriesKey, float] = {}
+        self.histograms: dict[_SeriesKey, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, labels: Labels, amount: float = 1.0) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0.0) + amount
+
+    def set_gauge(self, name: str, value: float, labels: Labels) -> None:
+        with self._lock:
+            self.gauges[_series_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def counter(self, name: str, labels: Labels) -> float:
+        """Return the current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self.counters.get(_series_key(name, labels), 0.0)
+
+    def gauge(self, name: str, labels: Labels) -> float | None:
+        """Return the current value of a gauge, or None if never set."""
+        with self._lock:
+            return self.gauges.get(_series_key(name, labels))
+
+    def histogram(self, name: str, labels: Labels) -> Histogram | None:
+        """Return a histogram, or None if nothing was observed."""
+        with self._lock:
+            return self.histograms.get(_series_key(name, labels))
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(labels: Sequence[tuple[str, str]]) -> str:
+    if not labels:
+        return ''
+    escaped = ((name, value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')) for name, value in labels)
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+class PrometheusSink(InMemorySink):
+    """In-memory sink that renders the Prometheus text exposition format."""
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format (version 0.0.4)."""
+        with self._lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            histograms = sorted(
+                (
+                    key,
+                    list(zip(self.buckets, histogram.cumulative_counts(), strict=True)),
+                    histogram.count,
+                    histogram.sum,
+                )
+                for key, histogram in self.histograms.items()
+            )
+
+        lines: list[str] = []
+        typed: set[str] = set()
+
+        def declare(name: str, kind: str) -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {name} {kind}')
+
+        for (name, labels), value in counters:
+            declare(name, 'counter')
+            lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        for (name, labels), value in gauges:
+            declare(name, 'gauge')
+            lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        for (name, labels), buckets, count, total in histograms:
+            declare(name, 'histogram')
+            for bound, cumulative in [*buckets, (math.inf, count)]:
+                bucket_labels = _format_labels([*labels, ('le', _format_value(bound))])
+                lines.append(f'{name}_bucket{bucket_labels} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(total)}')
+            lines.append(f'{name}_count{_format_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+class LoggingSink(MetricsSink):
+    """Sink that logs every metric event."""
+
+    def __init__(self, level: int = logging.DEBUG, log: logging.Logger = logger) -> None:
+        """Initialize the sink.
+
+        Args:
+            level: Log level of the events
+            log: Logger the events are written to
+
+        """
+        self.level = level
+        self.log = log
+
+    def increment(self, name: str, labels: Labels, amount: float = 1.0) -> None:
+        self.log.log(self.level, 'counter %s%s += %s', name, dict(labels), amount)
+
+    def set_gauge(self, name: str, value: float, labels: Labels) -> None:
+        self.log.log(self.level, 'gauge %s%s = %s', name, dict(labels), value)
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        self.log.log(self.level, 'histogram %s%s observed %s', name, dict(labels), value)
@@ -0,0 +1,132 @@
+"""Token-bucket rate limiting for asyncio code.
+
+Each bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+second. A call takes one token, waiting until one is available. Waiters on
+the same bucket are served strictly first come, first served, so a steady
+stream of callers cannot starve an earlier one. Buckets can be kept per key
+(for example per host or per API endpoint) so independent limits do not
+block each other. Buckets that are full and have no waiters are dropped
+once enough keys accumulate, since a fresh bucket starts full anyway; memory
+therefore tracks the keys that are actually being throttled, not every key
+ever seen.
+
+The clock and sleep functions are injectable, which lets tests drive the
+limiter on a virtual clock instead of waiting in real time.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+
+_MIN_PRUNE_SIZE = 1024
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class RateLimiter:
+    """Asynchronous token-bucket rate limiter with optional per-key buckets.
+
+    Example:
+        >>> limiter = RateLimiter(rate=10, burst=20)  # 10 requests/s, bursts of 20
+        >>> await limiter.acquire('api.example.com')
+
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Tokens added to each bucket per second
+            burst: Bucket capacity, i.e. how many calls may run back to back
+                after an idle period (default: ``max(1, rate)``)
+            clock: Monotonic clock returning seconds
+            sleep: Coroutine function used to wait for the given seconds
+
+        Raises:
+            ValueError: If rate is not positive or burst is less than one token
+
+        """
+        if rate <= 0:
+            raise ValueError(f'rate must be positive, got {rate}')
+        capacity = max(1.0, rate) if burst is None else burst
+        if capacity < 1:
+            raise ValueError(f'burst must be at least 1, got {burst}')
+        self.rate = rate
+        self.burst = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self._prune_size = _MIN_PRUNE_SIZE
+
+    def _bucket(self, key: Hashable) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self._prune_size:
+                self._prune()
+            bucket = self._buckets[key] = _Bucket(tokens=self.burst, updated=self._clock())
+        return bucket
+
+    def _prune(self) -> None:
+        """Drop buckets that are full and idle; recreating them later gives the same state."""
+        now = self._clock()
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if bucket.lock.locked() or bucket.tokens + (now - bucket.updated) * self.rate < self.burst
+        }
+        # Doubling the threshold keeps pruning amortized O(1) per new key even
+        # when most buckets are still refilling.
+        self._prune_size = max(_MIN_PRUNE_SIZE, 2 * len(self._buckets))
+
+    def _refill(self, bucket: _Bucket) -> None:
+        now = self._clock()
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+        bucket.updated = now
+
+    def try_acquire(self, key: Hashable = None) -> bool:
+        """Take a token without waiting.
+
+        Returns:
+            True if a token was taken, False if the bucket is empty or other
+            callers are already waiting on it
+
+        """
+        bucket = self._bucket(key)
+        if bucket.lock.locked():
+            return False
+        self._refill(bucket)
+        if bucket.tokens < 1:
+            return False
+        bucket.tokens -= 1
+        return True
+
+    async def acquire(self, key: Hashable = None) -> None:
+        """Wait until a token is available in the bucket for ``key``, then take it.
+
+        Args:
+            key: Bucket to draw from; calls with different keys are limited independently
+
+        """
+        bucket = self._bucket(key)
+        # asyncio.Lock wakes waiters in FIFO order, which makes waiting fair.
+        async with bucket.lock:
+            self._refill(bucket)
+            if bucket.tokens < 1:
+                await self._sleep((1 - bucket.tokens) / self.rate)
+                self._refill(bucket)
+            # An early wake-up or float rounding can leave the balance slightly
+            # below zero; the next caller's wait pays that debt back.
+            bucket.tokens -= 1
@@ -0,0 +1,188 @@
+"""Retry and circuit-breaker policies for asyncio code.
+
+``RetryPolicy`` describes how often and how patiently a failed call is
+retried: exponential backoff capped at ``maximum`` seconds, with random
+jitter added to every wait so that callers failing together do not retry in
+lockstep. The retry loop itself is tenacity's ``AsyncRetrying``.
+
+``CircuitBreaker`` stops calling a dependency that keeps failing. After
+``failure_threshold`` consecutive failures the circuit opens and calls fail
+immediately with ``CircuitOpenError`` instead of waiting on the dependency.
+Once ``recovery_timeout`` seconds have passed, a single trial call is let
+through (half-open): if it succeeds the circuit closes again, otherwise it
+reopens for another ``recovery_timeout``.
+
+Both take injectable clock/sleep functions so tests can run on virtual time.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Literal
+
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+
+type CircuitState = Literal['closed', 'open', 'half_open']
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter.
+
+    The wait before retry ``n`` (starting at 1) is
+    ``min(maximum, initial * multiplier ** (n - 1)) + uniform(0, jitter)``.
+
+    Attributes:
+        attempts: Total number of attempts, including the first one
+        initial: Wait before the first retry, in seconds
+        maximum: Upper bound of the exponential part of the wait, in seconds
+        multiplier: Growth factor of the wait between retries
+        jitter: Upper bound of the random delay added to every wait, in seconds
+        retry_on: Exception types that trigger a retry; others propagate at once.
+            ``CircuitOpenError`` is never retried.
+        sleep: Coroutine function used to wait for the given seconds
+
+    """
+
+    attempts: int = 3
+    initial: float = 0.1
+    maximum: float = 10.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
+    retry_on: tuple[type[BaseException], ...] = (Exception,)
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+
+    def __post_init__(self) -> None:
+        if self.attempts < 1:
+            raise ValueError(f'attempts must be at least 1, got {self.attempts}')
+        if self.initial < 0 or self.maximum < 0 or self.jitter < 0:
+            raise ValueError('initial, maximum and jitter must not be negative')
+
+    def _should_retry(self, exc: BaseException) -> bool:
+        return isinstance(exc, self.retry_on) and not isinstance(exc, CircuitOpenError)
+
+    def retrying(self) -> AsyncRetrying:
+        """Return a tenacity retry loop implementing this policy.
+
+        The last exception is re-raised as is once the attempts run out.
+
+        Example:
+            >>> async for attempt in policy.retrying():
+            ...     with attempt:
+            ...         return await fetch()
+
+        """
+        return AsyncRetrying(
+            stop=stop_after_attempt(self.attempts),
+            wait=wait_exponential(multiplier=self.initial, max=self.maximum, exp_base=self.multiplier)
+            + wait_random(0, self.jitter),
+            retry=retry_if_exception(self._should_retry),
+            sleep=self.sleep,
+            reraise=True,
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+        >>> with breaker.guard():
+        ...     await fetch()
+
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        *,
+        failure_types: tuple[type[BaseException], ...] = (Exception,),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a trial call
+            failure_types: Exceptions counted as failures of the dependency;
+                other exceptions (e.g. invalid input) count as successes,
+                since the dependency did answer
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If failure_threshold is less than one or recovery_timeout is negative
+
+        """
+        if failure_threshold < 1:
+            raise ValueError(f'failure_threshold must be at least 1, got {failure_threshold}')
+        if recovery_timeout < 0:
+            raise ValueError(f'recovery_timeout must not be negative, got {recovery_timeout}')
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failure_types = failure_types
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit."""
+        if self._opened_at is None:
+            return 'closed'
+        if self._clock() - self._opened_at < self.recovery_timeout:
+            return 'open'
+        return 'half_open'
+
+    def check(self) -> None:
+        """Fail fast if a call would be rejected right now, without reserving the trial call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its trial call in flight
+
+        """
+        state = self.state
+        if state == 'open' or (state == 'half_open' and self._trial_in_flight):
+            raise CircuitOpenError(f'circuit is {state} after {self._failures} consecutive failures')
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Admit one call and record its outcome.
+
+        Raises:
+            CircuitOpenError: If the call is rejected
+
+        """
+        self.check()
+        trial = self.state == 'half_open'
+        if trial:
+            self._trial_in_flight = True
+        try:
+            yield
+        except self.failure_types:
+            self._record_failure()
+            raise
+        except Exception:
+            self._record_success()
+            raise
+        finally:
+            # Also reached on cancellation, which says nothing about the dependency.
+            if trial:
+                self._trial_in_flight = False
+        self._record_success()
+
+    def _record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
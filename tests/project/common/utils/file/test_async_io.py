@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from project.common.utils.file import async_io
+from project.common.utils.file.async_io import (
+    aiter_jsonlines,
+    aload_file,
+    asave_as_jsonlines,
+    asave_file,
+    get_file_io_executor,
+)
+from project.common.utils.file.io import load_file, save_file
+from project.common.utils.file.jsonlines import load_jsonlines, save_as_jsonlines
+
+
+@pytest.fixture
+def sample_data() -> dict[str, Any]:
+    return {'key': 'value', 'number': 42, 'list': [1, 2, 3]}
+
+
+@pytest.mark.parametrize('ext', ['json', 'yaml', 'toml'])
+@pytest.mark.asyncio
+async def test_asave_and_aload_file(tmp_path: Path, sample_data: dict[str, Any], ext: str) -> None:
+    file_path = tmp_path / 'nested' / f'test.{ext}'
+    await asave_file(sample_data, file_path)
+
+    assert await aload_file(file_path) == sample_data
+    assert load_file(file_path) == sample_data
+
+
+@pytest.mark.parametrize('ext', ['json', 'yaml', 'toml', 'xml'])
+@pytest.mark.asyncio
+async def test_asave_file_matches_save_file(tmp_path: Path, sample_data: dict[str, Any], ext: str) -> None:
+    sync_path = tmp_path / f'sync.{ext}'
+    async_path = tmp_path / f'async.{ext}'
+    save_file(sample_data, sync_path)
+    await asave_file(sample_data, async_path)
+
+    assert async_path.read_bytes() == sync_path.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_aload_file_many_concurrent_reads(tmp_path: Path, sample_data: dict[str, Any]) -> None:
+    file_path = tmp_path / 'config.yaml'
+    save_file(sample_data, file_path)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = await asyncio.gather(*(aload_file(file_path, executor=executor) for _ in range(200)))
+
+    assert all(result == sample_data for result in results)
+
+
+@pytest.mark.asyncio
+async def test_aload_file_unsupported_format(tmp_path: Path) -> None:
+    file_path = tmp_path / 'test.txt'
+    file_path.write_text('plain text content')
+
+    with pytest.raises(ValueError, match='Unsupported file extension'):
+        await aload_file(file_path)
+
+
+def test_file_io_executor_is_shared_and_bounded() -> None:
+    executor = get_file_io_executor()
+    assert executor is get_file_io_executor()
+    assert executor._max_workers <= 32  # noqa: SLF001
+
+
+@pytest.mark.parametrize('read_size', [1, 7, 1024 * 1024])
+@pytest.mark.asyncio
+async def test_aiter_jsonlines(tmp_path: Path, read_size: int) -> None:
+    records: list[dict[str, object]] = [{'id': i, 'text': f'レコード-{i}'} for i in range(50)]
+    jsonl_file = tmp_path / 'data.jsonl'
+    save_as_jsonlines(records, jsonl_file)
+
+    result = [record async for record in aiter_jsonlines(jsonl_file, read_size=read_size)]
+    assert result == records
+
+
+@pytest.mark.asyncio
+async def test_asave_as_jsonlines_from_async_iterable(tmp_path: Path) -> None:
+    async def produce() -> AsyncIterator[dict[str, object]]:
+        for i in range(25):
+            yield {'id': i}
+
+    jsonl_file = tmp_path / 'nested' / 'data.jsonl'
+    await asave_as_jsonlines(produce(), jsonl_file, chunk_size=4)
+
+    assert load_jsonlines(jsonl_file) == [{'id': i} for i in range(25)]
+
+
+@pytest.mark.asyncio
+async def test_asave_as_jsonlines_matches_sync_writer(tmp_path: Path) -> None:
+    records: list[dict[str, object]] = [{'id': i, 'nested': {'ok': True}} for i in range(10)]
+    sync_path = tmp_path / 'sync.jsonl'
+    async_path = tmp_path / 'async.jsonl'
+    save_as_jsonlines(records, sync_path)
+    await asave_as_jsonlines(records, async_path, chunk_size=3)
+
+    assert async_path.read_bytes() == sync_path.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_compressed_streams_are_opened_and_closed_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    threads: list[threading.Thread] = []
+
+    def recording(
+        open_func: Callable[..., AbstractContextManager[IO[Any]]],
+    ) -> Callable[..., AbstractContextManager[IO[Any]]]:
+        @contextmanager
+        def wrapper(*args: Any, **kwargs: Any) -> Iterator[IO[Any]]:  # noqa: ANN401
+            threads.append(threading.current_thread())
+            with open_func(*args, **kwargs) as stream:
+                yield stream
+            threads.append(threading.current_thread())
+
+        return wrapper
+
+    monkeypatch.setattr(async_io, 'open_for_read', recording(async_io.open_for_read))
+    monkeypatch.setattr(async_io, 'open_for_write', recording(async_io.open_for_write))
+    records: list[dict[str, object]] = [{'id': i} for i in range(20)]
+    target = tmp_path / 'data.jsonl.gz'
+
+    await asave_as_jsonlines(records, target, chunk_size=6)
+    result = [record async for record in aiter_jsonlines(target, read_size=16)]
+
+    assert result == records
+    assert len(threads) == 4
+    assert threading.current_thread() not in threads
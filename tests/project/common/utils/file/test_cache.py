@@ -0,0 +1,106 @@
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from project.common.utils.file import cache
+from project.common.utils.file.cache import CachedFileLoader, clear_file_cache, load_file_cached
+from project.common.utils.file.config import load_config
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_cached_loader_parses_once(tmp_path: Path) -> None:
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('key: value\nnumber: 42')
+    loader = CachedFileLoader()
+
+    with patch.object(cache, 'load_file', wraps=cache.load_file) as load_file_mock:
+        assert loader.load(config_file) == {'key': 'value', 'number': 42}
+        assert loader.load(str(config_file)) == {'key': 'value', 'number': 42}
+
+    assert load_file_mock.call_count == 1
+
+
+def test_cached_loader_reparses_after_change(tmp_path: Path) -> None:
+    config_file = tmp_path / 'config.json'
+    config_file.write_text('{"key": "old"}')
+    loader = CachedFileLoader()
+    assert loader.load(config_file) == {'key': 'old'}
+
+    config_file.write_text('{"key": "new"}')
+    _touch_later(config_file)
+    assert loader.load(config_file) == {'key': 'new'}
+
+
+def test_cached_loader_returns_copies(tmp_path: Path) -> None:
+    config_file = tmp_path / 'config.json'
+    config_file.write_text('{"nested": {"items": [1, 2]}}')
+    loader = CachedFileLoader()
+
+    first = loader.load(config_file)
+    first['nested']['items'].append(3)
+
+    assert loader.load(config_file) == {'nested': {'items': [1, 2]}}
+
+
+def test_cached_loader_evicts_least_recently_used(tmp_path: Path) -> None:
+    loader = CachedFileLoader(maxsize=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'config{i}.json'
+        path.write_text(f'{{"id": {i}}}')
+        paths.append(path)
+    loader.load(paths[0])
+    loader.load(paths[1])
+    loader.load(paths[0])  # config1 is now the least recently used entry
+    loader.load(paths[2])
+
+    with patch.object(cache, 'load_file', wraps=cache.load_file) as load_file_mock:
+        assert loader.load(paths[0]) == {'id': 0}
+        assert loader.load(paths[2]) == {'id': 2}
+        assert load_file_mock.call_count == 0
+        assert loader.load(paths[1]) == {'id': 1}
+        load_file_mock.assert_called_once_with(paths[1].resolve())
+
+    assert len(loader) == 2
+    loader.invalidate(paths[1])
+    assert len(loader) == 1
+
+
+def test_cached_loader_is_thread_safe(tmp_path: Path) -> None:
+    config_file = tmp_path / 'config.toml'
+    config_file.write_text('key = "value"')
+    loader = CachedFileLoader()
+    results: list[object] = []
+
+    def worker() -> None:
+        results.extend(loader.load(config_file) for _ in range(50))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{'key': 'value'}] * 400
+
+
+def test_cached_loader_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        CachedFileLoader().load(tmp_path / 'missing.json')
+
+
+def test_load_config_use_cache(tmp_path: Path) -> None:
+    clear_file_cache()
+    config_file = tmp_path / 'config.json'
+    config_file.write_text('{"key": "value"}')
+
+    assert load_config(config_file, use_cache=True) == {'key': 'value'}
+    assert load_file_cached(config_file) == {'key': 'value'}
+    clear_file_cache()
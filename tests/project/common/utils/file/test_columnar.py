@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from project.common.utils.file.columnar import (
+    convert_jsonlines,
+    default_columnar_path,
+    detect_columnar_format,
+    ensure_columnar,
+    load_columnar,
+    scan_columnar,
+)
+from project.common.utils.file.compression import available_compressions
+from project.common.utils.file.jsonlines import save_as_jsonlines
+
+RECORDS = [{'id': i, 'status': 200 if i % 3 else 500, 'url': f'https://example.com/{i}'} for i in range(100)]
+
+
+@pytest.fixture
+def jsonl_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'crawl.jsonl'
+    save_as_jsonlines(RECORDS, path)
+    return path
+
+
+@pytest.mark.parametrize(
+    ('path', 'expected'),
+    [('a.parquet', 'parquet'), ('a.arrow', 'ipc'), ('a.IPC', 'ipc'), ('a.feather', 'ipc')],
+)
+def test_detect_columnar_format(path: str, expected: str) -> None:
+    assert detect_columnar_format(path) == expected
+
+
+def test_detect_columnar_format_unsupported() -> None:
+    with pytest.raises(ValueError, match='Unsupported columnar extension'):
+        detect_columnar_format('a.csv')
+
+
+@pytest.mark.parametrize('name', ['out/crawl.parquet', 'out/crawl.arrow'])
+def test_convert_jsonlines_roundtrip(tmp_path: Path, jsonl_path: Path, name: str) -> None:
+    target = convert_jsonlines(jsonl_path, tmp_path / name, batch_size=16)
+
+    assert target.exists()
+    assert load_columnar(target).to_dicts() == RECORDS
+
+
+@pytest.mark.parametrize(
+    'suffix',
+    [
+        'gz',
+        'xz',
+        pytest.param(
+            'zst',
+            marks=pytest.mark.skipif(
+                'zstd' not in available_compressions(), reason='zstd requires Python 3.14+ or the zstandard package'
+            ),
+        ),
+    ],
+)
+def test_convert_compressed_jsonlines(tmp_path: Path, suffix: str) -> None:
+    source = tmp_path / f'crawl.jsonl.{suffix}'
+    save_as_jsonlines(RECORDS, source)
+
+    target = convert_jsonlines(source, tmp_path / 'crawl.parquet')
+
+    assert load_columnar(target).to_dicts() == RECORDS
+
+
+def test_convert_with_explicit_schema(tmp_path: Path, jsonl_path: Path) -> None:
+    schema = {'id': pl.Int32(), 'status': pl.Float64(), 'url': pl.String()}
+    target = convert_jsonlines(jsonl_path, tmp_path / 'crawl.parquet', schema=schema)
+
+    assert scan_columnar(target).collect_schema() == pl.Schema(schema)
+
+
+@pytest.mark.parametrize('name', ['crawl.parquet', 'crawl.arrow'])
+def test_load_columnar_projection_and_predicate(tmp_path: Path, jsonl_path: Path, name: str) -> None:
+    target = convert_jsonlines(jsonl_path, tmp_path / name)
+
+    frame = load_columnar(target, columns=['url'], predicate=pl.col('status') == 500)
+
+    assert frame.columns == ['url']
+    assert frame['url'].to_list() == [record['url'] for record in RECORDS if record['status'] == 500]
+
+
+def test_default_columnar_path() -> None:
+    assert default_columnar_path('data/crawl.jsonl.gz') == Path('data/crawl.parquet')
+    assert default_columnar_path('data/crawl.jsonl', 'ipc') == Path('data/crawl.arrow')
+
+
+def test_ensure_columnar_converts_only_when_stale(jsonl_path: Path) -> None:
+    target = ensure_columnar(jsonl_path)
+    assert target == jsonl_path.with_suffix('.parquet')
+    first_mtime = target.stat().st_mtime_ns
+
+    assert ensure_columnar(jsonl_path).stat().st_mtime_ns == first_mtime
+
+    save_as_jsonlines(RECORDS[:10], jsonl_path)
+    newer = first_mtime + 1_000_000_000
+    os.utime(jsonl_path, ns=(newer, newer))
+
+    assert load_columnar(ensure_columnar(jsonl_path)).height == 10
+
+
+def test_failed_conversion_leaves_no_target(tmp_path: Path) -> None:
+    source = tmp_path / 'crawl.jsonl'
+    save_as_jsonlines(RECORDS * 50, source)
+    with source.open('a') as fout:
+        fout.write('{"id": 1, "status":\n')
+
+    for _ in range(2):
+        with pytest.raises(pl.exceptions.PolarsError):
+            ensure_columnar(source)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['crawl.jsonl']
+
+    save_as_jsonlines(RECORDS, source)
+    assert load_columnar(ensure_columnar(source)).to_dicts() == RECORDS
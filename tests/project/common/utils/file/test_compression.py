@@ -0,0 +1,181 @@
+import gzip
+import lzma
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from project.common.utils.file.async_io import aiter_jsonlines, aload_file, asave_as_jsonlines, asave_file
+from project.common.utils.file.compression import (
+    available_compressions,
+    compress_bytes,
+    decompress_bytes,
+    detect_compression,
+    strip_compression_suffix,
+)
+from project.common.utils.file.factory import FileHandlerFactory
+from project.common.utils.file.io import load_file, save_file
+from project.common.utils.file.jsonlines import (
+    iter_jsonlines,
+    load_jsonlines,
+    load_jsonlines_parallel,
+    save_as_jsonlines,
+)
+from project.common.utils.file.jsonlines_index import build_jsonlines_index
+from project.common.utils.file.stream import WriteOptions, open_for_read, open_for_write
+from project.common.utils.file.xml import iter_xml
+
+requires_zstd = pytest.mark.skipif(
+    'zstd' not in available_compressions(), reason='zstd requires Python 3.14+ or the zstandard package'
+)
+CODEC_SUFFIXES = ['gz', 'xz', pytest.param('zst', marks=requires_zstd)]
+
+
+@pytest.fixture
+def sample_data() -> dict[str, Any]:
+    return {'key': 'value', 'number': 42, 'nested': {'text': 'こんにちは'}}
+
+
+@pytest.mark.parametrize(
+    ('path', 'expected'),
+    [
+        ('data.jsonl.gz', 'gzip'),
+        ('data.JSON.GZ', 'gzip'),
+        ('config.yaml.xz', 'xz'),
+        ('config.toml.zst', 'zstd'),
+        ('data.jsonl', None),
+        ('archive', None),
+    ],
+)
+def test_detect_compression(path: str, expected: str | None) -> None:
+    assert detect_compression(path) == expected
+
+
+def test_strip_compression_suffix() -> None:
+    assert strip_compression_suffix('dir/data.jsonl.gz') == Path('dir/data.jsonl')
+    assert strip_compression_suffix('dir/data.jsonl') == Path('dir/data.jsonl')
+
+
+@pytest.mark.parametrize(
+    ('path', 'expected'),
+    [('config.yaml.gz', 'yaml'), ('config.yml.zst', 'yaml'), ('data.json.xz', 'json'), ('data.xml.gz', 'xml')],
+)
+def test_detect_format_skips_compression_suffix(path: str, expected: str) -> None:
+    assert FileHandlerFactory.detect_format(path) == expected
+
+
+def test_detect_format_rejects_bare_compressed_file() -> None:
+    with pytest.raises(ValueError, match='no extension'):
+        FileHandlerFactory.detect_format('archive.gz')
+
+
+@pytest.mark.parametrize('codec', ['gzip', 'xz', pytest.param('zstd', marks=requires_zstd)])
+def test_compress_bytes_roundtrip(codec: str) -> None:
+    payload = b'abc' * 1000
+    compressed = compress_bytes(payload, codec, level=1)  # type: ignore[arg-type]
+
+    assert len(compressed) < len(payload)
+    assert decompress_bytes(compressed, codec) == payload  # type: ignore[arg-type]
+
+
+def test_output_is_readable_by_standard_tools(tmp_path: Path) -> None:
+    with open_for_write(tmp_path / 'a.txt.gz') as fout:
+        fout.write('gzip text\n')
+    with open_for_write(tmp_path / 'a.txt.xz') as fout:
+        fout.write('xz text\n')
+
+    assert gzip.decompress((tmp_path / 'a.txt.gz').read_bytes()) == b'gzip text\n'
+    assert lzma.decompress((tmp_path / 'a.txt.xz').read_bytes()) == b'xz text\n'
+
+
+def test_gzip_output_is_reproducible(tmp_path: Path) -> None:
+    for name in ('first.json.gz', 'second.json.gz'):
+        save_file({'key': 'value'}, tmp_path / name)
+
+    assert (tmp_path / 'first.json.gz').read_bytes() == (tmp_path / 'second.json.gz').read_bytes()
+
+
+def test_open_for_read_handles_concatenated_gzip_members(tmp_path: Path) -> None:
+    target = tmp_path / 'data.jsonl.gz'
+    target.write_bytes(gzip.compress(b'{"a": 1}\n') + gzip.compress(b'{"a": 2}\n'))
+
+    assert load_jsonlines(target) == [{'a': 1}, {'a': 2}]
+
+
+@pytest.mark.parametrize('suffix', CODEC_SUFFIXES)
+@pytest.mark.parametrize('ext', ['json', 'yaml', 'toml', 'xml'])
+def test_save_and_load_compressed_file(tmp_path: Path, sample_data: dict[str, Any], ext: str, suffix: str) -> None:
+    target = tmp_path / f'data.{ext}.{suffix}'
+    plain = tmp_path / f'data.{ext}'
+    save_file(sample_data, target)
+    save_file(sample_data, plain)
+
+    assert load_file(target) == load_file(plain)
+    with open_for_read(target, mode='rb') as fin:
+        assert fin.read() == FileHandlerFactory.create(ext).dumps(sample_data)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize('suffix', CODEC_SUFFIXES)
+def test_atomic_compressed_write(tmp_path: Path, sample_data: dict[str, Any], suffix: str) -> None:
+    target = tmp_path / f'data.json.{suffix}'
+    save_file(sample_data, target, write_options=WriteOptions(atomic=True, compression_level=1))
+
+    assert load_file(target) == sample_data
+    assert [path.name for path in tmp_path.iterdir()] == [target.name]
+
+
+def test_compression_level_changes_output(tmp_path: Path) -> None:
+    records = [{'id': i, 'text': f'record number {i}'} for i in range(2000)]
+    fast = tmp_path / 'fast.jsonl.xz'
+    small = tmp_path / 'small.jsonl.xz'
+    save_as_jsonlines(records, fast, write_options=WriteOptions(compression_level=0))
+    save_as_jsonlines(records, small, write_options=WriteOptions(compression_level=9))
+
+    assert fast.read_bytes() != small.read_bytes()
+    assert load_jsonlines(fast) == load_jsonlines(small) == records
+
+
+@pytest.mark.parametrize('suffix', CODEC_SUFFIXES)
+def test_jsonlines_streaming(tmp_path: Path, suffix: str) -> None:
+    records = [{'id': i} for i in range(250)]
+    target = tmp_path / f'data.jsonl.{suffix}'
+    save_as_jsonlines(iter(records), target, chunk_size=32)
+
+    assert list(iter_jsonlines(target)) == records
+    assert load_jsonlines_parallel(target, max_workers=2, shard_size=64) == records
+
+
+def test_iter_xml_compressed(tmp_path: Path) -> None:
+    target = tmp_path / 'items.xml.gz'
+    target.write_bytes(gzip.compress(b'<root><item><id>1</id></item><item><id>2</id></item></root>'))
+
+    assert list(iter_xml(target, tag='item')) == [{'id': '1'}, {'id': '2'}]
+
+
+def test_index_rejects_compressed_file(tmp_path: Path) -> None:
+    target = tmp_path / 'data.jsonl.gz'
+    save_as_jsonlines([{'a': 1}], target)
+
+    with pytest.raises(ValueError, match='compressed'):
+        build_jsonlines_index(target)
+
+
+@pytest.mark.parametrize('suffix', CODEC_SUFFIXES)
+@pytest.mark.asyncio
+async def test_async_compressed_roundtrip(tmp_path: Path, sample_data: dict[str, Any], suffix: str) -> None:
+    target = tmp_path / f'data.yaml.{suffix}'
+    await asave_file(sample_data, target)
+
+    assert load_file(target) == sample_data
+    assert await aload_file(target) == sample_data
+
+
+@pytest.mark.parametrize('suffix', CODEC_SUFFIXES)
+@pytest.mark.asyncio
+async def test_async_jsonlines_compressed(tmp_path: Path, suffix: str) -> None:
+    records = [{'id': i} for i in range(300)]
+    target = tmp_path / f'data.jsonl.{suffix}'
+    await asave_as_jsonlines(records, target, chunk_size=50)
+
+    assert load_jsonlines(target) == records
+    assert [record async for record in aiter_jsonlines(target, read_size=100)] == records
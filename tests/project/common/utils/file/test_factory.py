@@ -1,7 +1,12 @@
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 
 from project.common.utils.file.factory import FileHandlerFactory, get_file_handler
+from project.common.utils.file.io import load_file, save_file
 from project.common.utils.file.json import JsonFileHandler
+from project.common.utils.file.msgpack import MsgpackFileHandler
 from project.common.utils.file.toml import TomlFileHandler
 from project.common.utils.file.xml import XmlFileHandler
 from project.common.utils.file.yaml import YamlFileHandler
@@ -27,6 +32,11 @@ def test_create_xml_handler() -> None:
     assert isinstance(handler, XmlFileHandler)
 
 
+def test_create_msgpack_handler() -> None:
+    handler = FileHandlerFactory.create('msgpack')
+    assert isinstance(handler, MsgpackFileHandler)
+
+
 def test_create_unsupported_format() -> None:
     with pytest.raises(ValueError, match='Unsupported file format'):
         FileHandlerFactory.create('txt')  # type: ignore[arg-type]
@@ -57,6 +67,12 @@ def test_from_path_xml() -> None:
     assert isinstance(handler, XmlFileHandler)
 
 
+@pytest.mark.parametrize('path', ['cache.msgpack', 'cache.mpk', 'cache.msgpack.zst'])
+def test_from_path_msgpack(path: str) -> None:
+    handler = FileHandlerFactory.from_path(path)
+    assert isinstance(handler, MsgpackFileHandler)
+
+
 def test_from_path_no_extension() -> None:
     with pytest.raises(ValueError, match='no extension'):
         FileHandlerFactory.from_path('config')
@@ -70,3 +86,79 @@ def test_from_path_unsupported_extension() -> None:
 def test_get_file_handler() -> None:
     handler = get_file_handler('settings.json')
     assert isinstance(handler, JsonFileHandler)
+
+
+class _CsvFileHandler:
+    def load(self, path: str | Path) -> list[list[str]]:
+        return [line.split(',') for line in Path(path).read_text(encoding='utf-8').splitlines()]
+
+    def loads(self, data: str | bytes) -> list[list[str]]:
+        text = data.decode('utf-8') if isinstance(data, bytes) else data
+        return [line.split(',') for line in text.splitlines()]
+
+    def dumps(self, data: list[list[str]]) -> bytes:
+        return ''.join(','.join(row) + '\n' for row in data).encode('utf-8')
+
+    def save(self, data: list[list[str]], path: str | Path, **_: object) -> None:
+        Path(path).write_bytes(self.dumps(data))
+
+
+@pytest.fixture
+def csv_format() -> Iterator[str]:
+    FileHandlerFactory.register('csv', _CsvFileHandler, extensions=['csv', '.TSV'])
+    yield 'csv'
+    FileHandlerFactory.unregister('csv')
+
+
+def test_create_returns_shared_instance() -> None:
+    assert FileHandlerFactory.create('json') is FileHandlerFactory.create('json')
+    assert get_file_handler('a.yaml') is get_file_handler('b.yml')
+
+
+def test_detect_format_is_case_insensitive_and_ignores_dotted_directories() -> None:
+    assert FileHandlerFactory.detect_format('CONFIG.YAML') == 'yaml'
+    assert FileHandlerFactory.detect_format(Path('dir.json') / 'settings.toml') == 'toml'
+    with pytest.raises(ValueError, match='no extension'):
+        FileHandlerFactory.detect_format(Path('dir.json') / 'settings')
+
+
+def test_register_custom_format(tmp_path: Path, csv_format: str) -> None:
+    path = tmp_path / 'rows.tsv'
+    save_file([['a', 'b'], ['1', '2']], path)
+
+    assert FileHandlerFactory.detect_format('rows.csv') == csv_format
+    assert FileHandlerFactory.detect_format('rows.csv.gz') == csv_format
+    assert load_file(path) == [['a', 'b'], ['1', '2']]
+    assert isinstance(get_file_handler(path), _CsvFileHandler)
+
+
+def test_register_by_dotted_path() -> None:
+    FileHandlerFactory.register('settings', 'project.common.utils.file.json:JsonFileHandler', extensions=['settings'])
+    try:
+        assert isinstance(FileHandlerFactory.from_path('app.settings'), JsonFileHandler)
+    finally:
+        FileHandlerFactory.unregister('settings')
+
+
+def test_register_rejects_duplicates(csv_format: str) -> None:
+    with pytest.raises(ValueError, match='already registered'):
+        FileHandlerFactory.register(csv_format, _CsvFileHandler)
+    with pytest.raises(ValueError, match=r'extensions already registered: json'):
+        FileHandlerFactory.register('other', _CsvFileHandler, extensions=['json'])
+
+
+def test_register_override_replaces_cached_instance(csv_format: str) -> None:
+    before = FileHandlerFactory.create(csv_format)
+    FileHandlerFactory.register(csv_format, _CsvFileHandler, override=True)
+
+    assert FileHandlerFactory.create(csv_format) is not before
+
+
+def test_unregister_removes_extensions() -> None:
+    FileHandlerFactory.register('temp', _CsvFileHandler, extensions=['tmpfmt'])
+    FileHandlerFactory.unregister('temp')
+
+    with pytest.raises(ValueError, match='Unsupported file extension'):
+        FileHandlerFactory.detect_format('data.tmpfmt')
+    with pytest.raises(ValueError, match='Unsupported file format'):
+        FileHandlerFactory.unregister('temp')
@@ -1,9 +1,16 @@
+import concurrent.futures
+import subprocess
+import sys
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from project.common.utils.file.io import load_file, save_file
+from project.common.utils.file.io import load_file, load_files, save_file
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
 
 
 @pytest.fixture
@@ -135,3 +142,117 @@ def test_roundtrip_preserves_data_types(tmp_path: Path) -> None:
     save_file(common_data, toml_path)
     loaded = load_file(toml_path)
     assert loaded == common_data
+
+
+def test_load_files_mixed_formats(tmp_path: Path, sample_data: dict[str, Any]) -> None:
+    paths = []
+    for ext in ['json', 'yaml', 'yml', 'toml']:
+        file_path = tmp_path / f'test.{ext}'
+        save_file(sample_data, file_path)
+        paths.append(file_path)
+
+    result = load_files(paths, max_workers=4)
+
+    assert result.ok
+    assert result.data == dict.fromkeys(paths, sample_data)
+
+
+def test_load_files_reports_errors_per_file(tmp_path: Path, sample_data: dict[str, Any]) -> None:
+    good = tmp_path / 'good.json'
+    save_file(sample_data, good)
+    broken = tmp_path / 'broken.json'
+    broken.write_text('{"unterminated": ')
+    unsupported = tmp_path / 'notes.txt'
+    unsupported.write_text('plain text')
+    missing = tmp_path / 'missing.yaml'
+
+    result = load_files([good, broken, str(unsupported), missing])
+
+    assert not result.ok
+    assert result.data == {good: sample_data}
+    assert set(result.errors) == {broken, unsupported, missing}
+    assert isinstance(result.errors[unsupported], ValueError)
+    assert isinstance(result.errors[missing], FileNotFoundError)
+
+
+def test_load_files_uses_process_pool_for_heavy_formats(tmp_path: Path, sample_data: dict[str, Any]) -> None:
+    paths = []
+    for i in range(4):
+        file_path = tmp_path / f'config{i}.yaml'
+        save_file({**sample_data, 'index': i}, file_path)
+        paths.append(file_path)
+    broken = tmp_path / 'broken.yaml'
+    broken.write_text('key: [unclosed')
+
+    result = load_files([*paths, broken], process_workers=2, process_threshold_bytes=0)
+
+    assert result.data == {path: {**sample_data, 'index': i} for i, path in enumerate(paths)}
+    assert set(result.errors) == {broken}
+
+
+def test_load_files_mixing_formats_forks_before_starting_threads(
+    tmp_path: Path, sample_data: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    submissions: list[tuple[int, BaseContext | None]] = []
+
+    class RecordingProcessPool(concurrent.futures.ProcessPoolExecutor):
+        def submit(self, *args: Any, **kwargs: Any) -> concurrent.futures.Future[Any]:  # noqa: ANN401
+            submissions.append((threading.active_count(), self._mp_context))
+            return super().submit(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', RecordingProcessPool)
+    paths = []
+    for i, ext in enumerate(['json', 'yaml', 'toml', 'xml', 'json', 'yaml']):
+        file_path = tmp_path / f'data{i}.{ext}'
+        save_file({'root': {**sample_data, 'index': str(i)}}, file_path)
+        paths.append(file_path)
+    threads_before = threading.active_count()
+
+    result = load_files(paths, max_workers=4, process_workers=2, process_threshold_bytes=0)
+
+    assert result.ok
+    assert result.data == {path: load_file(path) for path in paths}
+    assert len(submissions) == 3
+    threads_at_first_submit, mp_context = submissions[0]
+    assert threads_at_first_submit == threads_before
+    assert mp_context is not None
+    assert mp_context.get_start_method() == 'forkserver'
+
+
+def test_importing_io_does_not_import_format_backends() -> None:
+    backends = ['yaml', 'toml', 'xml.etree.ElementTree', 'msgpack', 'jsonlines', 'multiprocessing']
+    code = (
+        'import sys\n'
+        'import project.common.utils.file.io\n'
+        f'print(",".join(name for name in {backends!r} if name in sys.modules))'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == ''
+
+
+def test_handler_backend_is_imported_on_first_use(tmp_path: Path) -> None:
+    code = (
+        'import sys\n'
+        'from project.common.utils.file.io import load_file\n'
+        'assert "yaml" not in sys.modules\n'
+        f'load_file({str(tmp_path / "config.yaml")!r})\n'
+        'print("yaml" in sys.modules)'
+    )
+    (tmp_path / 'config.yaml').write_text('key: value\n', encoding='utf-8')
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == 'True'
+
+
+def test_msgpack_handler_does_not_import_json_modules() -> None:
+    modules = ['project.common.utils.file.jsonlines', 'project.common.utils.file.json_codec', 'jsonlines']
+    code = (
+        'import sys\n'
+        'from project.common.utils.file.factory import get_file_handler\n'
+        'get_file_handler("data.msgpack")\n'
+        f'print(",".join(name for name in {modules!r} if name in sys.modules))'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == ''
@@ -0,0 +1,141 @@
+import datetime as dt
+import enum
+import json
+import math
+import sys
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from project.common.utils.file.json_codec import (
+    JsonBackend,
+    StdlibJsonCodec,
+    available_json_backends,
+    get_json_codec,
+)
+
+PAYLOADS: list[Any] = [
+    {'key': 'value', 'number': 42, 'nested': {'list': [1, 2.5, None, True]}},
+    {'text': 'こんにちは', 'escape': 'line\nbreak "quoted" \\ slash'},
+    [{'id': i, 'score': i / 8} for i in range(10)],
+    'plain string',
+    0,
+]
+
+
+class Color(enum.Enum):
+    RED = 'red'
+
+
+# Values that are not JSON types, with the backends that encode them anyway.
+NON_PORTABLE_VALUES: list[tuple[Any, set[JsonBackend]]] = [
+    (b'x', {'msgspec'}),
+    (dt.date(2024, 1, 2), {'msgspec'}),
+    (dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.UTC), {'msgspec'}),
+    (uuid.UUID(int=1), {'orjson', 'msgspec'}),
+    (Color.RED, {'orjson', 'msgspec'}),
+]
+
+
+@pytest.fixture(params=available_json_backends())
+def backend(request: pytest.FixtureRequest) -> JsonBackend:
+    return request.param
+
+
+def test_stdlib_backend_always_available() -> None:
+    assert available_json_backends()[-1] == 'stdlib'
+    assert isinstance(get_json_codec('stdlib'), StdlibJsonCodec)
+
+
+def test_default_codec_is_preferred_backend() -> None:
+    assert get_json_codec().name == available_json_backends()[0]
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_dumps_matches_stdlib_bytes(backend: JsonBackend, payload: Any) -> None:  # noqa: ANN401
+    codec = get_json_codec(backend)
+    assert codec.dumps(payload) == json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_loads_roundtrip(backend: JsonBackend, payload: Any) -> None:  # noqa: ANN401
+    codec = get_json_codec(backend)
+    encoded = codec.dumps(payload)
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.encode('utf-8')) == payload
+
+
+def test_values_unsupported_by_fast_backends_fall_back(backend: JsonBackend) -> None:
+    codec = get_json_codec(backend)
+    assert codec.dumps({'big': 2**70 + 1}) == '{"big":1180591620717411303425}'
+    assert codec.loads('{"big": 1180591620717411303425}') == {'big': 2**70 + 1}
+    assert codec.loads(b'[-9223372036854775809, 18446744073709551616]') == [-(2**63) - 1, 2**64]
+
+
+@pytest.mark.parametrize(('value', 'encoded_by'), NON_PORTABLE_VALUES)
+def test_non_json_types_are_rejected_unless_backend_encodes_them(
+    backend: JsonBackend,
+    value: Any,  # noqa: ANN401
+    encoded_by: set[JsonBackend],
+) -> None:
+    codec = get_json_codec(backend)
+    if backend in encoded_by:
+        assert isinstance(codec.loads(codec.dumps({'value': value}))['value'], str)
+    else:
+        with pytest.raises(TypeError, match='not JSON serializable'):
+            codec.dumps({'value': value})
+
+
+@pytest.fixture
+def broken_fast_backends(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # Modules that are found but fail to import, like a wheel built for another ABI.
+    for name in ('orjson', 'msgspec'):
+        (tmp_path / f'{name}.py').write_text('raise ImportError("undefined symbol")\n')
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.syspath_prepend(tmp_path)
+    get_json_codec.cache_clear()
+    yield
+    get_json_codec.cache_clear()
+
+
+@pytest.mark.usefixtures('broken_fast_backends')
+def test_backends_that_fail_to_import_are_skipped() -> None:
+    assert available_json_backends() == ['stdlib']
+    assert get_json_codec().name == 'stdlib'
+
+
+def test_invalid_json_raises_json_decode_error(backend: JsonBackend) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        get_json_codec(backend).loads('{"unterminated": ')
+
+
+def test_unknown_backend_raises() -> None:
+    with pytest.raises(ValueError, match='Unsupported JSON backend'):
+        get_json_codec('ujson')  # type: ignore[arg-type]
+
+
+@dataclass
+class Point:
+    x: int
+    label: str
+    scale: float = 1.5
+
+
+def test_non_finite_floats_are_not_encoded_as_null(backend: JsonBackend) -> None:
+    codec = get_json_codec(backend)
+    data = {'values': [1.0, math.nan, math.inf, -math.inf], 'none': None}
+
+    assert codec.dumps(data) == '{"values":[1.0,NaN,Infinity,-Infinity],"none":null}'
+    assert codec.dumps([Point(1, 'null', math.nan)]) == '[{"x":1,"label":"null","scale":NaN}]'
+
+
+def test_dataclasses_encode_identically_on_every_backend(backend: JsonBackend) -> None:
+    data = {'points': [Point(1, 'a'), Point(2, 'ü', 0.25)]}
+
+    assert get_json_codec(backend).dumps(data) == (
+        '{"points":[{"x":1,"label":"a","scale":1.5},{"x":2,"label":"ü","scale":0.25}]}'
+    )
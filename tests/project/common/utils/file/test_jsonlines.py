@@ -0,0 +1,102 @@
+import threading
+import warnings
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from project.common.utils.file.jsonlines import (
+    iter_jsonlines,
+    iter_jsonlines_parallel,
+    load_jsonlines,
+    load_jsonlines_parallel,
+    save_as_jsonlines,
+)
+
+
+def _records(count: int) -> Iterator[dict[str, object]]:
+    for i in range(count):
+        yield {'id': i, 'text': f'record-{i}'}
+
+
+def test_save_and_load_jsonlines(tmp_path: Path) -> None:
+    data: list[dict[str, object]] = [{'name': 'alice', 'age': 30}, {'name': 'bob', 'age': 25}]
+    jsonl_file = tmp_path / 'nested' / 'data.jsonl'
+
+    save_as_jsonlines(data, jsonl_file)
+    assert jsonl_file.exists()
+    assert load_jsonlines(jsonl_file) == data
+    assert load_jsonlines(str(jsonl_file)) == data
+
+
+def test_iter_jsonlines_is_lazy(tmp_path: Path) -> None:
+    jsonl_file = tmp_path / 'data.jsonl'
+    save_as_jsonlines(_records(10), jsonl_file)
+
+    iterator = iter_jsonlines(jsonl_file)
+    assert isinstance(iterator, Iterator)
+    assert next(iterator) == {'id': 0, 'text': 'record-0'}
+    assert len(list(iterator)) == 9
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+def test_save_as_jsonlines_accepts_generator(tmp_path: Path, chunk_size: int) -> None:
+    jsonl_file = tmp_path / 'data.jsonl'
+    save_as_jsonlines(_records(25), jsonl_file, chunk_size=chunk_size)
+
+    assert len(jsonl_file.read_text(encoding='utf-8').splitlines()) == 25
+    assert list(iter_jsonlines(jsonl_file)) == list(_records(25))
+
+
+def test_save_as_jsonlines_rejects_invalid_chunk_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match='chunk_size must be positive'):
+        save_as_jsonlines([], tmp_path / 'data.jsonl', chunk_size=0)
+
+
+@pytest.mark.parametrize('shard_size', [1, 64, 1024 * 1024])
+def test_load_jsonlines_parallel_ordered(tmp_path: Path, shard_size: int) -> None:
+    jsonl_file = tmp_path / 'data.jsonl'
+    save_as_jsonlines(_records(200), jsonl_file)
+
+    result = load_jsonlines_parallel(jsonl_file, max_workers=2, shard_size=shard_size)
+    assert result == list(_records(200))
+
+
+def test_load_jsonlines_parallel_unordered(tmp_path: Path) -> None:
+    jsonl_file = tmp_path / 'data.jsonl'
+    save_as_jsonlines(_records(200), jsonl_file)
+
+    result = load_jsonlines_parallel(jsonl_file, max_workers=2, ordered=False, shard_size=128)
+    assert sorted(result, key=lambda record: int(str(record['id']))) == list(_records(200))
+
+
+def test_iter_jsonlines_parallel_skips_blank_lines_and_bom(tmp_path: Path) -> None:
+    jsonl_file = tmp_path / 'data.jsonl'
+    jsonl_file.write_bytes(b'\xef\xbb\xbf{"id": 0}\n\n{"id": 1}\n{"id": 2}')
+
+    assert list(iter_jsonlines_parallel(jsonl_file, max_workers=1, shard_size=4)) == [{'id': 0}, {'id': 1}, {'id': 2}]
+
+
+def test_load_jsonlines_parallel_does_not_fork_a_threaded_process(tmp_path: Path) -> None:
+    jsonl_file = tmp_path / 'data.jsonl'
+    save_as_jsonlines(_records(200), jsonl_file)
+    stop = threading.Event()
+    background = threading.Thread(target=stop.wait)
+    background.start()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            result = load_jsonlines_parallel(jsonl_file, max_workers=2, shard_size=64)
+    finally:
+        stop.set()
+        background.join()
+
+    assert result == list(_records(200))
+    assert not [warning for warning in caught if 'fork()' in str(warning.message)]
+
+
+def test_load_jsonlines_parallel_empty_file(tmp_path: Path) -> None:
+    jsonl_file = tmp_path / 'empty.jsonl'
+    jsonl_file.touch()
+
+    assert load_jsonlines_parallel(jsonl_file, max_workers=1) == []
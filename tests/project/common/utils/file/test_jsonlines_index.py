@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from project.common.utils.file.jsonlines import iter_jsonlines, save_as_jsonlines
+from project.common.utils.file.jsonlines_index import (
+    IndexedJsonlinesReader,
+    build_jsonlines_index,
+    default_index_path,
+)
+
+
+@pytest.fixture
+def jsonl_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'data.jsonl'
+    save_as_jsonlines(({'id': i, 'text': f'record-{i}'} for i in range(100)), path)
+    return path
+
+
+def test_build_index_writes_sidecar(jsonl_file: Path) -> None:
+    index_path = build_jsonlines_index(jsonl_file)
+
+    assert index_path == default_index_path(jsonl_file)
+    assert index_path.name == 'data.jsonl.idx'
+    assert index_path.exists()
+
+
+def test_concurrent_rebuilds_do_not_interfere(tmp_path: Path) -> None:
+    path = tmp_path / 'large.jsonl'
+    save_as_jsonlines(({'id': i} for i in range(50_000)), path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(build_jsonlines_index, [path] * 16))
+
+    assert set(results) == {default_index_path(path)}
+    assert sorted(child.name for child in tmp_path.iterdir()) == ['large.jsonl', 'large.jsonl.idx']
+    with IndexedJsonlinesReader(path) as reader:
+        assert len(reader) == 50_000
+        assert reader[49_999] == {'id': 49_999}
+
+
+def test_reader_random_access(jsonl_file: Path) -> None:
+    with IndexedJsonlinesReader(jsonl_file) as reader:
+        assert len(reader) == 100
+        assert reader[0] == {'id': 0, 'text': 'record-0'}
+        assert reader[57] == {'id': 57, 'text': 'record-57'}
+        assert reader[-1] == {'id': 99, 'text': 'record-99'}
+        assert reader.get_many([3, 1, 2]) == [
+            {'id': 3, 'text': 'record-3'},
+            {'id': 1, 'text': 'record-1'},
+            {'id': 2, 'text': 'record-2'},
+        ]
+        with pytest.raises(IndexError):
+            reader[100]
+
+
+def test_reader_matches_iter_jsonlines_with_bom_and_crlf(tmp_path: Path) -> None:
+    path = tmp_path / 'irregular.jsonl'
+    path.write_bytes(b'\xef\xbb\xbf{"id": 0}\r\n{"id": 1}\r\n{"id": 2}')
+
+    with IndexedJsonlinesReader(path) as reader:
+        assert reader.get_many(range(len(reader))) == list(iter_jsonlines(path))
+
+
+def test_reader_skips_blank_lines(tmp_path: Path) -> None:
+    path = tmp_path / 'blank.jsonl'
+    path.write_bytes(b'{"id": 0}\n\n{"id": 1}\n  \n{"id": 2}\n')
+
+    with IndexedJsonlinesReader(path) as reader:
+        assert reader.get_many(range(len(reader))) == [{'id': 0}, {'id': 1}, {'id': 2}]
+
+
+def test_reader_rebuilds_stale_index(jsonl_file: Path) -> None:
+    with IndexedJsonlinesReader(jsonl_file) as reader:
+        assert len(reader) == 100
+
+    with jsonl_file.open(mode='a', encoding='utf-8') as fout:
+        fout.write('{"id": 100, "text": "appended"}\n')
+    stat = jsonl_file.stat()
+    os.utime(jsonl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    with IndexedJsonlinesReader(jsonl_file) as reader:
+        assert len(reader) == 101
+        assert reader[100] == {'id': 100, 'text': 'appended'}
+
+
+def test_reader_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / 'empty.jsonl'
+    path.touch()
+
+    with IndexedJsonlinesReader(path) as reader:
+        assert len(reader) == 0
+        with pytest.raises(IndexError):
+            reader[0]
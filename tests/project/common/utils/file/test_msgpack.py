@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from project.common.utils.file.io import load_file, save_file
+from project.common.utils.file.msgpack import (
+    MsgpackFileHandler,
+    dumps_as_msgpack,
+    iter_msgpack_records,
+    load_msgpack,
+    loads_msgpack,
+    save_as_msgpack,
+    save_as_msgpack_records,
+)
+
+msgpack = pytest.importorskip('msgpack')
+
+
+@pytest.fixture
+def sample_data() -> dict[str, Any]:
+    return {
+        'name': 'テスト',
+        'count': 3,
+        'ratio': 0.5,
+        'flags': [True, False, None],
+        'blob': b'\x00\xff',
+        'nested': {'1': 'one'},
+    }
+
+
+def test_save_and_load_msgpack(tmp_path: Path, sample_data: dict[str, Any]) -> None:
+    path = tmp_path / 'nested' / 'cache.msgpack'
+    save_as_msgpack(sample_data, path)
+
+    assert load_msgpack(path) == sample_data
+    assert msgpack.unpackb(path.read_bytes(), raw=False) == sample_data
+
+
+def test_loads_and_dumps_roundtrip(sample_data: dict[str, Any]) -> None:
+    encoded = dumps_as_msgpack(sample_data)
+
+    assert isinstance(encoded, bytes)
+    assert loads_msgpack(encoded) == sample_data
+
+
+def test_loads_msgpack_non_string_keys() -> None:
+    assert loads_msgpack(dumps_as_msgpack({1: 'one', 2: 'two'})) == {1: 'one', 2: 'two'}
+
+
+def test_loads_msgpack_rejects_str() -> None:
+    with pytest.raises(TypeError, match='binary format'):
+        loads_msgpack('{}')
+
+
+def test_save_msgpack_without_parents_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        save_as_msgpack({'key': 'value'}, tmp_path / 'level1' / 'level2' / 'cache.msgpack', parents=False)
+
+
+@pytest.mark.parametrize('name', ['records.msgpack', 'records.msgpack.gz'])
+def test_record_stream_roundtrip(tmp_path: Path, name: str) -> None:
+    records = ({'id': i, 'payload': bytes([i % 256]) * 10} for i in range(500))
+    path = tmp_path / name
+    save_as_msgpack_records(records, path, chunk_size=64)
+
+    loaded = list(iter_msgpack_records(path))
+
+    assert len(loaded) == 500
+    assert loaded[0] == {'id': 0, 'payload': b'\x00' * 10}
+    assert loaded[-1]['id'] == 499
+
+
+def test_record_stream_is_lazy(tmp_path: Path) -> None:
+    path = tmp_path / 'records.mpk'
+    save_as_msgpack_records([{'id': 1}, {'id': 2}], path)
+
+    records = iter_msgpack_records(path)
+
+    assert next(records) == {'id': 1}
+    assert next(records) == {'id': 2}
+    assert next(records, None) is None
+
+
+def test_save_as_msgpack_records_rejects_non_positive_chunk_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match='chunk_size must be positive'):
+        save_as_msgpack_records([{'id': 1}], tmp_path / 'records.msgpack', chunk_size=0)
+
+
+def test_handler_and_generic_io(tmp_path: Path, sample_data: dict[str, Any]) -> None:
+    path = tmp_path / 'cache.mpk'
+    save_file(sample_data, path)
+
+    assert load_file(path) == sample_data
+    assert MsgpackFileHandler().loads(MsgpackFileHandler().dumps(sample_data)) == sample_data
@@ -0,0 +1,116 @@
+import json
+import os
+import stat
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from project.common.utils.file.io import save_file
+from project.common.utils.file.jsonlines import load_jsonlines, save_as_jsonlines
+from project.common.utils.file.stream import WriteOptions, open_for_write
+from project.common.utils.file.xml import load_xml, save_as_xml
+
+ATOMIC = WriteOptions(atomic=True)
+
+
+def test_direct_write(tmp_path: Path) -> None:
+    target = tmp_path / 'out.txt'
+    with open_for_write(target, options=WriteOptions(buffer_size=16)) as fout:
+        fout.write('hello')
+
+    assert target.read_text(encoding='utf-8') == 'hello'
+
+
+def test_atomic_write_replaces_target_and_leaves_no_temp_files(tmp_path: Path) -> None:
+    target = tmp_path / 'out.bin'
+    target.write_bytes(b'old')
+
+    with open_for_write(target, mode='wb', options=ATOMIC) as fout:
+        fout.write(b'new')
+        assert target.read_bytes() == b'old'
+
+    assert target.read_bytes() == b'new'
+    assert [path.name for path in tmp_path.iterdir()] == ['out.bin']
+
+
+def test_atomic_write_failure_keeps_previous_contents(tmp_path: Path) -> None:
+    target = tmp_path / 'out.txt'
+    target.write_text('old', encoding='utf-8')
+
+    def write_then_fail() -> None:
+        with open_for_write(target, options=ATOMIC) as fout:
+            fout.write('partial')
+            raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        write_then_fail()
+
+    assert target.read_text(encoding='utf-8') == 'old'
+    assert [path.name for path in tmp_path.iterdir()] == ['out.txt']
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX permission bits')
+def test_atomic_write_preserves_permissions(tmp_path: Path) -> None:
+    target = tmp_path / 'out.txt'
+    target.write_text('old', encoding='utf-8')
+    target.chmod(0o640)
+
+    with open_for_write(target, options=ATOMIC) as fout:
+        fout.write('new')
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+@pytest.mark.parametrize(('fsync', 'expected_calls'), [(True, 2), (False, 0)])
+def test_atomic_write_fsync_option(tmp_path: Path, fsync: bool, expected_calls: int) -> None:
+    with (
+        patch('os.fsync') as fsync_mock,
+        open_for_write(tmp_path / 'out.txt', options=WriteOptions(atomic=True, fsync=fsync)) as fout,
+    ):
+        fout.write('data')
+
+    assert fsync_mock.call_count == (expected_calls if os.name == 'posix' else expected_calls // 2)
+
+
+@pytest.mark.parametrize('ext', ['json', 'yaml', 'toml', 'xml'])
+def test_save_file_atomic_matches_direct_write(tmp_path: Path, ext: str) -> None:
+    data = {'key': 'value', 'nested': {'number': 1}}
+    save_file(data, tmp_path / f'direct.{ext}')
+    save_file(data, tmp_path / f'atomic.{ext}', write_options=WriteOptions(atomic=True, buffer_size=1024))
+
+    assert (tmp_path / f'atomic.{ext}').read_bytes() == (tmp_path / f'direct.{ext}').read_bytes()
+
+
+def test_save_as_jsonlines_and_xml_atomic(tmp_path: Path) -> None:
+    records: list[dict[str, object]] = [{'id': i} for i in range(10)]
+    save_as_jsonlines(records, tmp_path / 'data.jsonl', chunk_size=3, write_options=ATOMIC)
+    save_as_xml({'root': {'name': 'value'}}, tmp_path / 'data.xml', write_options=ATOMIC)
+
+    assert load_jsonlines(tmp_path / 'data.jsonl') == records
+    assert load_xml(tmp_path / 'data.xml') == {'root': {'name': 'value'}}
+
+
+def test_concurrent_readers_never_see_partial_file(tmp_path: Path) -> None:
+    target = tmp_path / 'state.json'
+    payloads = [{'generation': i, 'values': list(range(2000))} for i in range(20)]
+    save_file(payloads[0], target, write_options=ATOMIC)
+    stop = threading.Event()
+    errors: list[Exception] = []
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                json.loads(target.read_text(encoding='utf-8'))
+            except Exception as exc:  # noqa: BLE001
+                errors.append(exc)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for payload in payloads:
+        save_file(payload, target, write_options=WriteOptions(atomic=True, fsync=False))
+    stop.set()
+    thread.join()
+
+    assert errors == []
@@ -1,9 +1,20 @@
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from project.common.utils.file.xml import XmlFileHandler, load_xml, save_as_xml
+from project.common.utils.file.xml import (
+    XmlFileHandler,
+    _dict_to_xml,
+    _xml_to_dict,
+    dumps_as_xml,
+    iter_xml,
+    load_xml,
+    loads_xml,
+    save_as_xml,
+)
 
 
 @pytest.fixture
@@ -97,6 +108,14 @@ def test_xml_file_handler_custom_root_tag(tmp_path: Path) -> None:
     assert '<config>' in content
 
 
+def test_xml_file_handler_root_tag_is_read_only() -> None:
+    handler = XmlFileHandler(root_tag='config')
+
+    with pytest.raises(AttributeError):
+        handler.root_tag = 'other'  # type: ignore[misc]
+    assert handler.root_tag == 'config'
+
+
 def test_save_xml_creates_parent_directories(tmp_path: Path, sample_xml_data: dict[str, Any]) -> None:
     xml_file = tmp_path / 'nested' / 'dir' / 'data.xml'
     save_as_xml(sample_xml_data, xml_file)
@@ -130,3 +149,139 @@ def test_load_xml_accepts_string_path(tmp_path: Path, sample_xml_data: dict[str,
 
     result = load_xml(str(xml_file))
     assert result == sample_xml_data
+
+
+@pytest.fixture
+def repeated_xml_file(tmp_path: Path) -> Path:
+    xml_file = tmp_path / 'export.xml'
+    xml_file.write_text("""<?xml version="1.0" encoding="utf-8"?>
+<export>
+  <meta><version>1</version></meta>
+  <records>
+    <record><id>1</id><tags><item>a</item><item>b</item></tags></record>
+    <record><id>2</id><name>second</name></record>
+    <record>plain</record>
+  </records>
+</export>""")
+    return xml_file
+
+
+def test_iter_xml_by_tag_matches_xml_to_dict(repeated_xml_file: Path) -> None:
+    tree = ET.parse(repeated_xml_file)  # noqa: S314
+    expected = [_xml_to_dict(element) for element in tree.getroot().iter('record')]
+
+    result = list(iter_xml(repeated_xml_file, tag='record'))
+    assert result == expected
+    assert result[0] == {'id': '1', 'tags': {'tags': ['a', 'b']}}
+    assert result[2] == 'plain'
+
+
+def test_iter_xml_by_tag_drops_non_matching_elements(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    xml_file = tmp_path / 'mixed.xml'
+    count = 5000
+    body = ''.join(f'<meta><n>{i}</n></meta><group><item><id>{i}</id></item></group>' for i in range(count))
+    xml_file.write_text(f'<root>{body}</root>')
+    roots: list[ET.Element] = []
+    iterparse = ET.iterparse
+
+    def recording_iterparse(*args: Any, **kwargs: Any) -> Iterator[tuple[str, Any]]:  # noqa: ANN401
+        for event, element in iterparse(*args, **kwargs):
+            if not roots:
+                roots.append(element)
+            yield event, element
+
+    monkeypatch.setattr(ET, 'iterparse', recording_iterparse)
+    retained = []
+    for item in iter_xml(xml_file, tag='item'):
+        assert isinstance(item, dict)
+        retained.append(len(roots[0]))
+
+    # iterparse reads ahead, so a bounded number of not-yet-handled elements is still attached.
+    assert len(retained) == count
+    assert max(retained) < count // 4
+    assert len(roots[0]) == 0
+
+
+def test_iter_xml_yields_root_children_by_default(repeated_xml_file: Path) -> None:
+    tree = ET.parse(repeated_xml_file)  # noqa: S314
+    expected = [_xml_to_dict(element) for element in tree.getroot()]
+
+    assert list(iter_xml(repeated_xml_file)) == expected
+
+
+def test_iter_xml_is_lazy(repeated_xml_file: Path) -> None:
+    iterator = iter_xml(repeated_xml_file, tag='record')
+    assert next(iterator) == {'id': '1', 'tags': {'tags': ['a', 'b']}}
+
+
+def test_iter_xml_roundtrip_with_save_as_xml(tmp_path: Path, nested_xml_data: dict[str, Any]) -> None:
+    xml_file = tmp_path / 'nested.xml'
+    save_as_xml(nested_xml_data, xml_file)
+
+    assert dict(zip(['database', 'cache'], iter_xml(xml_file), strict=True)) == nested_xml_data['config']
+
+
+def test_save_and_load_arbitrarily_nested_xml(tmp_path: Path) -> None:
+    data = {
+        'config': {
+            'service': {
+                'database': {'primary': {'host': 'db1', 'port': '5432'}},
+                'cache': {'redis': {'options': {'ttl': '60'}}},
+            },
+        }
+    }
+    xml_file = tmp_path / 'deep.xml'
+    save_as_xml(data, xml_file)
+
+    assert load_xml(xml_file) == data
+
+
+def test_dict_to_xml_nests_dicts_inside_list_items() -> None:
+    element = _dict_to_xml('root', {'servers': [{'name': 'a', 'ports': {'http': '80'}}, 'plain']})
+
+    assert ET.tostring(element) == (
+        b'<root><servers><item><name>a</name><ports><http>80</http></ports></item><item>plain</item></servers></root>'
+    )
+
+
+def test_xml_to_dict_handles_depth_beyond_recursion_limit() -> None:
+    depth = 5000
+    document = '<n>' * depth + 'leaf' + '</n>' * depth
+    result = _xml_to_dict(ET.fromstring(document))  # noqa: S314
+
+    for _ in range(depth - 2):
+        assert isinstance(result, dict)
+        result = result['n']
+    assert result == {'n': 'leaf'}
+
+
+def test_dict_to_xml_handles_depth_beyond_recursion_limit() -> None:
+    depth = 5000
+    data: dict[str, Any] = {'leaf': 'value'}
+    for _ in range(depth):
+        data = {'n': data}
+
+    element = _dict_to_xml('root', data)
+    assert sum(1 for _ in element.iter('n')) == depth
+    assert element.find('.//leaf') is not None
+
+
+def test_save_and_load_xml_beyond_recursion_limit(tmp_path: Path) -> None:
+    depth = 1500
+    data: dict[str, Any] = {'leaf': 'value'}
+    for _ in range(depth):
+        data = {'n': data}
+    xml_file = tmp_path / 'deep.xml'
+
+    save_as_xml({'root': data}, xml_file)
+
+    assert load_xml(xml_file) == {'root': data}
+    assert loads_xml(dumps_as_xml({'root': data})) == {'root': data}
+
+
+def test_dumps_as_xml_matches_element_tree_output(nested_xml_data: dict[str, Any]) -> None:
+    data = {'root': {**nested_xml_data, 'list': ['a<b', '', {'empty': {}}, 1.5], 'text': 'x & "y"'}}
+    expected = _dict_to_xml('root', data['root'])
+    ET.indent(expected, space='  ')
+
+    assert dumps_as_xml(data) == ET.tostring(expected, encoding='utf-8', xml_declaration=True)
@@ -1,15 +1,27 @@
 import asyncio
+import contextvars
 import inspect
+import os
+import threading
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 
 from project.common.utils.async_utils import (
     AsyncResource,
+    BatchingAsyncResource,
+    async_map,
     async_to_sync_func,
     run_async_function_with_semaphore,
     sync_to_async_func,
 )
+from project.common.utils.concurrency_utils import AdaptiveLimiter
+from project.common.utils.executor_utils import NamedExecutor
+from project.common.utils.metrics_utils import InMemorySink
+from project.common.utils.rate_limit_utils import RateLimiter
+from project.common.utils.retry_utils import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 
 def test_sync_to_async_func_preserves_metadata() -> None:
@@ -47,6 +59,50 @@ async def test_sync_to_async_func_results(input_value: int, expected: int) -> No
     assert result == expected
 
 
+class TestSyncToAsyncExecutor:
+    @pytest.mark.asyncio
+    async def test_runs_on_the_given_thread_pool(self) -> None:
+        """Test that calls run on the executor's threads and see the caller's context variables."""
+        executor = NamedExecutor('offload', max_workers=1)
+        request_id: contextvars.ContextVar[str] = contextvars.ContextVar('request_id')
+        request_id.set('abc')
+
+        def describe() -> tuple[str, str]:
+            return threading.current_thread().name, request_id.get()
+
+        thread_name, seen_id = await sync_to_async_func(describe, executor=executor)()
+
+        assert thread_name.startswith('offload')
+        assert seen_id == 'abc'
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_does_not_starve_other_pools(self) -> None:
+        """Test that a saturated executor does not delay functions bound to another executor."""
+        slow_pool = NamedExecutor('slow', max_workers=1)
+        fast_pool = NamedExecutor('fast', max_workers=1)
+        release = threading.Event()
+        slow = asyncio.create_task(sync_to_async_func(release.wait, executor=slow_pool)())
+        queued = asyncio.create_task(sync_to_async_func(release.wait, executor=slow_pool)())
+        await asyncio.sleep(0.01)
+
+        assert await sync_to_async_func(sum, executor=fast_pool)([1, 2]) == 3
+        assert slow_pool.stats().queued == 1
+
+        release.set()
+        await asyncio.gather(slow, queued)
+        slow_pool.shutdown()
+        fast_pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self) -> None:
+        """Test that CPU-bound functions can be sent to a process pool."""
+        executor = NamedExecutor('cpu-bound', max_workers=1, kind='process')
+
+        assert await sync_to_async_func(os.getpid, executor=executor)() != os.getpid()
+        executor.shutdown()
+
+
 def test_async_to_sync_func_preserves_metadata() -> None:
     """Test that async_to_sync_func preserves the function name and docstring."""
 
@@ -82,6 +138,47 @@ def test_async_to_sync_func_results(input_value: int, expected: int) -> None:
     assert result == expected
 
 
+class TestAsyncToSyncPersistentLoop:
+    @staticmethod
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    def test_calls_share_one_background_loop(self) -> None:
+        """Test that every call runs on the same long-lived loop, outside the calling thread."""
+        current_loop = async_to_sync_func(self._current_loop, persistent_loop=True)
+
+        first = current_loop()
+        assert current_loop() is first
+        assert first.is_running()
+
+    def test_exceptions_propagate(self) -> None:
+        """Test that an exception raised by the coroutine reaches the synchronous caller."""
+
+        async def fail() -> None:
+            raise KeyError('missing')
+
+        with pytest.raises(KeyError, match='missing'):
+            async_to_sync_func(fail, persistent_loop=True)()
+
+    @pytest.mark.asyncio
+    async def test_callable_from_a_running_loop(self) -> None:
+        """Test that the wrapper works from code already running inside an event loop."""
+        current_loop = async_to_sync_func(self._current_loop, persistent_loop=True)
+
+        assert current_loop() is not asyncio.get_running_loop()
+
+    def test_reentrant_call_is_rejected(self) -> None:
+        """Test that blocking on the background loop from inside it raises instead of deadlocking."""
+        current_loop = async_to_sync_func(self._current_loop, persistent_loop=True)
+
+        async def reenter() -> asyncio.AbstractEventLoop:
+            return current_loop()
+
+        with pytest.raises(RuntimeError, match='from inside it'):
+            async_to_sync_func(reenter, persistent_loop=True)()
+
+
 @pytest.mark.parametrize('use_semaphore_tuple', [(True,), (False,)])
 @pytest.mark.asyncio
 async def test_run_async_function_with_semaphore(use_semaphore_tuple: tuple[bool, ...]) -> None:
@@ -166,3 +263,546 @@ class TestAsyncResource:
     async def test_abstract_call_method(self) -> None:
         """Test that AsyncResource.call is abstract and must be implemented."""
         assert inspect.isabstract(AsyncResource)
+
+
+class TestAsyncMap:
+    @staticmethod
+    async def _double_after(value: int) -> int:
+        await asyncio.sleep(0.001 * (value % 4))
+        return value * 2
+
+    @pytest.mark.parametrize('concurrency', [1, 3, 16])
+    @pytest.mark.asyncio
+    async def test_ordered_results(self, concurrency: int) -> None:
+        """Test that ordered mode yields results in input order."""
+        results = [result async for result in async_map(self._double_after, range(20), concurrency=concurrency)]
+
+        assert results == [value * 2 for value in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_unordered_results_complete(self) -> None:
+        """Test that unordered mode yields every result, fastest first."""
+
+        async def delayed(value: int) -> int:
+            await asyncio.sleep(0.02 if value == 0 else 0)
+            return value
+
+        results = [result async for result in async_map(delayed, range(5), concurrency=5, ordered=False)]
+
+        assert sorted(results) == list(range(5))
+        assert results[-1] == 0
+
+    @pytest.mark.parametrize('ordered', [True, False])
+    @pytest.mark.asyncio
+    async def test_limits_in_flight_calls(self, ordered: bool) -> None:
+        """Test that no more than ``concurrency`` calls run at once."""
+        current = 0
+        peak = 0
+
+        async def tracked(value: int) -> int:
+            nonlocal current, peak
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.001)
+            current -= 1
+            return value
+
+        results = [result async for result in async_map(tracked, range(50), concurrency=4, ordered=ordered)]
+
+        assert sorted(results) == list(range(50))
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_pulls_input_lazily(self) -> None:
+        """Test that an unbounded input is consumed only as slots free up."""
+        pulled = 0
+
+        def unbounded() -> Iterator[int]:
+            nonlocal pulled
+            while True:
+                pulled += 1
+                yield pulled
+
+        stream = async_map(self._double_after, unbounded(), concurrency=3)
+        first = [await anext(stream) for _ in range(5)]
+        await stream.aclose()
+
+        assert first == [2, 4, 6, 8, 10]
+        assert pulled <= 5 + 3
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterable(self) -> None:
+        """Test that items can come from an async iterator."""
+
+        async def source() -> AsyncIterator[int]:
+            for value in range(10):
+                await asyncio.sleep(0)
+                yield value
+
+        results = [result async for result in async_map(self._double_after, source(), concurrency=2)]
+
+        assert results == [value * 2 for value in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_in_flight_calls(self) -> None:
+        """Test that a failing call propagates and cancels the other in-flight calls."""
+        cancelled = 0
+
+        async def fail_on_first(value: int) -> int:
+            nonlocal cancelled
+            if value == 0:
+                raise RuntimeError('boom')
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return value
+
+        with pytest.raises(RuntimeError, match='boom'):
+            _ = [result async for result in async_map(fail_on_first, range(10), concurrency=4)]
+
+        assert cancelled == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_concurrency(self) -> None:
+        """Test that concurrency must be at least one."""
+        with pytest.raises(ValueError, match='concurrency must be positive'):
+            await anext(async_map(self._double_after, [1], concurrency=0))
+
+
+class VirtualClock:
+    """Clock whose time only moves when a caller sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+class TestAsyncResourceRateLimit:
+    class KeyedResource(AsyncResource[str]):
+        """Resource that rate limits per host and records call times."""
+
+        def __init__(self, clock: VirtualClock, concurrency: int, rate_limiter: RateLimiter | None) -> None:
+            super().__init__(concurrency=concurrency, rate_limiter=rate_limiter)
+            self.clock = clock
+            self.calls: list[tuple[str, float]] = []
+
+        def rate_limit_key(self, host: str, *_args: object, **_kwargs: object) -> str:
+            return host
+
+        async def call(self, host: str, *_args: object, **_kwargs: object) -> str:
+            self.calls.append((host, self.clock.now))
+            return host
+
+    @pytest.mark.asyncio
+    async def test_calls_are_rate_limited_per_key(self) -> None:
+        """Test that AsyncResource spaces calls per key according to its rate limiter."""
+        clock = VirtualClock()
+        limiter = RateLimiter(rate=2, burst=1, clock=clock, sleep=clock.sleep)
+        resource = self.KeyedResource(clock, concurrency=4, rate_limiter=limiter)
+
+        await asyncio.gather(*(resource.task('a') for _ in range(3)), resource.task('b'))
+
+        a_times = [when for host, when in resource.calls if host == 'a']
+        assert a_times == pytest.approx([0.0, 0.5, 1.0])
+        assert [host for host, _ in resource.calls][:2] == ['a', 'b']
+
+    @pytest.mark.asyncio
+    async def test_throttled_key_does_not_hold_slots(self) -> None:
+        """Test that calls waiting for tokens on one key leave the slots free for other keys."""
+        clock = VirtualClock()
+        limiter = RateLimiter(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+        resource = self.KeyedResource(clock, concurrency=2, rate_limiter=limiter)
+
+        await asyncio.gather(*(resource.task('a') for _ in range(4)), resource.task('b'))
+
+        assert [host for host, _ in resource.calls] == ['a', 'b', 'a', 'a', 'a']
+
+    @pytest.mark.asyncio
+    async def test_without_rate_limiter(self) -> None:
+        """Test that the rate limiter is optional."""
+        resource = self.KeyedResource(VirtualClock(), concurrency=1, rate_limiter=None)
+
+        assert await resource.task('a') == 'a'
+        assert resource.rate_limiter is None
+
+
+class TestAsyncResourceResilience:
+    class FlakyResource(AsyncResource[str]):
+        """Resource that raises the queued errors for a key before succeeding."""
+
+        def __init__(self, errors: dict[str, list[Exception]], **kwargs: object) -> None:
+            super().__init__(**kwargs)  # type: ignore[arg-type]
+            self.errors = errors
+            self.calls: list[str] = []
+
+        async def call(self, key: str, *_args: object, **_kwargs: object) -> str:
+            self.calls.append(key)
+            if self.errors.get(key):
+                raise self.errors[key].pop(0)
+            return key
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self) -> None:
+        """Test that task retries failed calls according to the retry policy."""
+        clock = VirtualClock()
+        resource = self.FlakyResource(
+            {'a': [OSError(), OSError()]},
+            retry=RetryPolicy(attempts=3, initial=1, jitter=0, sleep=clock.sleep),
+        )
+
+        assert await resource.task('a') == 'a'
+        assert resource.calls == ['a', 'a', 'a']
+        assert clock.now == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_hold_a_slot(self) -> None:
+        """Test that a call waiting to retry leaves its semaphore slot to other calls."""
+        backoff = asyncio.Event()
+
+        async def blocking_sleep(_seconds: float) -> None:
+            await backoff.wait()
+
+        resource = self.FlakyResource(
+            {'a': [OSError()]}, concurrency=1, retry=RetryPolicy(attempts=2, sleep=blocking_sleep)
+        )
+        retried = asyncio.create_task(resource.task('a'))
+        await asyncio.sleep(0)
+
+        assert await resource.task('b') == 'b'
+        backoff.set()
+        assert await retried == 'a'
+        assert resource.calls == ['a', 'b', 'a']
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self) -> None:
+        """Test that once the breaker opens, task raises without calling the backend or retrying."""
+        clock = VirtualClock()
+        resource = self.FlakyResource(
+            {'a': [OSError()] * 10},
+            retry=RetryPolicy(attempts=5, jitter=0, sleep=clock.sleep),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60, clock=clock),
+        )
+
+        with pytest.raises(CircuitOpenError):
+            await resource.task('a')
+        assert resource.calls == ['a', 'a']
+
+        with pytest.raises(CircuitOpenError):
+            await resource.task('b')
+        assert resource.calls == ['a', 'a']
+
+    @pytest.mark.asyncio
+    async def test_queued_calls_fail_fast_once_the_circuit_opens(self) -> None:
+        """Test that calls admitted while closed do not reach the backend after the circuit opens."""
+        resource = self.FlakyResource(
+            {'a': [OSError()]}, concurrency=1, circuit_breaker=CircuitBreaker(failure_threshold=1)
+        )
+
+        results = await asyncio.gather(*(resource.task('a') for _ in range(3)), return_exceptions=True)
+
+        assert isinstance(results[0], OSError)
+        assert all(isinstance(result, CircuitOpenError) for result in results[1:])
+        assert resource.calls == ['a']
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self) -> None:
+        """Test that a slow call is cancelled after call_timeout and counts as a breaker failure."""
+
+        class SlowResource(AsyncResource[str]):
+            async def call(self, *_args: object, **_kwargs: object) -> str:
+                await asyncio.sleep(10)
+                return 'late'
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        resource = SlowResource(call_timeout=0.01, circuit_breaker=breaker)
+
+        with pytest.raises(TimeoutError):
+            await resource.task()
+        assert breaker.state == 'open'
+
+
+class TestAsyncResourceCoalescing:
+    class CountingResource(AsyncResource[str]):
+        """Resource whose calls block until released and are counted per key."""
+
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__(concurrency=10, **kwargs)  # type: ignore[arg-type]
+            self.release = asyncio.Event()
+            self.calls: list[str] = []
+            self.error: Exception | None = None
+
+        async def call(self, key: str, *_args: object, **_kwargs: object) -> str:
+            self.calls.append(key)
+            await self.release.wait()
+            if self.error is not None:
+                raise self.error
+            return key.upper()
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_execution(self) -> None:
+        """Test that single-flight runs one call per key and hands its result to every caller."""
+        resource = self.CountingResource(single_flight=True)
+        tasks = [asyncio.create_task(resource.task(key)) for key in ('a', 'a', 'b', 'a')]
+        await asyncio.sleep(0)
+        resource.release.set()
+
+        assert await asyncio.gather(*tasks) == ['A', 'A', 'B', 'A']
+        assert sorted(resource.calls) == ['a', 'b']
+
+        assert await resource.task('a') == 'A'
+        assert sorted(resource.calls) == ['a', 'a', 'b']
+
+    @pytest.mark.asyncio
+    async def test_shared_exception(self) -> None:
+        """Test that every coalesced caller receives the exception of the shared call."""
+        resource = self.CountingResource(single_flight=True)
+        resource.error = OSError('down')
+        tasks = [asyncio.create_task(resource.task('a')) for _ in range(3)]
+        await asyncio.sleep(0)
+        resource.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, OSError) for result in results)
+        assert resource.calls == ['a']
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_the_shared_call(self) -> None:
+        """Test that the remaining callers still get the result when one caller is cancelled."""
+        resource = self.CountingResource(single_flight=True)
+        first = asyncio.create_task(resource.task('a'))
+        second = asyncio.create_task(resource.task('a'))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        resource.release.set()
+
+        assert await second == 'A'
+        assert first.cancelled()
+        assert resource.calls == ['a']
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached_for_ttl(self) -> None:
+        """Test that successful results are served from the cache until they expire."""
+        resource = self.CountingResource(cache_ttl=0.05)
+        resource.release.set()
+
+        assert await resource.task('a') == 'A'
+        assert await resource.task('a') == 'A'
+        assert resource.calls == ['a']
+
+        await asyncio.sleep(0.06)
+        assert await resource.task('a') == 'A'
+        assert resource.calls == ['a', 'a']
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_and_skips_failures(self) -> None:
+        """Test that the cache holds at most cache_maxsize results and never caches errors."""
+        resource = self.CountingResource(cache_ttl=60, cache_maxsize=2)
+        resource.release.set()
+        for key in ('a', 'b', 'c'):
+            await resource.task(key)
+        assert resource.cache is not None
+        assert len(resource.cache) == 2
+
+        resource.error = OSError('down')
+        with pytest.raises(OSError, match='down'):
+            await resource.task('d')
+        assert 'd' not in {args[0] for args, _ in resource.cache}
+
+
+class TestBatchingAsyncResource:
+    class DoublingResource(BatchingAsyncResource[int, int]):
+        """Batch backend that doubles items, fails on negative ones and records batches."""
+
+        def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+            super().__init__(**kwargs)
+            self.batches: list[list[int]] = []
+            self.errors: list[Exception] = []
+
+        async def call_batch(self, items: list[int]) -> list[int | BaseException]:
+            self.batches.append(items)
+            if self.errors:
+                raise self.errors.pop(0)
+            return [ValueError(item) if item < 0 else item * 2 for item in items]
+
+    @pytest.mark.asyncio
+    async def test_calls_are_grouped_into_batches(self) -> None:
+        """Test that concurrent calls are split into batches of at most max_batch_size."""
+        resource = self.DoublingResource(max_batch_size=4, max_wait=10)
+
+        results = await asyncio.gather(*(resource.task(i) for i in range(8)))
+
+        assert results == [i * 2 for i in range(8)]
+        assert resource.batches == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_sent_after_max_wait(self) -> None:
+        """Test that a batch that does not fill up is sent once max_wait expires."""
+        resource = self.DoublingResource(max_batch_size=100, max_wait=0.01)
+
+        assert await asyncio.gather(*(resource.task(i) for i in range(3))) == [0, 2, 4]
+        assert resource.batches == [[0, 1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_the_right_callers(self) -> None:
+        """Test that per-item errors go to their caller and batch errors to every caller."""
+        resource = self.DoublingResource(max_batch_size=3, max_wait=10)
+
+        results = await asyncio.gather(*(resource.task(i) for i in (1, -1, 2)), return_exceptions=True)
+        assert results[0] == 2
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 4
+
+        resource.errors.append(OSError('down'))
+        results = await asyncio.gather(*(resource.task(i) for i in (1, 2, 3)), return_exceptions=True)
+        assert all(isinstance(result, OSError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_retry_applies_per_batch(self) -> None:
+        """Test that a failed batch is retried as a whole."""
+        resource = self.DoublingResource(max_batch_size=2, max_wait=10, retry=RetryPolicy(attempts=2, initial=0))
+        resource.errors.append(OSError('flaky'))
+
+        assert await asyncio.gather(resource.task(1), resource.task(2)) == [2, 4]
+        assert resource.batches == [[1, 2], [1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_callers_are_left_out(self) -> None:
+        """Test that an item whose caller was cancelled before dispatch is not sent."""
+        resource = self.DoublingResource(max_batch_size=100, max_wait=0.01)
+        cancelled = asyncio.create_task(resource.task(1))
+        kept = asyncio.create_task(resource.task(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == 4
+        assert resource.batches == [[2]]
+
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch(self) -> None:
+        """Test that call_batch returning the wrong number of results fails every caller."""
+
+        class ShortResource(BatchingAsyncResource[int, int]):
+            async def call_batch(self, items: list[int]) -> Sequence[int | BaseException]:
+                return items[1:]
+
+        resource = ShortResource(max_batch_size=2, max_wait=10)
+        with pytest.raises(ValueError, match='returned 1 results for 2 items'):
+            await asyncio.gather(resource.task(1), resource.task(2))
+
+    @pytest.mark.asyncio
+    async def test_call_processes_one_item_unbatched(self) -> None:
+        """Test that call runs a single-item batch directly."""
+        resource = self.DoublingResource()
+
+        assert await resource.call(21) == 42
+        with pytest.raises(ValueError, match='-1'):
+            await resource.call(-1)
+
+    @pytest.mark.asyncio
+    async def test_task_takes_one_item(self) -> None:
+        resource = self.DoublingResource()
+        with pytest.raises(TypeError, match='exactly one positional item'):
+            await resource.task(1, 2)
+
+    @pytest.mark.parametrize('kwargs', [{'max_batch_size': 0}, {'max_wait': -1}])
+    def test_invalid_arguments(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError, match='must'):
+            self.DoublingResource(**kwargs)
+
+
+class TestAsyncResourceMetrics:
+    class SleepingResource(AsyncResource[str]):
+        """Resource whose calls sleep for the given seconds and fail on request."""
+
+        async def call(self, seconds: float, *_args: object, fail: bool = False, **_kwargs: object) -> str:
+            await asyncio.sleep(seconds)
+            if fail:
+                raise OSError('down')
+            return 'ok'
+
+    @pytest.mark.asyncio
+    async def test_wait_latency_in_flight_and_errors_are_reported(self) -> None:
+        """Test that task reports semaphore wait, call duration, in-flight calls and errors."""
+        sink = InMemorySink()
+        resource = self.SleepingResource(concurrency=1, metrics=sink)
+        labels = {'resource': 'SleepingResource'}
+
+        results = await asyncio.gather(
+            resource.task(0.02), resource.task(0.02), resource.task(0, fail=True), return_exceptions=True
+        )
+
+        assert results[:2] == ['ok', 'ok']
+        wait = sink.histogram('async_resource_semaphore_wait_seconds', labels)
+        duration = sink.histogram('async_resource_call_duration_seconds', labels)
+        assert wait is not None
+        assert duration is not None
+        assert wait.count == duration.count == 3
+        # The second and third calls queued behind the first one.
+        assert wait.sum >= 0.02 * 3
+        assert duration.sum >= 0.04
+        assert sink.counter('async_resource_errors_total', {**labels, 'error': 'OSError'}) == 1
+        assert sink.gauge('async_resource_in_flight', labels) == 0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_gauge_tracks_running_calls(self) -> None:
+        sink = InMemorySink()
+        resource = self.SleepingResource(concurrency=3, metrics=sink)
+        resource.metrics_labels = {'resource': 'custom'}
+
+        tasks = [asyncio.create_task(resource.task(0.05)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert sink.gauge('async_resource_in_flight', {'resource': 'custom'}) == 3
+
+        await asyncio.gather(*tasks)
+        assert sink.gauge('async_resource_in_flight', {'resource': 'custom'}) == 0
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_counted_as_errors(self) -> None:
+        sink = InMemorySink()
+        resource = self.SleepingResource(call_timeout=0.01, metrics=sink)
+
+        with pytest.raises(TimeoutError):
+            await resource.task(1)
+        assert (
+            sink.counter('async_resource_errors_total', {'resource': 'SleepingResource', 'error': 'TimeoutError'}) == 1
+        )
+
+
+class TestAsyncResourceAdaptiveConcurrency:
+    @pytest.mark.asyncio
+    async def test_adaptive_limiter_replaces_the_semaphore(self) -> None:
+        """Test that an AdaptiveLimiter bounds concurrency and backs off when calls fail."""
+
+        class TrackedResource(AsyncResource[None]):
+            def __init__(self, limiter: AdaptiveLimiter) -> None:
+                super().__init__(concurrency=limiter)
+                self.running = 0
+                self.peak = 0
+
+            async def call(self, *_args: object, fail: bool = False, **_kwargs: object) -> None:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+                await asyncio.sleep(0.001)
+                self.running -= 1
+                if fail:
+                    raise OSError('overloaded')
+
+        limiter = AdaptiveLimiter(initial_limit=8, max_limit=8, latency_target=1.0)
+        resource = TrackedResource(limiter)
+
+        await asyncio.gather(*(resource.task() for _ in range(40)))
+        assert resource.peak == 8
+
+        await asyncio.gather(*(resource.task(fail=True) for _ in range(8)), return_exceptions=True)
+        assert limiter.limit < 8
+        assert limiter.in_flight == 0
@@ -30,3 +30,11 @@ def test_load_cli_config_accepts_path_types(tmp_path: Path) -> None:
 
     assert load_cli_config(str(config_file)) == payload
     assert load_cli_config(config_file) == payload
+
+
+def test_load_cli_config_use_cache_applies_overrides_to_copy(tmp_path: Path) -> None:
+    config_file = tmp_path / 'config.json'
+    config_file.write_text(json.dumps({'setting': 'value'}), encoding='utf-8')
+
+    assert load_cli_config(config_file, use_cache=True, setting='override') == {'setting': 'override'}
+    assert load_cli_config(config_file, use_cache=True) == {'setting': 'value'}
@@ -0,0 +1,138 @@
+import asyncio
+import statistics
+
+import pytest
+
+from project.common.utils.concurrency_utils import AdaptiveLimiter
+
+
+class SimulatedBackend:
+    """Backend that serves ``capacity`` calls at ``base_latency`` and queues the rest.
+
+    Time is virtual: each round issues ``limit`` concurrent calls, and the
+    clock advances by the latency of that round.
+    """
+
+    def __init__(self, capacity: int, base_latency: float = 0.01) -> None:
+        self.capacity = capacity
+        self.base_latency = base_latency
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def latency(self, concurrent: int) -> float:
+        return self.base_latency * max(1.0, concurrent / self.capacity)
+
+    async def run_round(self, limiter: AdaptiveLimiter) -> int:
+        """Issue as many concurrent calls as the limiter allows; return how many ran."""
+        concurrent = limiter.limit
+        for _ in range(concurrent):
+            await limiter.acquire()
+        latency = self.latency(concurrent)
+        self.now += latency
+        for _ in range(concurrent):
+            limiter.release(latency)
+        return concurrent
+
+
+async def _limits(backend: SimulatedBackend, limiter: AdaptiveLimiter, rounds: int) -> list[int]:
+    return [await backend.run_round(limiter) for _ in range(rounds)]
+
+
+@pytest.mark.asyncio
+async def test_converges_to_backend_capacity() -> None:
+    """Test that the limit climbs from its initial value and then oscillates around the capacity."""
+    backend = SimulatedBackend(capacity=20)
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=500, tolerance=1.5, clock=backend)
+
+    limits = await _limits(backend, limiter, 400)
+
+    settled = limits[200:]
+    assert max(limits[:5]) < 5
+    assert 15 <= statistics.mean(settled) <= 35
+    assert max(settled) <= 31
+
+
+@pytest.mark.asyncio
+async def test_follows_a_capacity_drop() -> None:
+    """Test that the limit shrinks when the backend loses capacity, and grows back after."""
+    backend = SimulatedBackend(capacity=40)
+    limiter = AdaptiveLimiter(initial_limit=10, latency_target=0.015, clock=backend)
+    await _limits(backend, limiter, 300)
+    assert limiter.limit >= 30
+
+    backend.capacity = 5
+    after_drop = await _limits(backend, limiter, 200)
+    assert statistics.mean(after_drop[100:]) <= 8
+
+    backend.capacity = 40
+    recovered = await _limits(backend, limiter, 400)
+    assert statistics.mean(recovered[300:]) >= 30
+
+
+@pytest.mark.asyncio
+async def test_errors_cut_the_limit_once_per_window() -> None:
+    """Test that a burst of failures from one window backs off once, not once per failure."""
+    clock = SimulatedBackend(capacity=100)
+    limiter = AdaptiveLimiter(initial_limit=40, backoff_ratio=0.5, clock=clock)
+    for _ in range(40):
+        await limiter.acquire()
+
+    clock.now += 0.01
+    for _ in range(40):
+        limiter.release(0.01, failed=True)
+
+    assert limiter.limit == 20
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_unused_limit_does_not_grow() -> None:
+    """Test that fast calls at low utilization do not inflate the limit."""
+    clock = SimulatedBackend(capacity=100)
+    limiter = AdaptiveLimiter(initial_limit=50, clock=clock)
+
+    for _ in range(500):
+        async with limiter:
+            clock.now += 0.01
+
+    assert limiter.limit == 50
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_when_slots_free() -> None:
+    """Test that calls beyond the limit wait in FIFO order and cancelled waiters are skipped."""
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    release = asyncio.Event()
+    order: list[int] = []
+
+    async def worker(index: int) -> None:
+        async with limiter:
+            order.append(index)
+            await release.wait()
+
+    tasks = [asyncio.create_task(worker(index)) for index in range(4)]
+    await asyncio.sleep(0)
+    assert order == [0]
+    tasks[1].cancel()
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert order == [0, 2, 3]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'initial_limit': 0},
+        {'initial_limit': 5, 'max_limit': 4},
+        {'min_limit': 3, 'initial_limit': 2},
+        {'backoff_ratio': 1.0},
+        {'tolerance': 1.0},
+    ],
+)
+def test_invalid_arguments(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError, match='must'):
+        AdaptiveLimiter(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,64 @@
+import os
+import threading
+
+import pytest
+
+from project.common.utils.executor_utils import NamedExecutor, executor_stats
+
+
+def test_pool_is_created_on_first_submit() -> None:
+    """Test that declaring an executor starts no worker until it is used."""
+    executor = NamedExecutor('lazy', max_workers=1)
+    assert executor._executor is None  # noqa: SLF001
+
+    assert executor.submit(pow, 2, 10).result() == 1024
+    executor.shutdown()
+
+
+def test_stats_report_running_and_queued_calls() -> None:
+    """Test that stats split pending calls into running and queued ones."""
+    executor = NamedExecutor('stats', max_workers=2)
+    release = threading.Event()
+    futures = [executor.submit(release.wait) for _ in range(5)]
+
+    stats = executor.stats()
+    assert (stats.submitted, stats.completed, stats.running, stats.queued) == (5, 0, 2, 3)
+    assert stats.utilization == 1.0
+
+    release.set()
+    for future in futures:
+        future.result()
+    executor.shutdown()
+    stats = executor.stats()
+    assert (stats.completed, stats.running, stats.queued, stats.utilization) == (5, 0, 0, 0.0)
+
+
+def test_thread_names_carry_the_executor_name() -> None:
+    executor = NamedExecutor('db-pool', max_workers=1)
+
+    assert executor.submit(lambda: threading.current_thread().name).result().startswith('db-pool')
+    executor.shutdown()
+
+
+def test_process_pool_runs_in_another_process() -> None:
+    """Test that a process executor runs picklable functions in worker processes."""
+    executor = NamedExecutor('cpu', max_workers=1, kind='process')
+
+    assert executor.submit(os.getpid).result() != os.getpid()
+    assert executor.stats().kind == 'process'
+    executor.shutdown()
+
+
+def test_executor_stats_lists_live_executors() -> None:
+    executors = [NamedExecutor('listed-b', max_workers=1), NamedExecutor('listed-a', max_workers=3)]
+
+    listed = [(stats.name, stats.max_workers) for stats in executor_stats() if stats.name.startswith('listed-')]
+
+    assert listed == [('listed-a', 3), ('listed-b', 1)]
+    assert len(executors) == 2
+
+
+@pytest.mark.parametrize(('max_workers', 'kind'), [(0, 'thread'), (1, 'fiber')])
+def test_invalid_arguments(max_workers: int, kind: str) -> None:
+    with pytest.raises(ValueError, match='must be'):
+        NamedExecutor('invalid', max_workers, kind=kind)  # type: ignore[arg-type]
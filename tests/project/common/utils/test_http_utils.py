@@ -0,0 +1,147 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import test_utils, web
+
+from project.common.utils.http_utils import HttpClientResource
+from project.common.utils.rate_limit_utils import RateLimiter
+from project.common.utils.retry_utils import RetryPolicy
+
+
+async def _no_sleep(_seconds: float) -> None:
+    pass
+
+
+class Backend:
+    """Local HTTP server that records the client connections and concurrency it sees."""
+
+    def __init__(self) -> None:
+        self.peers: list[object] = []
+        self.active = 0
+        self.peak = 0
+        self.failures_left = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/echo', self.echo)
+        app.router.add_get('/slow', self.slow)
+        app.router.add_get('/flaky', self.flaky)
+        app.router.add_get('/stream', self.stream)
+        return app
+
+    async def echo(self, request: web.Request) -> web.Response:
+        assert request.transport is not None
+        self.peers.append(request.transport.get_extra_info('peername'))
+        return web.json_response({'query': dict(request.query)})
+
+    async def slow(self, _request: web.Request) -> web.Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return web.Response(text='done')
+
+    async def flaky(self, _request: web.Request) -> web.Response:
+        if self.failures_left:
+            self.failures_left -= 1
+            raise web.HTTPServiceUnavailable
+        return web.Response(text='recovered')
+
+    async def stream(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for index in range(5):
+            await self.gate.wait()
+            await response.write(f'chunk-{index};'.encode())
+        await response.write_eof()
+        return response
+
+
+@pytest_asyncio.fixture
+async def backend() -> AsyncIterator[tuple[Backend, test_utils.TestServer]]:
+    state = Backend()
+    server = test_utils.TestServer(state.app())
+    async with server:
+        yield state, server
+
+
+class TestHttpClientResource:
+    @pytest.mark.asyncio
+    async def test_requests_reuse_pooled_connections(self, backend: tuple[Backend, test_utils.TestServer]) -> None:
+        """Test that sequential requests share one keep-alive connection and bodies are read."""
+        state, server = backend
+        async with HttpClientResource(server.make_url('')) as client:
+            responses = [await client.request('GET', '/echo', params={'n': str(index)}) for index in range(5)]
+
+        assert [response.json() for response in responses] == [{'query': {'n': str(index)}} for index in range(5)]
+        assert all(response.status == 200 for response in responses)
+        assert len(set(state.peers)) == 1
+
+    @pytest.mark.asyncio
+    async def test_connections_are_limited_per_host(self, backend: tuple[Backend, test_utils.TestServer]) -> None:
+        """Test that limit_per_host bounds the concurrent requests one host receives."""
+        state, server = backend
+        async with HttpClientResource(server.make_url(''), limit_per_host=2) as client:
+            results = await asyncio.gather(*(client.request('GET', '/slow') for _ in range(6)))
+
+        assert [result.text() for result in results] == ['done'] * 6
+        assert state.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_body_incrementally(self, backend: tuple[Backend, test_utils.TestServer]) -> None:
+        """Test that stream returns the response before the body ends and holds its slot until exit."""
+        state, server = backend
+        state.gate.clear()
+        async with HttpClientResource(server.make_url(''), concurrency=1) as client:
+            async with client.stream('GET', '/stream') as response:
+                assert response.status == 200
+                assert client.semaphore.locked()
+                state.gate.set()
+                chunks = [chunk async for chunk in response.content.iter_any()]
+            assert not client.semaphore.locked()
+
+        assert b''.join(chunks) == b''.join(f'chunk-{index};'.encode() for index in range(5))
+
+    @pytest.mark.asyncio
+    async def test_error_statuses_are_retried(self, backend: tuple[Backend, test_utils.TestServer]) -> None:
+        """Test that 5xx responses raise ClientResponseError and go through the retry policy."""
+        state, server = backend
+        state.failures_left = 2
+        retry = RetryPolicy(attempts=3, retry_on=(aiohttp.ClientResponseError,), sleep=_no_sleep)
+        async with HttpClientResource(server.make_url(''), retry=retry) as client:
+            response = await client.request('GET', '/flaky')
+            assert response.text() == 'recovered'
+
+            state.failures_left = 3
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await client.request('GET', '/flaky')
+        assert exc_info.value.status == 503
+
+    @pytest.mark.asyncio
+    async def test_session_is_reopened_after_close(self, backend: tuple[Backend, test_utils.TestServer]) -> None:
+        """Test that the session is configured from the arguments and recreated after close."""
+        _, server = backend
+        client = HttpClientResource(server.make_url(''), limit=7, limit_per_host=3, ttl_dns_cache=60)
+        session = client.session
+        assert session.connector is not None
+        assert (session.connector.limit, session.connector.limit_per_host) == (7, 3)
+
+        await client.close()
+        assert session.closed
+        assert (await client.request('GET', '/echo')).status == 200
+        assert client.session is not session
+        await client.close()
+
+    def test_rate_limit_key_is_the_host(self) -> None:
+        client = HttpClientResource('http://api.example.com/v1/', rate_limiter=RateLimiter(rate=10))
+        assert client.rate_limit_key('GET', 'https://other.example.org/x') == 'other.example.org'
+        assert client.rate_limit_key('GET', '/items') == 'api.example.com'
+
+    def test_invalid_limits(self) -> None:
+        with pytest.raises(ValueError, match='must be positive'):
+            HttpClientResource(limit_per_host=0)
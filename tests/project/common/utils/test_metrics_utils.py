@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+
+from project.common.utils.metrics_utils import Histogram, InMemorySink, LoggingSink, PrometheusSink
+
+
+def test_histogram_buckets() -> None:
+    """Test that observations land in the first bucket whose bound is not below them."""
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1]
+    assert histogram.cumulative_counts() == [2, 3]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+
+
+def test_in_memory_sink_keeps_series_per_label_set() -> None:
+    sink = InMemorySink(buckets=(1.0,))
+
+    sink.increment('requests_total', {'host': 'a'})
+    sink.increment('requests_total', {'host': 'a'}, 2)
+    sink.increment('requests_total', {'host': 'b'})
+    sink.set_gauge('in_flight', 3, {})
+    sink.set_gauge('in_flight', 1, {})
+    sink.observe('latency_seconds', 0.5, {'host': 'a'})
+
+    assert sink.counter('requests_total', {'host': 'a'}) == 3
+    assert sink.counter('requests_total', {'host': 'b'}) == 1
+    assert sink.counter('requests_total', {'host': 'c'}) == 0
+    assert sink.gauge('in_flight', {}) == 1
+    histogram = sink.histogram('latency_seconds', {'host': 'a'})
+    assert histogram is not None
+    assert histogram.count == 1
+
+
+def test_prometheus_text_format() -> None:
+    """Test that the sink renders counters, gauges and cumulative histogram buckets."""
+    sink = PrometheusSink(buckets=(0.1, 1.0))
+    sink.increment('errors_total', {'error': 'Time"out'})
+    sink.set_gauge('in_flight', 2, {'resource': 'Api'})
+    sink.observe('latency_seconds', 0.05, {'resource': 'Api'})
+    sink.observe('latency_seconds', 0.25, {'resource': 'Api'})
+
+    assert sink.render().splitlines() == [
+        '# TYPE errors_total counter',
+        'errors_total{error="Time\\"out"} 1',
+        '# TYPE in_flight gauge',
+        'in_flight{resource="Api"} 2',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{resource="Api",le="0.1"} 1',
+        'latency_seconds_bucket{resource="Api",le="1"} 2',
+        'latency_seconds_bucket{resource="Api",le="+Inf"} 2',
+        'latency_seconds_sum{resource="Api"} 0.3',
+        'latency_seconds_count{resource="Api"} 2',
+    ]
+    assert PrometheusSink().render() == ''
+
+
+def test_logging_sink(caplog: pytest.LogCaptureFixture) -> None:
+    sink = LoggingSink(level=logging.INFO)
+
+    with caplog.at_level(logging.INFO):
+        sink.increment('errors_total', {'error': 'OSError'})
+        sink.observe('latency_seconds', 0.5, {})
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "counter errors_total{'error': 'OSError'} += 1.0",
+        'histogram latency_seconds{} observed 0.5',
+    ]
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from project.common.utils.rate_limit_utils import RateLimiter
+
+
+class VirtualClock:
+    """Clock whose time only moves when a caller sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock() -> VirtualClock:
+    return VirtualClock()
+
+
+def _limiter(clock: VirtualClock, rate: float, burst: float | None = None) -> RateLimiter:
+    return RateLimiter(rate=rate, burst=burst, clock=clock, sleep=clock.sleep)
+
+
+@pytest.mark.asyncio
+async def test_burst_is_served_without_waiting(clock: VirtualClock) -> None:
+    """Test that a full bucket serves ``burst`` calls immediately, then waits."""
+    limiter = _limiter(clock, rate=10, burst=5)
+
+    for _ in range(5):
+        await limiter.acquire()
+    assert clock.sleeps == []
+
+    await limiter.acquire()
+    assert clock.now == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize(('rate', 'calls'), [(10, 21), (2.5, 6), (100, 501)])
+@pytest.mark.asyncio
+async def test_steady_state_rate(clock: VirtualClock, rate: float, calls: int) -> None:
+    """Test that after the burst, calls are spaced at exactly ``1 / rate``."""
+    limiter = _limiter(clock, rate=rate, burst=1)
+
+    for _ in range(calls):
+        await limiter.acquire()
+
+    assert clock.now == pytest.approx((calls - 1) / rate)
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_while_idle(clock: VirtualClock) -> None:
+    """Test that idle time refills the bucket up to its capacity, but not beyond."""
+    limiter = _limiter(clock, rate=10, burst=3)
+    for _ in range(3):
+        await limiter.acquire()
+
+    clock.now += 10
+    for _ in range(3):
+        await limiter.acquire()
+    assert clock.sleeps == []
+
+    await limiter.acquire()
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+@pytest.mark.asyncio
+async def test_keys_have_independent_buckets(clock: VirtualClock) -> None:
+    """Test that exhausting one key's bucket does not delay another key."""
+    limiter = _limiter(clock, rate=1, burst=1)
+
+    await limiter.acquire('a.example.com')
+    await limiter.acquire('b.example.com')
+    assert clock.sleeps == []
+
+    await limiter.acquire('a.example.com')
+    assert clock.now == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_arrival_order(clock: VirtualClock) -> None:
+    """Test that concurrent waiters on one bucket are served first come, first served."""
+    limiter = _limiter(clock, rate=5, burst=1)
+    served: list[int] = []
+
+    async def worker(index: int) -> None:
+        await limiter.acquire()
+        served.append(index)
+
+    await asyncio.gather(*(worker(index) for index in range(10)))
+
+    assert served == list(range(10))
+    assert clock.now == pytest.approx(9 / 5)
+
+
+@pytest.mark.asyncio
+async def test_try_acquire(clock: VirtualClock) -> None:
+    """Test that try_acquire takes a token only when one is available."""
+    limiter = _limiter(clock, rate=2, burst=2)
+
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    clock.now += 0.5
+    assert limiter.try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_place(clock: VirtualClock) -> None:
+    """Test that cancelling a waiting caller lets the next caller proceed."""
+    blocker = asyncio.Event()
+
+    async def blocking_sleep(_seconds: float) -> None:
+        await blocker.wait()
+
+    limiter = RateLimiter(rate=1, burst=1, clock=clock, sleep=blocking_sleep)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    clock.now += 1
+    await limiter.acquire()
+
+
+@pytest.mark.asyncio
+async def test_idle_buckets_are_pruned(clock: VirtualClock) -> None:
+    """Test that full, idle buckets are dropped while buckets that are still refilling are kept."""
+    limiter = _limiter(clock, rate=1, burst=1)
+    for index in range(10_000):
+        await limiter.acquire(index)
+        clock.now += 0.001
+    assert len(limiter._buckets) <= 2048  # noqa: SLF001
+
+    await limiter.acquire('throttled')
+    for index in range(5_000):
+        await limiter.acquire(('late', index))
+        clock.now += 0.0001
+    assert not limiter.try_acquire('throttled')
+    clock.now += 0.6
+    assert limiter.try_acquire('throttled')
+
+
+@pytest.mark.parametrize(('rate', 'burst'), [(0, None), (-1, None), (10, 0.5)])
+def test_invalid_arguments(rate: float, burst: float | None) -> None:
+    with pytest.raises(ValueError, match='must be'):
+        RateLimiter(rate=rate, burst=burst)
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from project.common.utils.retry_utils import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class VirtualClock:
+    """Clock whose time only moves when a caller sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock() -> VirtualClock:
+    return VirtualClock()
+
+
+async def _run(policy: RetryPolicy, outcomes: list[BaseException | str]) -> tuple[str, int]:
+    """Run a call that consumes ``outcomes`` under ``policy``; return its result and the attempt count."""
+    calls = 0
+    async for attempt in policy.retrying():
+        with attempt:
+            outcome = outcomes[calls]
+            calls += 1
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome, calls
+    raise AssertionError
+
+
+class TestRetryPolicy:
+    @pytest.mark.asyncio
+    async def test_retries_with_exponential_backoff(self, clock: VirtualClock) -> None:
+        """Test that transient failures are retried with waits growing by ``multiplier``."""
+        policy = RetryPolicy(attempts=4, initial=0.5, multiplier=3, jitter=0, sleep=clock.sleep)
+
+        result = await _run(policy, [OSError(), OSError(), OSError(), 'ok'])
+
+        assert result == ('ok', 4)
+        assert clock.sleeps == pytest.approx([0.5, 1.5, 4.5])
+
+    @pytest.mark.asyncio
+    async def test_waits_are_capped_and_jittered(self, clock: VirtualClock) -> None:
+        """Test that waits never exceed ``maximum + jitter`` and are not all identical."""
+        policy = RetryPolicy(attempts=30, initial=1, maximum=2, jitter=1, sleep=clock.sleep)
+
+        await _run(policy, [*(OSError() for _ in range(29)), 'ok'])
+
+        assert all(1 <= wait <= 3 for wait in clock.sleeps)
+        assert len(set(clock.sleeps[2:])) > 1
+
+    @pytest.mark.asyncio
+    async def test_last_error_is_reraised(self, clock: VirtualClock) -> None:
+        """Test that the original exception propagates once the attempts run out."""
+        policy = RetryPolicy(attempts=2, jitter=0, sleep=clock.sleep)
+
+        with pytest.raises(OSError, match='second'):
+            await _run(policy, [OSError('first'), OSError('second'), 'ok'])
+
+    @pytest.mark.parametrize('error', [ValueError('bad input'), CircuitOpenError('open')])
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_propagate_at_once(self, clock: VirtualClock, error: Exception) -> None:
+        """Test that errors outside ``retry_on`` and open circuits are not retried."""
+        policy = RetryPolicy(attempts=5, retry_on=(OSError, RuntimeError), sleep=clock.sleep)
+
+        with pytest.raises(type(error)):
+            await _run(policy, [error, 'ok'])
+        assert clock.sleeps == []
+
+    @pytest.mark.parametrize('kwargs', [{'attempts': 0}, {'initial': -1}, {'jitter': -0.1}])
+    def test_invalid_arguments(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError, match='must'):
+            RetryPolicy(**kwargs)  # type: ignore[arg-type]
+
+
+class TestCircuitBreaker:
+    @staticmethod
+    def _fail(breaker: CircuitBreaker, error: Exception | None = None) -> None:
+        with pytest.raises(type(error) if error else OSError), breaker.guard():
+            raise error or OSError
+
+    def test_opens_after_consecutive_failures(self, clock: VirtualClock) -> None:
+        """Test that the circuit opens on the threshold-th consecutive failure and then fails fast."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+
+        self._fail(breaker)
+        self._fail(breaker)
+        with breaker.guard():
+            pass
+        self._fail(breaker)
+        self._fail(breaker)
+        assert breaker.state == 'closed'
+
+        self._fail(breaker)
+        assert breaker.state == 'open'
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        with pytest.raises(CircuitOpenError), breaker.guard():
+            pytest.fail('an open circuit must not admit calls')
+
+    def test_half_open_trial_closes_or_reopens(self, clock: VirtualClock) -> None:
+        """Test that one trial call is admitted after the timeout and decides the next state."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        self._fail(breaker)
+
+        clock.now += 10
+        assert breaker.state == 'half_open'
+        self._fail(breaker)
+        assert breaker.state == 'open'
+
+        clock.now += 10
+        with breaker.guard(), pytest.raises(CircuitOpenError):
+            breaker.check()
+        assert breaker.state == 'closed'
+
+    def test_cancelled_trial_frees_the_slot(self, clock: VirtualClock) -> None:
+        """Test that a cancelled trial call lets the next call try again."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, clock=clock)
+        self._fail(breaker)
+        clock.now += 1
+
+        with pytest.raises(asyncio.CancelledError), breaker.guard():
+            raise asyncio.CancelledError
+
+        assert breaker.state == 'half_open'
+        breaker.check()
+
+    def test_only_failure_types_count(self, clock: VirtualClock) -> None:
+        """Test that exceptions outside ``failure_types`` do not trip the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, failure_types=(OSError,), clock=clock)
+
+        self._fail(breaker, ValueError('bad input'))
+        assert breaker.state == 'closed'
+
+        self._fail(breaker, ConnectionError('refused'))
+        assert breaker.state == 'open'
+
+    @pytest.mark.parametrize(('threshold', 'timeout'), [(0, 1), (1, -1)])
+    def test_invalid_arguments(self, threshold: int, timeout: float) -> None:
+        with pytest.raises(ValueError, match='must'):
+            CircuitBreaker(failure_threshold=threshold, recovery_timeout=timeout)